@@ -2,7 +2,7 @@
 import asyncio
 from collections import OrderedDict
 from datetime import timedelta
-from typing import Any, Dict, List, Optional, Tuple, cast
+from typing import Any, Dict, Iterable, List, Optional, Tuple, cast
 
 import jwt
 
@@ -19,6 +19,9 @@ from .providers import AuthProvider, LoginFlow, auth_provider_from_config
 EVENT_USER_ADDED = "user_added"
 EVENT_USER_REMOVED = "user_removed"
 
+# Maximum number of verified access tokens to remember
+ACCESS_TOKEN_CACHE_SIZE = 1024
+
 _MfaModuleDict = Dict[str, MultiFactorAuthModule]
 _ProviderKey = Tuple[str, Optional[str]]
 _ProviderDict = Dict[_ProviderKey, AuthProvider]
@@ -144,6 +147,11 @@ class AuthManager:
         self._providers = providers
         self._mfa_modules = mfa_modules
         self.login_flow = AuthManagerFlowManager(hass, self)
+        # Access token -> refresh token and expiration of verified access
+        # tokens, least recently used first
+        self._access_token_cache: "OrderedDict[str, Tuple[models.RefreshToken, float]]" = (
+            OrderedDict()
+        )
 
     @property
     def auth_providers(self) -> List[AuthProvider]:
@@ -276,6 +284,7 @@ class AuthManager:
         if tasks:
             await asyncio.wait(tasks)
 
+        self._async_invalidate_access_tokens(user.refresh_tokens)
         await self._store.async_remove_user(user)
 
         self.hass.bus.async_fire(EVENT_USER_REMOVED, {"user_id": user.id})
@@ -310,6 +319,7 @@ class AuthManager:
         if user.is_owner:
             raise ValueError("Unable to deactivate the owner")
         await self._store.async_deactivate_user(user)
+        self._async_invalidate_access_tokens(user.refresh_tokens)
 
     async def async_remove_credentials(self, credentials: models.Credentials) -> None:
         """Remove credentials."""
@@ -317,7 +327,7 @@ class AuthManager:
 
         if provider is not None and hasattr(provider, "async_will_remove_credentials"):
             # https://github.com/python/mypy/issues/1424
-            await provider.async_will_remove_credentials(credentials)  # type: ignore
+            await provider.async_will_remove_credentials(credentials)
 
         await self._store.async_remove_credentials(credentials)
 
@@ -434,6 +444,7 @@ class AuthManager:
     ) -> None:
         """Delete a refresh token."""
         await self._store.async_remove_refresh_token(refresh_token)
+        self._async_invalidate_access_tokens([refresh_token.id])
 
     @callback
     def async_create_access_token(
@@ -457,6 +468,14 @@ class AuthManager:
         self, token: str
     ) -> Optional[models.RefreshToken]:
         """Return refresh token if an access token is valid."""
+        cached = self._access_token_cache.get(token)
+        if cached is not None:
+            refresh_token, expire = cached
+            if expire > dt_util.utcnow().timestamp() and refresh_token.user.is_active:
+                self._access_token_cache.move_to_end(token)
+                return refresh_token
+            del self._access_token_cache[token]
+
         try:
             unverif_claims = jwt.decode(token, verify=False)
         except jwt.InvalidTokenError:
@@ -474,15 +493,30 @@ class AuthManager:
             issuer = refresh_token.id
 
         try:
-            jwt.decode(token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"])
+            claims = jwt.decode(
+                token, jwt_key, leeway=10, issuer=issuer, algorithms=["HS256"]
+            )
         except jwt.InvalidTokenError:
             return None
 
         if refresh_token is None or not refresh_token.user.is_active:
             return None
 
+        if "exp" in claims:
+            self._access_token_cache[token] = (refresh_token, claims["exp"])
+            if len(self._access_token_cache) > ACCESS_TOKEN_CACHE_SIZE:
+                self._access_token_cache.popitem(last=False)
+
         return refresh_token
 
+    @callback
+    def _async_invalidate_access_tokens(self, refresh_token_ids: Iterable[str]) -> None:
+        """Forget the verified access tokens of refresh tokens."""
+        refresh_token_ids = set(refresh_token_ids)
+        for token, (refresh_token, _) in list(self._access_token_cache.items()):
+            if refresh_token.id in refresh_token_ids:
+                del self._access_token_cache[token]
+
     @callback
     def _async_get_auth_provider(
         self, credentials: models.Credentials
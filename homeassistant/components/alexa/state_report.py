@@ -2,11 +2,13 @@
 import asyncio
 import json
 import logging
+import time
 
 import aiohttp
 import async_timeout
 
 from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
+from homeassistant.core import callback
 import homeassistant.util.dt as dt_util
 
 from .const import API_CHANGE, Cause
@@ -15,21 +17,89 @@ from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Maximum number of ChangeReports sent to Alexa at the same time
+MAX_PENDING_REPORTS = 4
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
     """Enable the proactive mode.
 
     Proactive mode makes this component report state changes to Alexa.
+
+    State changes are queued per entity, so only the latest properties of an
+    entity are reported when it changes faster than reports are sent. Reports
+    whose properties equal the last sent properties are skipped and at most
+    MAX_PENDING_REPORTS are in flight at the same time.
     """
     # Validate we can get access token.
     await smart_home_config.async_get_access_token()
 
+    # Last sent properties per entity, without the sample time
+    sent_properties = {}
+    # Queued reports per entity: (entity, properties, time of state change)
+    queued = {}
+    report_semaphore = asyncio.Semaphore(MAX_PENDING_REPORTS)
+    send_task = None
+
+    async def async_send_report(entity_id, alexa_entity, properties, changed):
+        """Send a queued ChangeReport."""
+        async with report_semaphore:
+            await async_send_changereport_message(
+                hass, smart_home_config, alexa_entity, alexa_properties=properties
+            )
+        _LOGGER.debug(
+            "Reported %s to Alexa %.3f seconds after the change",
+            entity_id,
+            time.monotonic() - changed,
+        )
+
+    async def async_send_queued():
+        """Send queued reports until the queue is empty."""
+        nonlocal send_task
+
+        try:
+            while queued:
+                reports = list(queued.items())
+                queued.clear()
+                _LOGGER.debug("Sending %d queued ChangeReports", len(reports))
+                await asyncio.gather(
+                    *(
+                        async_send_report(entity_id, *report)
+                        for entity_id, report in reports
+                    )
+                )
+        finally:
+            send_task = None
+
+    @callback
+    def async_queue_report(alexa_entity):
+        """Queue a ChangeReport unless the properties did not change."""
+        nonlocal send_task
+
+        entity_id = alexa_entity.entity_id
+        properties = list(alexa_entity.serialize_properties())
+        compare = [
+            {key: value for key, value in prop.items() if key != "timeOfSample"}
+            for prop in properties
+        ]
+
+        # Compared against the latest queued properties if a report is queued
+        if sent_properties.get(entity_id) == compare:
+            return
+
+        sent_properties[entity_id] = compare
+        queued[entity_id] = (alexa_entity, properties, time.monotonic())
+
+        if send_task is None:
+            send_task = hass.async_create_task(async_send_queued())
+
     async def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
         if not new_state:
+            sent_properties.pop(changed_entity, None)
+            queued.pop(changed_entity, None)
             return
 
         if new_state.domain not in ENTITY_ADAPTERS:
@@ -45,9 +115,7 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
         for interface in alexa_changed_entity.interfaces():
             if interface.properties_proactively_reported():
-                await async_send_changereport_message(
-                    hass, smart_home_config, alexa_changed_entity
-                )
+                async_queue_report(alexa_changed_entity)
                 return
             if (
                 interface.name() == "Alexa.DoorbellEventSource"
@@ -64,10 +132,12 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
 
 async def async_send_changereport_message(
-    hass, config, alexa_entity, *, invalidate_access_token=True
+    hass, config, alexa_entity, *, invalidate_access_token=True, alexa_properties=None
 ):
     """Send a ChangeReport message for an Alexa entity.
 
+    The properties are serialized from the entity unless they are passed in.
+
     https://developer.amazon.com/docs/smarthome/state-reporting-for-a-smart-home-skill.html#report-state-with-changereport-events
     """
     token = await config.async_get_access_token()
@@ -79,10 +149,14 @@ async def async_send_changereport_message(
     # this sends all the properties of the Alexa Entity, whether they have
     # changed or not. this should be improved, and properties that have not
     # changed should be moved to the 'context' object
-    properties = list(alexa_entity.serialize_properties())
+    if alexa_properties is None:
+        alexa_properties = list(alexa_entity.serialize_properties())
 
     payload = {
-        API_CHANGE: {"cause": {"type": Cause.APP_INTERACTION}, "properties": properties}
+        API_CHANGE: {
+            "cause": {"type": Cause.APP_INTERACTION},
+            "properties": alexa_properties,
+        }
     }
 
     message = AlexaResponse(name="ChangeReport", namespace="Alexa", payload=payload)
@@ -120,7 +194,11 @@ async def async_send_changereport_message(
     ):
         config.async_invalidate_access_token()
         return await async_send_changereport_message(
-            hass, config, alexa_entity, invalidate_access_token=False
+            hass,
+            config,
+            alexa_entity,
+            invalidate_access_token=False,
+            alexa_properties=alexa_properties,
         )
 
     _LOGGER.error(
@@ -1,6 +1,18 @@
 """Allow to set up simple automation rules via the config file."""
 import logging
-from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Union, cast
+import time
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import voluptuous as vol
 from voluptuous.humanize import humanize_error
@@ -36,6 +48,7 @@ from homeassistant.helpers import condition, extract_domain_configs, template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import async_get_reference_index
 from homeassistant.helpers.restore_state import RestoreEntity
 from homeassistant.helpers.script import (
     ATTR_CUR,
@@ -100,16 +113,7 @@ def is_on(hass, entity_id):
 @callback
 def automations_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all automations that reference the entity."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if entity_id in automation_entity.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_items_with_entity(entity_id)
 
 
 @callback
@@ -131,16 +135,7 @@ def entities_in_automation(hass: HomeAssistant, entity_id: str) -> List[str]:
 @callback
 def automations_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all automations that reference the device."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        automation_entity.entity_id
-        for automation_entity in component.entities
-        if device_id in automation_entity.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_items_with_device(device_id)
 
 
 @callback
@@ -194,13 +189,15 @@ async def async_setup(hass, config):
     )
 
     async def reload_service_handler(service_call):
-        """Remove all automations and load new ones from config."""
-        conf = await component.async_prepare_reload()
+        """Reload the automations whose configuration changed."""
+        start = time.monotonic()
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
         async_get_blueprints(hass).async_reset_cache()
         await _async_process_config(hass, conf, component)
         hass.bus.async_fire(EVENT_AUTOMATION_RELOADED, context=service_call.context)
+        LOGGER.debug("Reloaded automations in %.3f seconds", time.monotonic() - start)
 
     async_register_admin_service(
         hass, DOMAIN, SERVICE_RELOAD, reload_service_handler, schema=vol.Schema({})
@@ -221,9 +218,12 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         action_script,
         initial_state,
         variables,
+        raw_config=None,
     ):
         """Initialize an automation entity."""
         self._id = automation_id
+        # The validated configuration, to find unchanged automations on reload
+        self.raw_config = raw_config
         self._name = name
         self._trigger_config = trigger_config
         self._async_detach_triggers = None
@@ -312,6 +312,10 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
         """Startup with initial state or previous state."""
         await super().async_added_to_hass()
 
+        async_get_reference_index(self.hass, DOMAIN).async_set(
+            self.entity_id, self.referenced_entities, self.referenced_devices
+        )
+
         self._logger = logging.getLogger(
             f"{__name__}.{split_entity_id(self.entity_id)[1]}"
         )
@@ -410,6 +414,7 @@ class AutomationEntity(ToggleEntity, RestoreEntity):
     async def async_will_remove_from_hass(self):
         """Remove listeners when removing automation from Home Assistant."""
         await super().async_will_remove_from_hass()
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.async_disable()
 
     async def async_enable(self):
@@ -491,11 +496,22 @@ async def _async_process_config(
 ) -> bool:
     """Process config and add automations.
 
+    Automations of which the id, name and configuration did not change are
+    kept running, the other existing automations are removed.
+
     Returns if blueprints were used.
     """
     entities = []
     blueprints_used = False
 
+    existing: Dict[Tuple[Optional[str], str], List[AutomationEntity]] = {}
+    for entity in component.entities:
+        automation = cast(AutomationEntity, entity)
+        existing.setdefault((automation.unique_id, automation.name), []).append(
+            automation
+        )
+    unchanged = 0
+
     for config_key in extract_domain_configs(config, DOMAIN):
         conf: List[Union[Dict[str, Any], blueprint.BlueprintInputs]] = config[  # type: ignore
             config_key
@@ -527,6 +543,26 @@ async def _async_process_config(
 
             initial_state = config_block.get(CONF_INITIAL_STATE)
 
+            # Templates of running automations have hass attached, which
+            # is part of their equality
+            template.attach(hass, config_block)
+            if CONF_VARIABLES in config_block:
+                template.attach(hass, config_block[CONF_VARIABLES].variables)
+            candidates = existing.get((automation_id, name), [])
+            kept = next(
+                (
+                    index
+                    for index, automation in enumerate(candidates)
+                    if automation.raw_config == config_block
+                ),
+                None,
+            )
+            if kept is not None:
+                # Existing automations left over are removed
+                del candidates[kept]
+                unchanged += 1
+                continue
+
             action_script = Script(
                 hass,
                 config_block[CONF_ACTION],
@@ -558,10 +594,24 @@ async def _async_process_config(
                 action_script,
                 initial_state,
                 config_block.get(CONF_VARIABLES),
+                config_block,
             )
 
             entities.append(entity)
 
+    removed = [
+        automation for automations in existing.values() for automation in automations
+    ]
+    for automation in removed:
+        await component.async_remove_entity(automation.entity_id)
+
+    LOGGER.debug(
+        "Processed automations: %d unchanged, %d added, %d removed",
+        unchanged,
+        len(entities),
+        len(removed),
+    )
+
     if entities:
         await component.async_add_entities(entities)
 
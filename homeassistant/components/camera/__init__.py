@@ -54,6 +54,7 @@ from homeassistant.helpers.network import get_url
 from homeassistant.loader import bind_hass
 
 from .const import DATA_CAMERA_PREFS, DOMAIN
+from .frame_broker import FrameBroker
 from .prefs import CameraPreferences
 
 # mypy: allow-untyped-calls, allow-untyped-defs
@@ -150,13 +151,21 @@ async def async_request_stream(hass, entity_id, fmt):
 
 
 @bind_hass
-async def async_get_image(hass, entity_id, timeout=10):
-    """Fetch an image from a camera entity."""
+async def async_get_image(hass, entity_id, timeout=10, max_age=None):
+    """Fetch an image from a camera entity.
+
+    With a max_age, an image fetched for another viewer at most max_age
+    seconds ago is returned instead of fetching a new one.
+    """
     camera = _get_camera_from_entity_id(hass, entity_id)
 
     with suppress(asyncio.CancelledError, asyncio.TimeoutError):
         async with async_timeout.timeout(timeout):
-            image = await camera.async_camera_image()
+            if max_age is None:
+                image = await camera.async_camera_image()
+            else:
+                frame = await camera.frame_broker.async_get_frame(max_age)
+                image = frame.content if frame else None
 
             if image:
                 return Image(camera.content_type, image)
@@ -180,11 +189,21 @@ async def async_get_mjpeg_stream(hass, request, entity_id):
     return await camera.handle_async_mjpeg_stream(request)
 
 
-async def async_get_still_stream(request, image_cb, content_type, interval):
+async def async_get_still_stream(
+    request, image_cb, content_type, interval, frame_broker=None
+):
     """Generate an HTTP MJPEG stream from camera images.
 
+    Frames are taken from the frame broker, which shares them between all
+    streams of a camera. Without a broker, images are fetched for this stream.
+
     This method must be run in the event loop.
     """
+    if frame_broker is None:
+        frame_broker = FrameBroker(image_cb)
+    # Frames fetched for other viewers are good enough if they are recent
+    max_age = min(interval, MIN_STREAM_INTERVAL)
+
     response = web.StreamResponse()
     response.content_type = CONTENT_TYPE_MULTIPART.format("--frameboundary")
     await response.prepare(request)
@@ -202,21 +221,21 @@ async def async_get_still_stream(request, image_cb, content_type, interval):
             + b"\r\n"
         )
 
-    last_image = None
+    last_sequence = None
 
     while True:
-        img_bytes = await image_cb()
-        if not img_bytes:
+        frame = await frame_broker.async_get_frame(max_age)
+        if frame is None:
             break
 
-        if img_bytes != last_image:
-            await write_to_mjpeg_stream(img_bytes)
+        if frame.sequence != last_sequence:
+            await write_to_mjpeg_stream(frame.content)
 
             # Chrome seems to always ignore first picture,
             # print it twice.
-            if last_image is None:
-                await write_to_mjpeg_stream(img_bytes)
-            last_image = img_bytes
+            if last_sequence is None:
+                await write_to_mjpeg_stream(frame.content)
+            last_sequence = frame.sequence
 
         await asyncio.sleep(interval)
 
@@ -327,6 +346,8 @@ async def async_unload_entry(hass, entry):
 class Camera(Entity):
     """The base class for camera entities."""
 
+    _frame_broker = None
+
     def __init__(self):
         """Initialize a camera."""
         self.is_streaming = False
@@ -375,6 +396,24 @@ class Camera(Entity):
         """Return the interval between frames of the mjpeg stream."""
         return 0.5
 
+    @property
+    def frame_max_age(self):
+        """Return the maximum age in seconds of a shared frame for the image view.
+
+        By default only requests made while an image is fetched share it.
+        """
+        return 0
+
+    @property
+    def frame_broker(self):
+        """Return the broker sharing camera images between viewers."""
+        if self._frame_broker is None:
+            # Look the method up on every fetch so it can still be replaced
+            self._frame_broker = FrameBroker(
+                lambda: self.async_camera_image()  # pylint: disable=unnecessary-lambda
+            )
+        return self._frame_broker
+
     async def stream_source(self):
         """Return the source of the stream."""
         return None
@@ -390,7 +429,11 @@ class Camera(Entity):
     async def handle_async_still_stream(self, request, interval):
         """Generate an HTTP MJPEG stream from camera images."""
         return await async_get_still_stream(
-            request, self.async_camera_image, self.content_type, interval
+            request,
+            self.async_camera_image,
+            self.content_type,
+            interval,
+            self.frame_broker,
         )
 
     async def handle_async_mjpeg_stream(self, request):
@@ -516,10 +559,12 @@ class CameraImageView(CameraView):
         """Serve camera image."""
         with suppress(asyncio.CancelledError, asyncio.TimeoutError):
             async with async_timeout.timeout(10):
-                image = await camera.async_camera_image()
+                frame = await camera.frame_broker.async_get_frame(camera.frame_max_age)
 
-            if image:
-                return web.Response(body=image, content_type=camera.content_type)
+            if frame:
+                return web.Response(
+                    body=frame.content, content_type=camera.content_type
+                )
 
         raise web.HTTPInternalServerError()
 
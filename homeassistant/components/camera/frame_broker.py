@@ -0,0 +1,61 @@
+"""Share camera frames between all viewers of a camera."""
+import asyncio
+import time
+from typing import Awaitable, Callable, Optional
+
+import attr
+
+
+@attr.s(slots=True, frozen=True)
+class Frame:
+    """Represent a frame fetched from a camera."""
+
+    content: bytes = attr.ib()
+    # Monotonic time the frame was fetched at
+    timestamp: float = attr.ib()
+    # Increases when the content differs from the previous frame
+    sequence: int = attr.ib()
+
+
+class FrameBroker:
+    """Fetch frames of a camera once and share them between viewers.
+
+    Viewers ask for a frame no older than a maximum age. A recent enough frame
+    is returned as is, otherwise a single fetch is shared by all viewers that
+    ask while it runs. Viewers always get the latest frame, so slow viewers
+    skip frames instead of queueing them.
+    """
+
+    def __init__(self, image_cb: Callable[[], Awaitable[Optional[bytes]]]) -> None:
+        """Initialize the frame broker."""
+        self._image_cb = image_cb
+        self._frame: Optional[Frame] = None
+        self._fetch: Optional[asyncio.Future] = None
+        self._sequence = 0
+
+    async def async_get_frame(self, max_age: float) -> Optional[Frame]:
+        """Return a frame fetched at most max_age seconds ago."""
+        frame = self._frame
+        if frame is not None and time.monotonic() - frame.timestamp <= max_age:
+            return frame
+
+        if self._fetch is None:
+            self._fetch = asyncio.ensure_future(self._async_fetch())
+
+        # A viewer that goes away must not cancel the fetch of the others
+        return await asyncio.shield(self._fetch)
+
+    async def _async_fetch(self) -> Optional[Frame]:
+        """Fetch a new frame from the camera."""
+        try:
+            content = await self._image_cb()
+        finally:
+            self._fetch = None
+
+        if not content:
+            return None
+
+        if self._frame is None or content != self._frame.content:
+            self._sequence += 1
+        self._frame = Frame(content, time.monotonic(), self._sequence)
+        return self._frame
@@ -19,7 +19,9 @@ async def async_setup(hass):
 
     async def hook(action, config_key):
         """post_write_hook for Config View that reloads automations."""
-        await hass.services.async_call(DOMAIN, SERVICE_RELOAD)
+        # Wait for the reload to remove a deleted automation before its entity
+        # registry entry is removed
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
 
         if action != ACTION_DELETE:
             return
@@ -1,8 +1,8 @@
 """Allows the creation of a sensor that filters state property."""
+import asyncio
 from collections import Counter, deque
 from copy import copy
 from datetime import timedelta
-from functools import partial
 import logging
 from numbers import Number
 import statistics
@@ -10,8 +10,8 @@ from typing import Optional
 
 import voluptuous as vol
 
-from homeassistant.components import history
 from homeassistant.components.binary_sensor import DOMAIN as BINARY_SENSOR_DOMAIN
+from homeassistant.components.recorder.preload import async_load_recorded_states
 from homeassistant.components.sensor import (
     DEVICE_CLASSES as SENSOR_DEVICE_CLASSES,
     DOMAIN as SENSOR_DOMAIN,
@@ -33,7 +33,6 @@ from homeassistant.helpers.entity import Entity
 from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util.decorator import Registry
-import homeassistant.util.dt as dt_util
 
 from . import DOMAIN, PLATFORMS
 
@@ -245,6 +244,7 @@ class SensorFilter(Entity):
 
         if "recorder" in self.hass.config.components:
             history_list = []
+            seen_updates = set()
             largest_window_items = 0
             largest_window_time = timedelta(0)
 
@@ -261,36 +261,38 @@ class SensorFilter(Entity):
                 ):
                     largest_window_time = filt.window_size
 
-            # Retrieve the largest window_size of each type
+            # Retrieve the largest window_size of each type, both requests
+            # are loaded with the same query
+            requests = []
             if largest_window_items > 0:
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.get_last_state_changes,
+                requests.append(
+                    async_load_recorded_states(
                         self.hass,
-                        largest_window_items,
-                        entity_id=self._entity,
+                        self._entity,
+                        sample_size=largest_window_items,
+                        changes_only=True,
+                        attributes=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(filter_history[self._entity])
             if largest_window_time > timedelta(seconds=0):
-                start = dt_util.utcnow() - largest_window_time
-                filter_history = await self.hass.async_add_executor_job(
-                    partial(
-                        history.state_changes_during_period,
+                requests.append(
+                    async_load_recorded_states(
                         self.hass,
-                        start,
-                        entity_id=self._entity,
+                        self._entity,
+                        max_age=largest_window_time,
+                        changes_only=True,
+                        attributes=True,
                     )
                 )
-                if self._entity in filter_history:
-                    history_list.extend(
-                        [
-                            state
-                            for state in filter_history[self._entity]
-                            if state not in history_list
-                        ]
-                    )
+            for filter_history in await asyncio.gather(*requests):
+                history_list.extend(
+                    [
+                        state
+                        for state in filter_history
+                        if state.last_updated not in seen_updates
+                    ]
+                )
+                seen_updates.update(state.last_updated for state in filter_history)
 
             # Sort the window states
             history_list = sorted(history_list, key=lambda s: s.last_updated)
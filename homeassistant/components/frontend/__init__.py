@@ -18,7 +18,7 @@ from homeassistant.const import CONF_NAME, EVENT_THEMES_UPDATED
 from homeassistant.core import callback
 from homeassistant.helpers import service
 import homeassistant.helpers.config_validation as cv
-from homeassistant.helpers.translation import async_get_translations
+from homeassistant.helpers.translation import async_get_translations_json
 from homeassistant.loader import async_get_integration, bind_hass
 
 from .storage import async_setup_frontend_storage
@@ -592,16 +592,14 @@ def websocket_get_themes(hass, connection, msg):
 @websocket_api.async_response
 async def websocket_get_translations(hass, connection, msg):
     """Handle get translations command."""
-    resources = await async_get_translations(
+    resources = await async_get_translations_json(
         hass,
         msg["language"],
         msg["category"],
         msg.get("integration"),
         msg.get("config_flow"),
     )
-    connection.send_message(
-        websocket_api.result_message(msg["id"], {"resources": resources})
-    )
+    connection.send_message(websocket_api.result_message_json(msg["id"], resources))
 
 
 @websocket_api.websocket_command({"type": "frontend/get_version"})
@@ -74,6 +74,9 @@ class AbstractConfig(ABC):
         self._store = None
         self._google_sync_unsub = {}
         self._local_sdk_active = False
+        # Number of report state requests sent and state changes not reported
+        self.report_state_sent = 0
+        self.report_state_suppressed = 0
 
     async def async_initialize(self):
         """Perform async initialization of config."""
@@ -12,22 +12,53 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes before they are reported in a single request
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
 
 @callback
 def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig):
-    """Enable state reporting."""
-
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
-        if not hass.is_running:
+    """Enable state reporting.
+
+    State changes are collected for REPORT_STATE_WINDOW seconds and reported
+    in a single request. Only the latest state of an entity is reported, and
+    only if it differs from what was last reported to Google.
+    """
+    # Last reported serialized state per entity
+    reported = {}
+    # Serialized states waiting to be reported
+    pending = {}
+    unsub_report_later = None
+
+    async def report_pending(_now):
+        """Report the collected states."""
+        nonlocal unsub_report_later
+        unsub_report_later = None
+
+        if not pending:
             return
 
-        if not new_state:
+        states = dict(pending)
+        pending.clear()
+        reported.update(states)
+        google_config.report_state_sent += 1
+        _LOGGER.debug("Reporting state for %s", states)
+
+        await google_config.async_report_state_all({"devices": {"states": states}})
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
+        nonlocal unsub_report_later
+
+        if not hass.is_running:
             return
 
-        if not google_config.should_expose(new_state):
+        if not new_state or not google_config.should_expose(new_state):
+            reported.pop(changed_entity, None)
+            pending.pop(changed_entity, None)
             return
 
         entity = GoogleEntity(hass, google_config, new_state)
@@ -41,27 +72,26 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
             _LOGGER.debug("Not reporting state for %s: %s", changed_entity, err.code)
             return
 
-        if old_state:
-            old_entity = GoogleEntity(hass, google_config, old_state)
+        # Only report to Google if data that Google cares about has changed
+        if entity_data == reported.get(changed_entity):
+            if pending.pop(changed_entity, None) is not None:
+                google_config.report_state_suppressed += 1
+            return
 
-            # Only report to Google if data that Google cares about has changed
-            try:
-                if entity_data == old_entity.query_serialize():
-                    return
-            except SmartHomeError:
-                # Happens if old state could not be serialized.
-                # In that case the data is different and should be
-                # reported.
-                pass
+        if changed_entity in pending:
+            google_config.report_state_suppressed += 1
 
-        _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
+        pending[changed_entity] = entity_data
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        if unsub_report_later is None:
+            unsub_report_later = async_call_later(
+                hass, REPORT_STATE_WINDOW, report_pending
+            )
 
     async def inital_report(_now):
         """Report initially all states."""
+        nonlocal unsub_initial_report
+        unsub_initial_report = None
         entities = {}
 
         for entity in async_get_entities(hass, google_config):
@@ -76,10 +106,23 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
         if not entities:
             return
 
-        await google_config.async_report_state_all({"devices": {"states": entities}})
+        reported.update(entities)
+        google_config.report_state_sent += 1
 
-    async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+        await google_config.async_report_state_all({"devices": {"states": entities}})
 
-    return hass.helpers.event.async_track_state_change(
+    unsub_initial_report = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
+    unsub_state_changed = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
+
+    @callback
+    def unsub():
+        """Stop reporting states."""
+        if unsub_initial_report is not None:
+            unsub_initial_report()
+        unsub_state_changed()
+        if unsub_report_later is not None:
+            unsub_report_later()
+
+    return unsub
@@ -3,7 +3,7 @@ from abc import abstractmethod
 import asyncio
 from contextvars import ContextVar
 import logging
-from typing import Any, Dict, Iterable, List, Optional, Set, cast
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, cast
 
 import voluptuous as vol
 
@@ -30,6 +30,7 @@ from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.reference_index import async_get_reference_index
 from homeassistant.helpers.reload import async_reload_integration_platforms
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import bind_hass
@@ -57,6 +58,7 @@ SERVICE_REMOVE = "remove"
 PLATFORMS = ["light", "cover", "notify"]
 
 REG_KEY = f"{DOMAIN}_registry"
+DATA_EXPANDED = f"{DOMAIN}_expanded"
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -133,7 +135,9 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
 
     Async friendly.
     """
-    found_ids: List[str] = []
+    cache = hass.data.setdefault(DATA_EXPANDED, {})
+    # A dict keeps the order in which the entity ids were found
+    found_ids: Dict[str, None] = {}
     for entity_id in entity_ids:
         if not isinstance(entity_id, str) or entity_id in (
             ENTITY_MATCH_NONE,
@@ -148,25 +152,87 @@ def expand_entity_ids(hass: HomeAssistantType, entity_ids: Iterable[Any]) -> Lis
             domain, _ = ha.split_entity_id(entity_id)
 
             if domain == DOMAIN:
-                child_entities = get_entity_ids(hass, entity_id)
-                if entity_id in child_entities:
-                    child_entities = list(child_entities)
-                    child_entities.remove(entity_id)
-                found_ids.extend(
-                    ent_id
-                    for ent_id in expand_entity_ids(hass, child_entities)
-                    if ent_id not in found_ids
-                )
+                expanded_ids, _, _ = _expand_group(hass, entity_id, cache, set())
+                found_ids.update(dict.fromkeys(expanded_ids))
 
             else:
-                if entity_id not in found_ids:
-                    found_ids.append(entity_id)
+                found_ids[entity_id] = None
 
         except AttributeError:
             # Raised by split_entity_id if entity_id is not a string
             pass
 
-    return found_ids
+    return list(found_ids)
+
+
+def _group_members(hass: HomeAssistantType, entity_id: str) -> Any:
+    """Return the entity_id attribute of a group, None if it has none."""
+    group = hass.states.get(entity_id)
+    if group is None:
+        return None
+    return group.attributes.get(ATTR_ENTITY_ID)
+
+
+def _expand_group(
+    hass: HomeAssistantType,
+    group_id: str,
+    cache: Dict[str, Tuple[Tuple[str, ...], Tuple[Tuple[str, Any], ...]]],
+    expanding: Set[str],
+) -> Tuple[Tuple[str, ...], List[Tuple[str, Any]], Set[str]]:
+    """Return the members of a group with nested groups replaced by theirs.
+
+    Also returns the (group, entity_id attribute) pairs the expansion was made
+    from, and the groups that were not expanded again because they contain
+    themselves through this group.
+
+    An expansion is cached until the entity_id attribute of one of the groups
+    it was made from changes. Expansions that left out a group being expanded
+    higher up are incomplete and not cached.
+    """
+    cached = cache.get(group_id)
+    if cached is not None and all(
+        _group_members(hass, dep_id) is members for dep_id, members in cached[1]
+    ):
+        return cached[0], list(cached[1]), set()
+
+    members = _group_members(hass, group_id)
+    dependencies = [(group_id, members)]
+    cut: Set[str] = set()
+    found_ids: Dict[str, None] = {}
+
+    expanding.add(group_id)
+    for entity_id in members or ():
+        if not isinstance(entity_id, str) or entity_id in (
+            ENTITY_MATCH_NONE,
+            ENTITY_MATCH_ALL,
+        ):
+            continue
+
+        entity_id = entity_id.lower()
+
+        try:
+            domain, _ = ha.split_entity_id(entity_id)
+        except AttributeError:
+            continue
+
+        if domain != DOMAIN:
+            found_ids[entity_id] = None
+        elif entity_id in expanding:
+            cut.add(entity_id)
+        else:
+            child_ids, child_dependencies, child_cut = _expand_group(
+                hass, entity_id, cache, expanding
+            )
+            found_ids.update(dict.fromkeys(child_ids))
+            dependencies.extend(child_dependencies)
+            cut.update(child_cut)
+    expanding.discard(group_id)
+
+    cut.discard(group_id)
+    expanded_ids = tuple(found_ids)
+    if not cut:
+        cache[group_id] = (expanded_ids, tuple(dependencies))
+    return expanded_ids, dependencies, cut
 
 
 @bind_hass
@@ -197,16 +263,7 @@ def groups_with_entity(hass: HomeAssistantType, entity_id: str) -> List[str]:
 
     Async friendly.
     """
-    if DOMAIN not in hass.data:
-        return []
-
-    groups = []
-
-    for group in hass.data[DOMAIN].entities:
-        if entity_id in group.tracking:
-            groups.append(group.entity_id)
-
-    return groups
+    return async_get_reference_index(hass, DOMAIN).async_items_with_entity(entity_id)
 
 
 async def async_setup(hass, config):
@@ -443,6 +500,9 @@ class Group(Entity):
         self._set_tracked(entity_ids)
         self._on_off = None
         self._assumed = None
+        # Number of members that are on and that have an assumed state
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = None
         self.user_defined = user_defined
         self.mode = any
@@ -575,6 +635,9 @@ class Group(Entity):
         """
         self._async_stop()
         self._set_tracked(entity_ids)
+        async_get_reference_index(self.hass, DOMAIN).async_set(
+            self.entity_id, self.tracking
+        )
         self._reset_tracked_state()
         self._async_start()
 
@@ -639,6 +702,10 @@ class Group(Entity):
 
     async def async_added_to_hass(self):
         """Handle addition to Home Assistant."""
+        async_get_reference_index(self.hass, DOMAIN).async_set(
+            self.entity_id, self.tracking
+        )
+
         if self.hass.state != CoreState.running:
             self.hass.bus.async_listen_once(
                 EVENT_HOMEASSISTANT_START, self._async_start
@@ -651,6 +718,7 @@ class Group(Entity):
 
     async def async_will_remove_from_hass(self):
         """Handle removal from Home Assistant."""
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         self._async_stop()
 
     async def _async_state_changed_listener(self, event):
@@ -676,6 +744,8 @@ class Group(Entity):
         """Reset tracked state."""
         self._on_off = {}
         self._assumed = {}
+        self._on_count = 0
+        self._assumed_count = 0
         self._on_states = set()
 
         for entity_id in self.trackable:
@@ -690,7 +760,9 @@ class Group(Entity):
         domain = new_state.domain
         state = new_state.state
         registry = self.hass.data[REG_KEY]
-        self._assumed[entity_id] = new_state.attributes.get(ATTR_ASSUMED_STATE)
+        assumed = bool(new_state.attributes.get(ATTR_ASSUMED_STATE))
+        self._assumed_count += assumed - self._assumed.get(entity_id, False)
+        self._assumed[entity_id] = assumed
 
         if domain not in registry.on_states_by_domain:
             # Handle the group of a group case
@@ -698,12 +770,26 @@ class Group(Entity):
                 self._on_states.add(state)
             elif state in registry.off_on_mapping:
                 self._on_states.add(registry.off_on_mapping[state])
-            self._on_off[entity_id] = state in registry.on_off_mapping
+            self._set_on_off(entity_id, state in registry.on_off_mapping)
         else:
             entity_on_state = registry.on_states_by_domain[domain]
             if domain in self.hass.data[REG_KEY].on_states_by_domain:
                 self._on_states.update(entity_on_state)
-            self._on_off[entity_id] = state in entity_on_state
+            self._set_on_off(entity_id, state in entity_on_state)
+
+    def _set_on_off(self, entity_id, is_on):
+        """Keep track of whether a member is on."""
+        self._on_count += is_on - self._on_off.get(entity_id, False)
+        self._on_off[entity_id] = is_on
+
+    def _mode_of(self, count, total):
+        """Apply the mode to members of which count out of total are true.
+
+        Equivalent to calling the mode on the values, without iterating them.
+        """
+        if self.mode is all:
+            return count == total
+        return count > 0
 
     @callback
     def _async_update_group_state(self, tr_state=None):
@@ -726,7 +812,7 @@ class Group(Entity):
             or self._assumed_state
             and not tr_state.attributes.get(ATTR_ASSUMED_STATE)
         ):
-            self._assumed_state = self.mode(self._assumed.values())
+            self._assumed_state = self._mode_of(self._assumed_count, len(self._assumed))
 
         elif tr_state.attributes.get(ATTR_ASSUMED_STATE):
             self._assumed_state = True
@@ -746,7 +832,7 @@ class Group(Entity):
         # on state, we use STATE_ON/STATE_OFF
         else:
             on_state = STATE_ON
-        group_is_on = self.mode(self._on_off.values())
+        group_is_on = self._mode_of(self._on_count, len(self._on_off))
         if group_is_on:
             self._state = on_state
         else:
@@ -84,9 +84,35 @@ QUERY_STATES = [
     States.last_updated,
 ]
 
+# Columns that can be requested with fields, entity_id is always loaded
+FIELD_COLUMNS = {
+    "state": States.state,
+    "attributes": States.attributes,
+    "last_changed": States.last_changed,
+    "last_updated": States.last_updated,
+}
+
 HISTORY_BAKERY = "history_bakery"
 
 
+def _query_columns(fields):
+    """Return the columns to query for the requested fields."""
+    if fields is None:
+        return QUERY_STATES
+    return [States.entity_id, *(FIELD_COLUMNS[field] for field in fields)]
+
+
+def _fields_key(fields):
+    """Return the requested fields as a hashable bakery cache key."""
+    if fields is None:
+        return None
+    fields = tuple(fields)
+    for field in fields:
+        if field not in FIELD_COLUMNS:
+            raise ValueError(f"Unknown state field {field}")
+    return fields
+
+
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
     with session_scope(hass=hass) as session:
@@ -103,6 +129,7 @@ def _get_significant_states(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    fields=None,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -110,11 +137,15 @@ def _get_significant_states(
     Significant states are all states where there is a state change,
     as well as all states from certain domains (for instance
     thermostat so that we get current temperature in our graphs).
+
+    When fields are given, only those columns are loaded and the states
+    are returned as ProjectedState.
     """
     timer_start = time.perf_counter()
 
+    fields = _fields_key(fields)
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*_query_columns(fields)), fields
     )
 
     if significant_changes_only:
@@ -161,14 +192,18 @@ def _get_significant_states(
         filters,
         include_start_time_state,
         minimal_response,
+        fields,
     )
 
 
-def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
+def state_changes_during_period(
+    hass, start_time, end_time=None, entity_id=None, fields=None
+):
     """Return states changes during UTC period start_time - end_time."""
+    fields = _fields_key(fields)
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*_query_columns(fields)), fields
         )
 
         baked_query += lambda q: q.filter(
@@ -195,16 +230,19 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
 
         entity_ids = [entity_id] if entity_id is not None else None
 
-        return _sorted_states_to_json(hass, session, states, start_time, entity_ids)
+        return _sorted_states_to_json(
+            hass, session, states, start_time, entity_ids, fields=fields
+        )
 
 
-def get_last_state_changes(hass, number_of_states, entity_id):
+def get_last_state_changes(hass, number_of_states, entity_id, fields=None):
     """Return the last number_of_states."""
     start_time = dt_util.utcnow()
+    fields = _fields_key(fields)
 
     with session_scope(hass=hass) as session:
         baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
+            lambda session: session.query(*_query_columns(fields)), fields
         )
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
@@ -233,10 +271,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
             start_time,
             entity_ids,
             include_start_time_state=False,
+            fields=fields,
         )
 
 
-def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None):
+def get_states(
+    hass, utc_point_in_time, entity_ids=None, run=None, filters=None, fields=None
+):
     """Return the states at a specific point in time."""
     if run is None:
         run = recorder.run_information_from_instance(hass, utc_point_in_time)
@@ -247,17 +288,24 @@ def get_states(hass, utc_point_in_time, entity_ids=None, run=None, filters=None)
 
     with session_scope(hass=hass) as session:
         return _get_states_with_session(
-            hass, session, utc_point_in_time, entity_ids, run, filters
+            hass, session, utc_point_in_time, entity_ids, run, filters, fields
         )
 
 
 def _get_states_with_session(
-    hass, session, utc_point_in_time, entity_ids=None, run=None, filters=None
+    hass,
+    session,
+    utc_point_in_time,
+    entity_ids=None,
+    run=None,
+    filters=None,
+    fields=None,
 ):
     """Return the states at a specific point in time."""
+    fields = _fields_key(fields)
     if entity_ids and len(entity_ids) == 1:
         return _get_single_entity_states_with_session(
-            hass, session, utc_point_in_time, entity_ids[0]
+            hass, session, utc_point_in_time, entity_ids[0], fields
         )
 
     if run is None:
@@ -270,7 +318,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = session.query(*_query_columns(fields))
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -312,14 +360,17 @@ def _get_states_with_session(
         if filters:
             query = filters.apply(query)
 
-    return [LazyState(row) for row in execute(query)]
+    state_class = LazyState if fields is None else ProjectedState
+    return [state_class(row) for row in execute(query)]
 
 
-def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
+def _get_single_entity_states_with_session(
+    hass, session, utc_point_in_time, entity_id, fields=None
+):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
     baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+        lambda session: session.query(*_query_columns(fields)), fields
     )
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
@@ -332,7 +383,8 @@ def _get_single_entity_states_with_session(hass, session, utc_point_in_time, ent
         utc_point_in_time=utc_point_in_time, entity_id=entity_id
     )
 
-    return [LazyState(row) for row in execute(query)]
+    state_class = LazyState if fields is None else ProjectedState
+    return [state_class(row) for row in execute(query)]
 
 
 def _sorted_states_to_json(
@@ -344,6 +396,7 @@ def _sorted_states_to_json(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    fields=None,
 ):
     """Convert SQL results into JSON friendly data structure.
 
@@ -355,6 +408,8 @@ def _sorted_states_to_json(
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
+
+    When fields are given, every row becomes a ProjectedState.
     """
     result = defaultdict(list)
     # Set all entity IDs to empty lists in result set to maintain the order
@@ -367,7 +422,13 @@ def _sorted_states_to_json(
     if include_start_time_state:
         run = recorder.run_information_from_instance(hass, start_time)
         for state in _get_states_with_session(
-            hass, session, start_time, entity_ids, run=run, filters=filters
+            hass,
+            session,
+            start_time,
+            entity_ids,
+            run=run,
+            filters=filters,
+            fields=fields,
         ):
             state.last_changed = start_time
             state.last_updated = start_time
@@ -381,6 +442,11 @@ def _sorted_states_to_json(
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
+    if fields is not None:
+        for ent_id, group in groupby(states, lambda state: state.entity_id):
+            result[ent_id].extend(ProjectedState(db_state) for db_state in group)
+        return {key: val for key, val in result.items() if val}
+
     # Append all changes to it
     for ent_id, group in groupby(states, lambda state: state.entity_id):
         domain = split_entity_id(ent_id)[0]
@@ -424,9 +490,9 @@ def _sorted_states_to_json(
     return {key: val for key, val in result.items() if val}
 
 
-def get_state(hass, utc_point_in_time, entity_id, run=None):
+def get_state(hass, utc_point_in_time, entity_id, run=None, fields=None):
     """Return a state at a specific point in time."""
-    states = get_states(hass, utc_point_in_time, (entity_id,), run)
+    states = get_states(hass, utc_point_in_time, (entity_id,), run, fields=fields)
     return states[0] if states else None
 
 
@@ -793,3 +859,46 @@ class LazyState(State):
             and self.state == other.state
             and self.attributes == other.attributes
         )
+
+
+class ProjectedState:
+    """A lightweight state with only the fields loaded from the database.
+
+    Fields that were not requested are None.
+    """
+
+    __slots__ = [
+        "entity_id",
+        "state",
+        "last_changed",
+        "last_updated",
+        "_attributes",
+        "_attributes_json",
+    ]
+
+    def __init__(self, row):
+        """Init the state from a row with the requested columns."""
+        self.entity_id = row.entity_id
+        self.state = getattr(row, "state", None)
+        self.last_changed = process_timestamp(getattr(row, "last_changed", None))
+        self.last_updated = process_timestamp(getattr(row, "last_updated", None))
+        self._attributes_json = getattr(row, "attributes", None)
+        self._attributes = None
+
+    @property
+    def attributes(self):
+        """State attributes, decoded on first access."""
+        if self._attributes is None:
+            if self._attributes_json is None:
+                self._attributes = {}
+            else:
+                try:
+                    self._attributes = json.loads(self._attributes_json)
+                except ValueError:
+                    _LOGGER.exception("Error converting row to state: %s", self)
+                    self._attributes = {}
+        return self._attributes
+
+    def __repr__(self):
+        """Return the representation of the state."""
+        return f"<ProjectedState {self.entity_id}={self.state} @ {self.last_changed}>"
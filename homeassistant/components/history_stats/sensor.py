@@ -221,15 +221,21 @@ class HistoryStatsSensor(Entity):
 
         # Get history between start and end
         history_list = history.state_changes_during_period(
-            self.hass, start, end, str(self._entity_id)
+            self.hass,
+            start,
+            end,
+            str(self._entity_id),
+            fields=("state", "last_changed"),
         )
 
         if self._entity_id not in history_list:
             return
 
         # Get the first state
-        last_state = history.get_state(self.hass, start, self._entity_id)
-        last_state = last_state is not None and last_state in self._entity_states
+        last_state = history.get_state(
+            self.hass, start, self._entity_id, fields=("state",)
+        )
+        last_state = last_state is not None and last_state.state in self._entity_states
         last_time = start_timestamp
         elapsed = 0
         count = 0
@@ -1,10 +1,10 @@
 """Ban logic for HTTP component."""
-from collections import defaultdict
-from datetime import datetime
+from collections import OrderedDict, defaultdict
+from datetime import datetime, timedelta
 from ipaddress import ip_address
 import logging
 from socket import gethostbyaddr, herror
-from typing import List, Optional
+from typing import Iterable, List, Optional
 
 from aiohttp.web import middleware
 from aiohttp.web_exceptions import HTTPForbidden, HTTPUnauthorized
@@ -23,7 +23,9 @@ _LOGGER = logging.getLogger(__name__)
 
 KEY_BANNED_IPS = "ha_banned_ips"
 KEY_FAILED_LOGIN_ATTEMPTS = "ha_failed_login_attempts"
+KEY_LAST_FAILED_LOGIN = "ha_last_failed_login"
 KEY_LOGIN_THRESHOLD = "ha_login_threshold"
+KEY_UNSAVED_BANS = "ha_unsaved_bans"
 
 NOTIFICATION_ID_BAN = "ip-ban"
 NOTIFICATION_ID_LOGIN = "http-login"
@@ -31,6 +33,9 @@ NOTIFICATION_ID_LOGIN = "http-login"
 IP_BANS_FILE = "ip_bans.yaml"
 ATTR_BANNED_AT = "banned_at"
 
+# Failed login attempts are forgotten after this long without a new one
+FAILED_LOGIN_WINDOW = timedelta(hours=24)
+
 SCHEMA_IP_BAN_ENTRY = vol.Schema(
     {vol.Optional("banned_at"): vol.Any(None, cv.datetime)}
 )
@@ -41,13 +46,19 @@ def setup_bans(hass, app, login_threshold):
     """Create IP Ban middleware for the app."""
     app.middlewares.append(ban_middleware)
     app[KEY_FAILED_LOGIN_ATTEMPTS] = defaultdict(int)
+    # Remote address -> time of the last failed login, oldest first
+    app[KEY_LAST_FAILED_LOGIN] = OrderedDict()
     app[KEY_LOGIN_THRESHOLD] = login_threshold
+    app[KEY_UNSAVED_BANS] = []
 
     async def ban_startup(app):
         """Initialize bans when app starts up."""
-        app[KEY_BANNED_IPS] = await async_load_ip_bans_config(
-            hass, hass.config.path(IP_BANS_FILE)
-        )
+        app[KEY_BANNED_IPS] = {
+            ip_ban.ip_address: ip_ban
+            for ip_ban in await async_load_ip_bans_config(
+                hass, hass.config.path(IP_BANS_FILE)
+            )
+        }
 
     app.on_startup.append(ban_startup)
 
@@ -60,12 +71,7 @@ async def ban_middleware(request, handler):
         return await handler(request)
 
     # Verify if IP is not banned
-    ip_address_ = ip_address(request.remote)
-    is_banned = any(
-        ip_ban.ip_address == ip_address_ for ip_ban in request.app[KEY_BANNED_IPS]
-    )
-
-    if is_banned:
+    if ip_address(request.remote) in request.app[KEY_BANNED_IPS]:
         raise HTTPForbidden()
 
     try:
@@ -121,7 +127,10 @@ async def process_wrong_login(request):
     if KEY_BANNED_IPS not in request.app or request.app[KEY_LOGIN_THRESHOLD] < 1:
         return
 
+    _async_forget_failed_logins(request.app)
     request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr] += 1
+    request.app[KEY_LAST_FAILED_LOGIN][remote_addr] = dt_util.utcnow()
+    request.app[KEY_LAST_FAILED_LOGIN].move_to_end(remote_addr)
 
     # Supervisor IP should never be banned
     if (
@@ -133,13 +142,15 @@ async def process_wrong_login(request):
     if (
         request.app[KEY_FAILED_LOGIN_ATTEMPTS][remote_addr]
         >= request.app[KEY_LOGIN_THRESHOLD]
+        and remote_addr not in request.app[KEY_BANNED_IPS]
     ):
         new_ban = IpBan(remote_addr)
-        request.app[KEY_BANNED_IPS].append(new_ban)
+        request.app[KEY_BANNED_IPS][new_ban.ip_address] = new_ban
 
-        await hass.async_add_executor_job(
-            update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_ban
-        )
+        # Bans made while a previous batch is written are saved together
+        request.app[KEY_UNSAVED_BANS].append(new_ban)
+        if len(request.app[KEY_UNSAVED_BANS]) == 1:
+            hass.async_create_task(_async_save_new_bans(hass, request.app))
 
         _LOGGER.warning("Banned IP %s for too many login attempts", remote_addr)
 
@@ -171,6 +182,37 @@ async def process_success_login(request):
             "Login success, reset failed login attempts counter from %s", remote_addr
         )
         request.app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr)
+        request.app[KEY_LAST_FAILED_LOGIN].pop(remote_addr, None)
+
+
+@callback
+def _async_forget_failed_logins(app):
+    """Forget the failed login attempts of addresses that stopped trying."""
+    last_failed_login = app[KEY_LAST_FAILED_LOGIN]
+    expired = dt_util.utcnow() - FAILED_LOGIN_WINDOW
+
+    while last_failed_login:
+        remote_addr, failed_at = next(iter(last_failed_login.items()))
+        if failed_at > expired:
+            break
+        del last_failed_login[remote_addr]
+        app[KEY_FAILED_LOGIN_ATTEMPTS].pop(remote_addr, None)
+
+
+async def _async_save_new_bans(hass, app):
+    """Append the bans that were not saved yet to the config file."""
+    unsaved_bans = app[KEY_UNSAVED_BANS]
+
+    while unsaved_bans:
+        new_bans = list(unsaved_bans)
+        try:
+            await hass.async_add_executor_job(
+                update_ip_bans_config, hass.config.path(IP_BANS_FILE), new_bans
+            )
+        except OSError as err:
+            _LOGGER.error("Unable to save IP bans: %s", err)
+        finally:
+            del unsaved_bans[: len(new_bans)]
 
 
 class IpBan:
@@ -205,9 +247,12 @@ async def async_load_ip_bans_config(hass: HomeAssistant, path: str) -> List[IpBa
     return ip_list
 
 
-def update_ip_bans_config(path: str, ip_ban: IpBan) -> None:
-    """Update config file with new banned IP address."""
+def update_ip_bans_config(path: str, ip_bans: Iterable[IpBan]) -> None:
+    """Update config file with new banned IP addresses."""
     with open(path, "a") as out:
-        ip_ = {str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}}
+        ip_ = {
+            str(ip_ban.ip_address): {ATTR_BANNED_AT: ip_ban.banned_at.isoformat()}
+            for ip_ban in ip_bans
+        }
         out.write("\n")
         out.write(yaml.dump(ip_))
@@ -1,22 +1,61 @@
 """Static file handling for HTTP component."""
+from collections import OrderedDict
+import mimetypes
+import os
 from pathlib import Path
+import stat
+from typing import List, Optional, Tuple
 
 from aiohttp import hdrs
-from aiohttp.web import FileResponse
+from aiohttp.web import FileResponse, Request, Response, StreamResponse
 from aiohttp.web_exceptions import HTTPForbidden, HTTPNotFound
 from aiohttp.web_urldispatcher import StaticResource
 
+from .const import KEY_HASS
+
 # mypy: allow-untyped-defs
 
 CACHE_TIME = 31 * 86400  # = 1 month
 CACHE_HEADERS = {hdrs.CACHE_CONTROL: f"public, max-age={CACHE_TIME}"}
 
+# Content encodings of pre-compressed files and their suffix, preferred first
+ENCODING_SUFFIXES = (("br", ".br"), ("gzip", ".gz"))
+# Files up to this size are kept in memory, bigger files are streamed from disk
+MAX_CACHED_FILE_SIZE = 1024 * 1024
+# Total size of the file contents kept in memory by a static resource
+MAX_CACHE_SIZE = 16 * 1024 * 1024
+# Number of resolved paths remembered by a static resource
+MAX_RESOLVED_PATHS = 4096
+
+# Path of the file and content encoding, file and stat of the variant to serve
+_ResolvedFile = Tuple[Path, Optional[Tuple[Optional[str], Path, os.stat_result]]]
+
 
 class CachingStaticResource(StaticResource):
-    """Static Resource handler that will add cache headers."""
+    """Static Resource handler that will add cache headers.
+
+    Small files are served from memory and pre-compressed variants of files
+    are served to clients that accept them.
+    """
 
-    async def _handle(self, request):
+    def __init__(self, *args, **kwargs):
+        """Initialize the static resource."""
+        super().__init__(*args, **kwargs)
+        # Requested file name -> resolved path, least recently used first
+        self._resolved: "OrderedDict[str, Path]" = OrderedDict()
+        # Served path -> modification time, size and content of the file
+        self._contents: "OrderedDict[str, Tuple[int, int, bytes]]" = OrderedDict()
+        self._contents_size = 0
+
+    async def _handle(self, request: Request) -> StreamResponse:
         rel_url = request.match_info["filename"]
+        accept_encoding = request.headers.get(hdrs.ACCEPT_ENCODING, "")
+        encodings = [
+            (encoding, suffix)
+            for encoding, suffix in ENCODING_SUFFIXES
+            if encoding in accept_encoding
+        ]
+        hass = request.app[KEY_HASS]
         try:
             filename = Path(rel_url)
             if filename.anchor:
@@ -24,25 +63,131 @@ class CachingStaticResource(StaticResource):
                 # /static/\\machine_name\c$ or /static/D:\path
                 # where the static dir is totally different
                 raise HTTPForbidden()
-            filepath = self._directory.joinpath(filename).resolve()
-            if not self._follow_symlinks:
-                filepath.relative_to(self._directory)
+            filepath, served = await hass.async_add_executor_job(
+                self._resolve_file, filename, self._resolved.get(rel_url), encodings
+            )
         except (ValueError, FileNotFoundError) as error:
             # relatively safe
+            self._resolved.pop(rel_url, None)
             raise HTTPNotFound() from error
+        except HTTPForbidden:
+            raise
+        except HTTPNotFound:
+            self._resolved.pop(rel_url, None)
+            raise
         except Exception as error:
             # perm error or other kind!
             request.app.logger.exception(error)
             raise HTTPNotFound() from error
 
+        self._resolved[rel_url] = filepath
+        self._resolved.move_to_end(rel_url)
+        if len(self._resolved) > MAX_RESOLVED_PATHS:
+            self._resolved.popitem(last=False)
+
         # on opening a dir, load its contents if allowed
-        if filepath.is_dir():
+        if served is None:
             return await super()._handle(request)
-        if filepath.is_file():
+
+        encoding, variant, variant_stat = served
+        if variant_stat.st_size > MAX_CACHED_FILE_SIZE:
             return FileResponse(
                 filepath,
                 chunk_size=self._chunk_size,
                 # type ignore: https://github.com/aio-libs/aiohttp/pull/3976
                 headers=CACHE_HEADERS,  # type: ignore
             )
-        raise HTTPNotFound
+
+        etag = f'"{variant_stat.st_mtime_ns:x}-{variant_stat.st_size:x}"'
+        headers = {
+            **CACHE_HEADERS,
+            hdrs.ETAG: etag,
+            hdrs.VARY: hdrs.ACCEPT_ENCODING,
+        }
+        if _etag_matches(request.headers.get(hdrs.IF_NONE_MATCH), etag):
+            return Response(status=304, headers=headers)
+
+        if encoding is not None:
+            headers[hdrs.CONTENT_ENCODING] = encoding
+
+        key = str(variant)
+        cached = self._contents.get(key)
+        if cached is not None and cached[:2] == (
+            variant_stat.st_mtime_ns,
+            variant_stat.st_size,
+        ):
+            self._contents.move_to_end(key)
+            body = cached[2]
+        else:
+            body = await hass.async_add_executor_job(variant.read_bytes)
+            if len(body) == variant_stat.st_size:
+                self._cache_contents(
+                    key, (variant_stat.st_mtime_ns, variant_stat.st_size, body)
+                )
+
+        content_type = mimetypes.guess_type(str(filepath))[0]
+        return Response(
+            body=body,
+            content_type=content_type or "application/octet-stream",
+            headers=headers,
+        )
+
+    def _resolve_file(
+        self,
+        filename: Path,
+        filepath: Optional[Path],
+        encodings: List[Tuple[str, str]],
+    ) -> _ResolvedFile:
+        """Resolve a requested file and find the variant to serve.
+
+        Returns no variant for directories. Runs in the executor.
+        """
+        if filepath is not None:
+            try:
+                filepath_stat = filepath.stat()
+            except FileNotFoundError:
+                # The previously resolved file is gone, resolve it again
+                filepath = None
+
+        if filepath is None:
+            filepath = self._directory.joinpath(filename).resolve()
+            if not self._follow_symlinks:
+                filepath.relative_to(self._directory)
+            filepath_stat = filepath.stat()
+
+        if stat.S_ISDIR(filepath_stat.st_mode):
+            return filepath, None
+        if not stat.S_ISREG(filepath_stat.st_mode):
+            raise HTTPNotFound()
+
+        for encoding, suffix in encodings:
+            variant = filepath.with_name(filepath.name + suffix)
+            try:
+                variant_stat = variant.stat()
+            except OSError:
+                continue
+            if stat.S_ISREG(variant_stat.st_mode):
+                return filepath, (encoding, variant, variant_stat)
+
+        return filepath, (None, filepath, filepath_stat)
+
+    def _cache_contents(self, key: str, contents: Tuple[int, int, bytes]) -> None:
+        """Keep the contents of a file in memory."""
+        previous = self._contents.pop(key, None)
+        if previous is not None:
+            self._contents_size -= previous[1]
+
+        self._contents[key] = contents
+        self._contents_size += contents[1]
+        while self._contents_size > MAX_CACHE_SIZE:
+            _, (_, size, _) = self._contents.popitem(last=False)
+            self._contents_size -= size
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return if an If-None-Match header matches an entity tag."""
+    if not if_none_match:
+        return False
+
+    tags = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in tags or etag in tags or f"W/{etag}" in tags
@@ -2,6 +2,7 @@
 import asyncio
 from datetime import timedelta
 import logging
+import time
 
 import voluptuous as vol
 
@@ -45,6 +46,12 @@ CONF_CONFIDENCE = "confidence"
 DEFAULT_TIMEOUT = 10
 DEFAULT_CONFIDENCE = 80
 
+# Camera images fetched this recently are shared between image processors
+FRAME_MAX_AGE = 1
+# Maximum number of images processed at the same time
+MAX_CONCURRENT_PROCESSING = 4
+DATA_PROCESSING_SEMAPHORE = "image_processing_semaphore"
+
 SOURCE_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_ENTITY_ID): cv.entity_domain("camera"),
@@ -66,6 +73,7 @@ PLATFORM_SCHEMA_BASE = cv.PLATFORM_SCHEMA_BASE.extend(PLATFORM_SCHEMA.schema)
 async def async_setup(hass, config):
     """Set up the image processing."""
     component = EntityComponent(_LOGGER, DOMAIN, hass, SCAN_INTERVAL)
+    hass.data[DATA_PROCESSING_SEMAPHORE] = asyncio.Semaphore(MAX_CONCURRENT_PROCESSING)
 
     await component.async_setup(config)
 
@@ -114,6 +122,9 @@ class ImageProcessingEntity(Entity):
     async def async_update(self):
         """Update image and process it.
 
+        The camera image is shared with other image processors of the camera
+        that update at the same time.
+
         This method is a coroutine.
         """
         camera = self.hass.components.camera
@@ -121,7 +132,7 @@ class ImageProcessingEntity(Entity):
 
         try:
             image = await camera.async_get_image(
-                self.camera_entity, timeout=self.timeout
+                self.camera_entity, timeout=self.timeout, max_age=FRAME_MAX_AGE
             )
 
         except HomeAssistantError as err:
@@ -129,7 +140,16 @@ class ImageProcessingEntity(Entity):
             return
 
         # process image data
-        await self.async_process_image(image.content)
+        async with self.hass.data[DATA_PROCESSING_SEMAPHORE]:
+            start = time.monotonic()
+            await self.async_process_image(image.content)
+
+        _LOGGER.debug(
+            "Processing image of %s by %s took %.3f seconds",
+            self.camera_entity,
+            self.platform.platform_name if self.platform else self.entity_id,
+            time.monotonic() - start,
+        )
 
 
 class ImageProcessingFaceEntity(ImageProcessingEntity):
@@ -1,11 +1,14 @@
 """Support for sending data to an Influx database."""
 from dataclasses import dataclass
+from datetime import datetime, timezone
+import gzip
 import logging
 import math
+import os
 import queue
 import threading
 import time
-from typing import Any, Callable, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from influxdb import InfluxDBClient, exceptions
 from influxdb_client import InfluxDBClient as InfluxDBClientV2
@@ -34,10 +37,18 @@ from homeassistant.helpers.entityfilter import (
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
     convert_include_exclude_filter,
 )
+from homeassistant.helpers.storage import STORAGE_DIR
 
 from .const import (
     API_VERSION_2,
+    BACKLOG_ERROR,
+    BACKLOG_FILE,
+    BACKLOG_MAX_BYTES,
+    BACKLOG_MESSAGE,
+    BACKLOG_WROTE_MESSAGE,
     BATCH_BUFFER_SIZE,
+    BATCH_MAX_BYTES,
+    BATCH_MAX_SIZE,
     BATCH_TIMEOUT,
     CATCHING_UP_MESSAGE,
     CLIENT_ERROR_V1,
@@ -51,6 +62,7 @@ from .const import (
     CONF_COMPONENT_CONFIG_GLOB,
     CONF_DB_NAME,
     CONF_DEFAULT_MEASUREMENT,
+    CONF_GZIP,
     CONF_HOST,
     CONF_IGNORE_ATTRIBUTES,
     CONF_MEASUREMENT_ATTR,
@@ -314,6 +326,103 @@ def _generate_event_to_json(conf: Dict) -> Callable[[Dict], str]:
     return event_to_json
 
 
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_PRECISION_DIVISOR = {None: 1, "ns": 1, "us": 10 ** 3, "ms": 10 ** 6, "s": 10 ** 9}
+_KEY_CACHE_SIZE = 10000
+
+
+def _escape_key(key: Any) -> str:
+    """Escape a measurement, tag key, tag value or field key."""
+    return (
+        str(key)
+        .replace("\\", "\\\\")
+        .replace(" ", "\\ ")
+        .replace(",", "\\,")
+        .replace("=", "\\=")
+        .replace("\n", "\\n")
+    )
+
+
+def _escape_field_value(value: Any) -> str:
+    """Format a field value."""
+    if isinstance(value, str):
+        value = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        return f'"{value}"'
+    if isinstance(value, bool):
+        return str(value)
+    if isinstance(value, int):
+        return f"{value}i"
+    if isinstance(value, float):
+        return repr(value)
+    return _escape_field_value(str(value))
+
+
+class LineProtocolEncoder:
+    """Encode points created by event_to_json into InfluxDB line protocol.
+
+    The escaped measurement and tags rarely change for an entity, so they are
+    cached per combination instead of being escaped again for every point.
+    """
+
+    def __init__(self, precision: Optional[str]) -> None:
+        """Initialize the encoder."""
+        self._divisor = _PRECISION_DIVISOR[precision]
+        self._keys: Dict[Tuple, str] = {}
+
+    def _key(self, measurement: str, tags: Dict[str, Any]) -> str:
+        """Return the escaped measurement and tags of a point."""
+        try:
+            cache_key = (measurement, *tags.items())
+            return self._keys[cache_key]
+        except KeyError:
+            pass
+        except TypeError:
+            # Unhashable tag values can't be cached
+            cache_key = None
+
+        key = ",".join(
+            [_escape_key(measurement)]
+            + [
+                f"{_escape_key(tag)}={_escape_key(value)}"
+                for tag, value in sorted(tags.items())
+                if tag != "" and value not in (None, "")
+            ]
+        )
+        if cache_key is not None:
+            if len(self._keys) >= _KEY_CACHE_SIZE:
+                self._keys.clear()
+            self._keys[cache_key] = key
+        return key
+
+    def _timestamp(self, value: Any) -> int:
+        """Convert the time of a point into an integer of the precision."""
+        if isinstance(value, int):
+            # Integers are assumed to be in the right precision already
+            return value
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        delta = value - _EPOCH
+        nanoseconds = (delta.days * 86400 + delta.seconds) * 10 ** 9
+        nanoseconds += delta.microseconds * 1000
+        return nanoseconds // self._divisor
+
+    def encode(self, json: Dict[str, Any]) -> str:
+        """Encode a point into a line."""
+        fields = ",".join(
+            [
+                f"{_escape_key(field)}={_escape_field_value(value)}"
+                for field, value in sorted(json[INFLUX_CONF_FIELDS].items())
+            ]
+        )
+        line = (
+            f"{self._key(json[INFLUX_CONF_MEASUREMENT], json[INFLUX_CONF_TAGS])}"
+            f" {fields}"
+        )
+        if json.get(INFLUX_CONF_TIME) is not None:
+            line = f"{line} {self._timestamp(json[INFLUX_CONF_TIME])}"
+        return line
+
+
 @dataclass
 class InfluxClient:
     """An InfluxDB client wrapper for V1 or V2."""
@@ -336,14 +445,16 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_TOKEN] = conf[CONF_TOKEN]
         kwargs[INFLUX_CONF_ORG] = conf[CONF_ORG]
         bucket = conf.get(CONF_BUCKET)
+        if conf.get(CONF_GZIP):
+            kwargs["enable_gzip"] = True
         influx = InfluxDBClientV2(**kwargs)
         query_api = influx.query_api()
         initial_write_mode = SYNCHRONOUS if test_write else ASYNCHRONOUS
         write_api = influx.write_api(write_options=initial_write_mode)
 
-        def write_v2(json):
-            """Write data to V2 influx."""
-            data = {"bucket": bucket, "record": json}
+        def write_v2(lines):
+            """Write lines of line protocol to V2 influx."""
+            data = {"bucket": bucket, "record": lines}
 
             if precision is not None:
                 data["write_precision"] = precision
@@ -354,7 +465,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
                 raise ConnectionError(CONNECTION_ERROR % exc) from exc
             except ApiException as exc:
                 if exc.status == CODE_INVALID_INPUTS:
-                    raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                    raise ValueError(WRITE_ERROR % (lines, exc)) from exc
                 raise ConnectionError(CLIENT_ERROR_V2 % exc) from exc
 
         def query_v2(query, _=None):
@@ -416,11 +527,33 @@ def get_influx_connection(conf, test_write=False, test_read=False):
         kwargs[CONF_SSL] = conf[CONF_SSL]
 
     influx = InfluxDBClient(**kwargs)
+    use_gzip = conf.get(CONF_GZIP)
+    gzip_params = {"db": conf[CONF_DB_NAME]}
+    if precision is not None:
+        gzip_params["precision"] = precision
+
+    def write_gzip_v1(lines):
+        """Write gzip compressed lines, which the V1 client doesn't offer."""
+        influx.request(
+            url="write",
+            method="POST",
+            params=gzip_params,
+            data=gzip.compress(("\n".join(lines) + "\n").encode("utf-8")),
+            expected_response_code=204,
+            headers={
+                "Content-Type": "application/octet-stream",
+                "Content-Encoding": "gzip",
+                "Accept": "text/plain",
+            },
+        )
 
-    def write_v1(json):
-        """Write data to V1 influx."""
+    def write_v1(lines):
+        """Write lines of line protocol to V1 influx."""
         try:
-            influx.write_points(json, time_precision=precision)
+            if use_gzip:
+                write_gzip_v1(lines)
+            else:
+                influx.write_points(lines, time_precision=precision, protocol="line")
         except (
             requests.exceptions.RequestException,
             exceptions.InfluxDBServerError,
@@ -429,7 +562,7 @@ def get_influx_connection(conf, test_write=False, test_read=False):
             raise ConnectionError(CONNECTION_ERROR % exc) from exc
         except exceptions.InfluxDBClientError as exc:
             if exc.code == CODE_INVALID_INPUTS:
-                raise ValueError(WRITE_ERROR % (json, exc)) from exc
+                raise ValueError(WRITE_ERROR % (lines, exc)) from exc
             raise ConnectionError(CLIENT_ERROR_V1 % exc) from exc
 
     def query_v1(query, database=None):
@@ -473,7 +606,11 @@ def setup(hass, config):
 
     event_to_json = _generate_event_to_json(conf)
     max_tries = conf.get(CONF_RETRY_COUNT)
-    instance = hass.data[DOMAIN] = InfluxThread(hass, influx, event_to_json, max_tries)
+    encoder = LineProtocolEncoder(conf.get(CONF_PRECISION))
+    backlog_path = hass.config.path(STORAGE_DIR, BACKLOG_FILE)
+    instance = hass.data[DOMAIN] = InfluxThread(
+        hass, influx, event_to_json, max_tries, encoder, backlog_path
+    )
     instance.start()
 
     def shutdown(event):
@@ -488,17 +625,41 @@ def setup(hass, config):
 
 
 class InfluxThread(threading.Thread):
-    """A threaded event handler class."""
+    """A threaded event handler class.
+
+    Events are written in batches of line protocol. A batch is written when
+    the queue has been idle for the batch timeout, or when it reaches the
+    maximum number of events or bytes. The maximum number of events grows
+    with the queue so a backlog is worked off in fewer, larger writes.
+
+    Batches that can't be written are appended to a bounded backlog file,
+    which is written once InfluxDB is available again.
+    """
 
-    def __init__(self, hass, influx, event_to_json, max_tries):
+    def __init__(
+        self, hass, influx, event_to_json, max_tries, encoder, backlog_path
+    ):  # pylint: disable=too-many-arguments
         """Initialize the listener."""
         threading.Thread.__init__(self, name=DOMAIN)
         self.queue = queue.Queue()
         self.influx = influx
         self.event_to_json = event_to_json
         self.max_tries = max_tries
+        self.encoder = encoder
+        self.backlog_path = backlog_path
         self.write_errors = 0
         self.shutdown = False
+        self.stats = {
+            "queue_depth": 0,
+            "batch_size": 0,
+            "batch_bytes": 0,
+            "write_latency": 0.0,
+            "backlog_bytes": 0,
+        }
+        try:
+            self.stats["backlog_bytes"] = os.path.getsize(backlog_path)
+        except OSError:
+            pass
         hass.bus.listen(EVENT_STATE_CHANGED, self._event_listener)
 
     @callback
@@ -515,14 +676,18 @@ class InfluxThread(threading.Thread):
     def get_events_json(self):
         """Return a batch of events formatted for writing."""
         queue_seconds = QUEUE_BACKLOG_SECONDS + self.max_tries * RETRY_DELAY
+        max_size = min(max(BATCH_BUFFER_SIZE, self.queue.qsize()), BATCH_MAX_SIZE)
 
         count = 0
-        json = []
+        size = 0
+        lines = []
 
         dropped = 0
 
         try:
-            while len(json) < BATCH_BUFFER_SIZE and not self.shutdown:
+            while (
+                len(lines) < max_size and size < BATCH_MAX_BYTES and not self.shutdown
+            ):
                 timeout = None if count == 0 else self.batch_timeout()
                 item = self.queue.get(timeout=timeout)
                 count += 1
@@ -536,7 +701,9 @@ class InfluxThread(threading.Thread):
                     if age < queue_seconds:
                         event_json = self.event_to_json(event)
                         if event_json:
-                            json.append(event_json)
+                            line = self.encoder.encode(event_json)
+                            lines.append(line)
+                            size += len(line) + 1
                     else:
                         dropped += 1
 
@@ -546,37 +713,107 @@ class InfluxThread(threading.Thread):
         if dropped:
             _LOGGER.warning(CATCHING_UP_MESSAGE, dropped)
 
-        return count, json
+        return count, lines
+
+    def write_to_influxdb(self, lines):
+        """Write a batch of lines to influxdb, with retry.
 
-    def write_to_influxdb(self, json):
-        """Write preprocessed events to influxdb, with retry."""
+        Return if the batch was written or can never be written.
+        """
+        size = sum(len(line) + 1 for line in lines)
         for retry in range(self.max_tries + 1):
             try:
-                self.influx.write(json)
+                start = time.monotonic()
+                self.influx.write(lines)
+                latency = time.monotonic() - start
 
                 if self.write_errors:
                     _LOGGER.error(RESUMED_MESSAGE, self.write_errors)
                     self.write_errors = 0
 
-                _LOGGER.debug(WROTE_MESSAGE, len(json))
-                break
+                queue_depth = self.queue.qsize()
+                self.stats.update(
+                    queue_depth=queue_depth,
+                    batch_size=len(lines),
+                    batch_bytes=size,
+                    write_latency=latency,
+                )
+                _LOGGER.debug(WROTE_MESSAGE, len(lines), size, latency, queue_depth)
+                return True
             except ValueError as err:
                 _LOGGER.error(err)
-                break
+                return True
             except ConnectionError as err:
                 if retry < self.max_tries:
                     time.sleep(RETRY_DELAY)
                 else:
-                    if not self.write_errors:
+                    if not self.write_errors and not self.stats["backlog_bytes"]:
                         _LOGGER.error(err)
-                    self.write_errors += len(json)
+        return False
+
+    def save_backlog(self, lines):
+        """Append lines that could not be written to the backlog file."""
+        size = sum(len(line.encode("utf-8")) + 1 for line in lines)
+        if self.stats["backlog_bytes"] + size > BACKLOG_MAX_BYTES:
+            self.write_errors += len(lines)
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.backlog_path), exist_ok=True)
+            with open(self.backlog_path, "a", encoding="utf-8") as backlog:
+                backlog.write("".join(f"{line}\n" for line in lines))
+        except OSError as err:
+            _LOGGER.error(BACKLOG_ERROR, self.backlog_path, err)
+            self.write_errors += len(lines)
+            return
+
+        if not self.stats["backlog_bytes"]:
+            _LOGGER.warning(BACKLOG_MESSAGE, len(lines))
+        self.stats["backlog_bytes"] += size
+
+    def write_backlog(self):
+        """Write the backlog file to influxdb in batches."""
+        try:
+            with open(self.backlog_path, encoding="utf-8") as backlog:
+                lines = backlog.read().splitlines()
+        except FileNotFoundError:
+            lines = []
+        except OSError as err:
+            _LOGGER.error(BACKLOG_ERROR, self.backlog_path, err)
+            return
+
+        written = 0
+        while written < len(lines):
+            batch = lines[written : written + BATCH_MAX_SIZE]
+            if not self.write_to_influxdb(batch):
+                break
+            written += len(batch)
+
+        try:
+            if written < len(lines):
+                with open(self.backlog_path, "w", encoding="utf-8") as backlog:
+                    backlog.write("".join(f"{line}\n" for line in lines[written:]))
+                self.stats["backlog_bytes"] = os.path.getsize(self.backlog_path)
+            else:
+                os.remove(self.backlog_path)
+                self.stats["backlog_bytes"] = 0
+        except FileNotFoundError:
+            self.stats["backlog_bytes"] = 0
+        except OSError as err:
+            _LOGGER.error(BACKLOG_ERROR, self.backlog_path, err)
+
+        if written:
+            _LOGGER.warning(BACKLOG_WROTE_MESSAGE, written)
 
     def run(self):
         """Process incoming events."""
         while not self.shutdown:
-            count, json = self.get_events_json()
-            if json:
-                self.write_to_influxdb(json)
+            count, lines = self.get_events_json()
+            if lines:
+                if not self.write_to_influxdb(lines):
+                    self.save_backlog(lines)
+                elif self.stats["backlog_bytes"]:
+                    self.write_backlog()
             for _ in range(count):
                 self.queue.task_done()
 
@@ -31,6 +31,7 @@ CONF_COMPONENT_CONFIG_DOMAIN = "component_config_domain"
 CONF_RETRY_COUNT = "max_retries"
 CONF_IGNORE_ATTRIBUTES = "ignore_attributes"
 CONF_PRECISION = "precision"
+CONF_GZIP = "gzip"
 
 CONF_LANGUAGE = "language"
 CONF_QUERIES = "queries"
@@ -77,6 +78,10 @@ QUEUE_BACKLOG_SECONDS = 30
 RETRY_INTERVAL = 60  # seconds
 BATCH_TIMEOUT = 1
 BATCH_BUFFER_SIZE = 100
+BATCH_MAX_SIZE = 5000
+BATCH_MAX_BYTES = 1024 * 1024
+BACKLOG_FILE = "influxdb.backlog"
+BACKLOG_MAX_BYTES = 10 * 1024 * 1024
 LANGUAGE_INFLUXQL = "influxQL"
 LANGUAGE_FLUX = "flux"
 TEST_QUERY_V1 = "SHOW DATABASES;"
@@ -118,7 +123,10 @@ QUERY_ERROR = (
 RETRY_MESSAGE = f"%s Retrying in {RETRY_INTERVAL} seconds."
 CATCHING_UP_MESSAGE = "Catching up, dropped %d old events."
 RESUMED_MESSAGE = "Resumed, lost %d events."
-WROTE_MESSAGE = "Wrote %d events."
+WROTE_MESSAGE = "Wrote %d events (%d bytes) in %.3f seconds, %d events queued."
+BACKLOG_MESSAGE = "Saved %d events to be written once InfluxDB is available again."
+BACKLOG_WROTE_MESSAGE = "Wrote %d events saved while InfluxDB was unavailable."
+BACKLOG_ERROR = "Could not access the backlog file %s due to '%s'."
 RUNNING_QUERY_MESSAGE = "Running query: %s."
 QUERY_NO_RESULTS_MESSAGE = "Query returned no results, sensor state set to UNKNOWN: %s."
 QUERY_MULTIPLE_RESULTS_MESSAGE = (
@@ -140,6 +148,7 @@ COMPONENT_CONFIG_SCHEMA_CONNECTION = {
     vol.Optional(CONF_PORT): cv.port,
     vol.Optional(CONF_SSL): cv.boolean,
     vol.Optional(CONF_PRECISION): vol.In(["ms", "s", "us", "ns"]),
+    vol.Optional(CONF_GZIP, default=False): cv.boolean,
     # Connection config for V1 API only.
     vol.Inclusive(CONF_USERNAME, "authentication"): cv.string,
     vol.Inclusive(CONF_PASSWORD, "authentication"): cv.string,
@@ -2,13 +2,17 @@
 from datetime import timedelta
 from itertools import groupby
 import json
+import logging
 import re
 
+from aiohttp import hdrs, web
 import sqlalchemy
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import aliased
 from sqlalchemy.sql.expression import literal
 import voluptuous as vol
 
+from homeassistant.components import websocket_api
 from homeassistant.components.automation import EVENT_AUTOMATION_TRIGGERED
 from homeassistant.components.history import sqlalchemy_filter_from_include_exclude_conf
 from homeassistant.components.http import HomeAssistantView
@@ -26,12 +30,15 @@ from homeassistant.const import (
     ATTR_ICON,
     ATTR_NAME,
     ATTR_SERVICE,
+    ATTR_UNIT_OF_MEASUREMENT,
+    CONTENT_TYPE_JSON,
     EVENT_CALL_SERVICE,
     EVENT_HOMEASSISTANT_START,
     EVENT_HOMEASSISTANT_STOP,
     EVENT_LOGBOOK_ENTRY,
     EVENT_STATE_CHANGED,
     HTTP_BAD_REQUEST,
+    MATCH_ALL,
 )
 from homeassistant.core import DOMAIN as HA_DOMAIN, callback, split_entity_id
 from homeassistant.exceptions import InvalidEntityFormatError
@@ -44,6 +51,7 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.integration_platform import (
     async_process_integration_platforms,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.loader import bind_hass
 import homeassistant.util.dt as dt_util
 
@@ -58,10 +66,22 @@ CONF_DOMAINS = "domains"
 CONF_ENTITIES = "entities"
 CONTINUOUS_DOMAINS = ["proximity", "sensor"]
 
+_LOGGER = logging.getLogger(__name__)
+
 DOMAIN = "logbook"
+DATA_FILTERS = "logbook_filters"
 
 GROUP_BY_MINUTES = 15
 
+# Number of entries fetched at once when streaming a whole period
+STREAM_PAGE_SIZE = 1000
+
+# Maximum number of context ids looked up in a single query
+MAX_CONTEXT_IDS_PER_QUERY = 500
+
+# Number of recent contexts remembered to attribute live entries
+MAX_LIVE_CONTEXTS = 2048
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -88,6 +108,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -160,7 +181,9 @@ async def async_setup(hass, config):
         filters = None
         entities_filter = None
 
+    hass.data[DATA_FILTERS] = (filters, entities_filter)
     hass.http.register_view(LogbookView(conf, filters, entities_filter))
+    websocket_api.async_register_command(hass, websocket_event_stream)
 
     hass.services.async_register(DOMAIN, "log", log_message, schema=LOG_MESSAGE_SCHEMA)
 
@@ -229,25 +252,217 @@ class LogbookView(HomeAssistantView):
             if end_day is None:
                 return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
 
+        limit = request.query.get("limit")
+        if limit is not None:
+            try:
+                limit = int(limit)
+            except ValueError:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+            if limit < 1:
+                return self.json_message("Invalid limit", HTTP_BAD_REQUEST)
+
+        continuation = request.query.get("continuation")
+        if continuation is not None:
+            continuation = _parse_continuation(continuation)
+            if continuation is None:
+                return self.json_message("Invalid continuation", HTTP_BAD_REQUEST)
+
         hass = request.app["hass"]
 
         entity_matches_only = "entity_matches_only" in request.query
 
-        def json_events():
-            """Fetch events and generate JSON."""
-            return self.json(
-                _get_events(
-                    hass,
-                    start_day,
-                    end_day,
-                    entity_ids,
-                    self.filters,
-                    self.entities_filter,
-                    entity_matches_only,
+        def fetch_page(page_limit, page_continuation):
+            """Fetch a page of events."""
+            return _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                page_limit,
+                page_continuation,
+            )
+
+        if limit is not None:
+
+            def json_page():
+                """Fetch a page of events and generate JSON."""
+                entries, next_continuation = fetch_page(limit, continuation)
+                response = self.json(entries)
+                if next_continuation is not None:
+                    next_url = request.url.update_query(
+                        continuation=_continuation_token(next_continuation)
+                    )
+                    response.headers[hdrs.LINK] = f'<{next_url}>; rel="next"'
+                return response
+
+            return await hass.async_add_executor_job(json_page)
+
+        def json_page_fragment(page_continuation):
+            """Fetch a page of events and generate the JSON of its entries."""
+            entries, next_continuation = fetch_page(STREAM_PAGE_SIZE, page_continuation)
+            fragment = json.dumps(entries, cls=JSONEncoder, allow_nan=False)[1:-1]
+            return fragment.encode("UTF-8"), next_continuation
+
+        # The first page is fetched before anything is sent, so errors still
+        # result in an error response and short periods are not streamed.
+        fragment, continuation = await hass.async_add_executor_job(
+            json_page_fragment, continuation
+        )
+        if continuation is None:
+            return web.Response(
+                body=b"[" + fragment + b"]", content_type=CONTENT_TYPE_JSON
+            )
+
+        # Stream the period page by page so the full result is never in memory
+        response = web.StreamResponse(headers={hdrs.CONTENT_TYPE: CONTENT_TYPE_JSON})
+        await response.prepare(request)
+        await response.write(b"[" + fragment)
+        separator = b"," if fragment else b""
+        while continuation is not None:
+            try:
+                fragment, continuation = await hass.async_add_executor_job(
+                    json_page_fragment, continuation
                 )
+            except SQLAlchemyError:
+                _LOGGER.exception("Error fetching logbook events")
+                # The status is already sent, end the response without closing
+                # the array so clients can tell that it is incomplete.
+                await response.write_eof()
+                return response
+            if fragment:
+                await response.write(separator + fragment)
+                separator = b","
+        await response.write(b"]")
+        await response.write_eof()
+        return response
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "logbook/event_stream",
+        vol.Required("start_time"): str,
+        vol.Optional("entity_ids"): cv.entity_ids,
+    }
+)
+@websocket_api.async_response
+async def websocket_event_stream(hass, connection, msg):
+    """Handle logbook event stream subscriptions.
+
+    The entries since start_time are sent once from the database, after that
+    new entries are created from the event bus as they happen.
+    """
+    start_day = dt_util.parse_datetime(msg["start_time"])
+    if start_day is None:
+        connection.send_error(msg["id"], "invalid_start_time", "Invalid start_time")
+        return
+    start_day = dt_util.as_utc(start_day)
+
+    entity_ids = msg.get("entity_ids")
+    filters, entities_filter = hass.data[DATA_FILTERS]
+    live_logbook = LiveLogbook(
+        hass,
+        generate_filter([], entity_ids, [], [])
+        if entity_ids is not None
+        else entities_filter,
+    )
+    # Events fired while the history is fetched are sent after it
+    pending = []
+
+    @callback
+    def _forward_event(event):
+        """Forward the logbook entries of an event."""
+        if pending is not None:
+            pending.append(event)
+            return
+        entries = live_logbook.async_humanify(event)
+        if entries:
+            connection.send_message(
+                websocket_api.messages.event_message(msg["id"], entries)
             )
 
-        return await hass.async_add_executor_job(json_events)
+    connection.subscriptions[msg["id"]] = hass.bus.async_listen(
+        MATCH_ALL, _forward_event
+    )
+    connection.send_result(msg["id"])
+
+    entries = await hass.async_add_executor_job(
+        _get_events,
+        hass,
+        start_day,
+        dt_util.utcnow(),
+        entity_ids,
+        filters,
+        entities_filter,
+    )
+    connection.send_message(websocket_api.messages.event_message(msg["id"], entries))
+
+    events, pending = pending, None
+    for event in events:
+        _forward_event(event)
+
+
+class LiveLogbook:
+    """Create logbook entries of events on the event bus as they happen.
+
+    Entries are created without the database, so only contexts seen since
+    the subscription started are used to attribute entries. Events are not
+    grouped with events of the same GROUP_BY_MINUTES group.
+    """
+
+    def __init__(self, hass, entities_filter):
+        """Init the live logbook."""
+        self.hass = hass
+        self.entities_filter = entities_filter
+        self.entity_attr_cache = EntityAttributeCache(hass)
+        self.context_lookup = {}
+
+    @callback
+    def async_humanify(self, event):
+        """Return the logbook entries of an event."""
+        event_type = event.event_type
+        if event_type == EVENT_STATE_CHANGED:
+            if not self._keep_state_change(event):
+                return []
+        elif (
+            event_type not in ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+            and event_type not in self.hass.data[DOMAIN]
+        ):
+            return []
+
+        lazy_event = LiveEventPartialState(event)
+        context_lookup = self.context_lookup
+        if lazy_event.context_id not in context_lookup:
+            if len(context_lookup) >= MAX_LIVE_CONTEXTS:
+                del context_lookup[next(iter(context_lookup))]
+            context_lookup[lazy_event.context_id] = lazy_event
+
+        if event_type == EVENT_CALL_SERVICE or not (
+            event_type == EVENT_STATE_CHANGED
+            or _keep_event(self.hass, lazy_event, self.entities_filter)
+        ):
+            return []
+
+        return list(
+            humanify(self.hass, [lazy_event], self.entity_attr_cache, context_lookup)
+        )
+
+    def _keep_state_change(self, event):
+        """Return if a state change is logged, like the logbook query does."""
+        old_state = event.data.get("old_state")
+        new_state = event.data.get("new_state")
+        if old_state is None or new_state is None:
+            return False
+        if old_state.state == new_state.state:
+            return False
+        if (
+            new_state.domain in CONTINUOUS_DOMAINS
+            and ATTR_UNIT_OF_MEASUREMENT in new_state.attributes
+        ):
+            return False
+        return self.entities_filter is None or self.entities_filter(new_state.entity_id)
 
 
 def humanify(hass, events, entity_attr_cache, context_lookup):
@@ -421,63 +636,206 @@ def _get_events(
     entity_matches_only=False,
 ):
     """Get events for a period of time."""
+    entries, _ = _get_events_page(
+        hass,
+        start_day,
+        end_day,
+        entity_ids,
+        filters,
+        entities_filter,
+        entity_matches_only,
+    )
+    return entries
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    limit=None,
+    continuation=None,
+):
+    """Get a page of events for a period of time.
+
+    Continuations are the time fired and event id of the last event of the
+    previous page. Returns the entries and the continuation of the next page,
+    which is None once the end of the period is reached. A page only ends between two
+    GROUP_BY_MINUTES groups so paging does not change how events are grouped.
+    """
 
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
-
-    def yield_events(query):
-        """Yield Events that are not filtered away."""
-        for row in query.yield_per(1000):
-            event = LazyEventPartialState(row)
-            context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
-                yield event
+    events = []
+    next_continuation = None
 
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
+        query = _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+        )
+        page_query = query
+        if continuation is not None:
+            page_query = page_query.filter(_after_continuation_matcher(*continuation))
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
-            )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
+        last_row = None
+        last_group = None
+        for row in page_query.yield_per(1000):
+            event = LazyEventPartialState(row)
+            if event.event_type == EVENT_CALL_SERVICE or not (
+                event.event_type == EVENT_STATE_CHANGED
+                or _keep_event(hass, event, entities_filter)
+            ):
+                context_lookup.setdefault(event.context_id, event)
+                last_row = row
+                continue
+
+            group = event.time_fired_minute // GROUP_BY_MINUTES
+            if limit is not None and len(events) >= limit and group != last_group:
+                next_continuation = (last_row.time_fired, last_row.event_id)
+                break
+
+            context_lookup.setdefault(event.context_id, event)
+            events.append(event)
+            last_row = row
+            last_group = group
+
+        if continuation is not None:
+            # Contexts can start before the page, look up where they started
+            context_lookup.update(
+                _get_context_events_before(
+                    hass,
+                    session,
+                    start_day,
+                    continuation,
+                    [context_id for context_id in context_lookup if context_id],
                 )
             )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
+
+    return (
+        list(humanify(hass, events, entity_attr_cache, context_lookup)),
+        next_continuation,
+    )
+
+
+def _generate_logbook_query(
+    hass, session, start_day, end_day, entity_ids, filters, entity_matches_only
+):
+    """Generate the query for the logbook events of a period of time."""
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        query = query.union_all(
+            _generate_states_query(session, start_day, end_day, old_state, entity_ids)
+        )
+    else:
+        query = _generate_events_query(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+            (States.last_updated == States.last_changed)
+            | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+        if filters:
+            query = query.filter(
+                filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
             )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
 
-        query = query.order_by(Events.time_fired)
+    return query.order_by(Events.time_fired, Events.event_id)
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+
+def _get_context_events_before(hass, session, start_day, continuation, context_ids):
+    """Return the first events of contexts that started before a page.
+
+    Only the events table is queried, in batches of context ids. The state
+    columns of contexts started by a state change are looked up afterwards
+    by event id.
+    """
+    context_events = {}
+    state_changed_ids = []
+
+    for idx in range(0, len(context_ids), MAX_CONTEXT_IDS_PER_QUERY):
+        query = (
+            _generate_events_query_without_states(session)
+            .filter(
+                Events.context_id.in_(
+                    context_ids[idx : idx + MAX_CONTEXT_IDS_PER_QUERY]
+                )
+            )
+            .filter(Events.time_fired >= start_day)
+            .filter(sqlalchemy.not_(_after_continuation_matcher(*continuation)))
         )
+        query = _apply_event_types_filter(hass, query, ALL_EVENT_TYPES)
+        for row in query.order_by(Events.time_fired, Events.event_id):
+            if row.context_id in context_events:
+                continue
+            context_events[row.context_id] = row
+            if row.event_type == EVENT_STATE_CHANGED:
+                state_changed_ids.append(row.event_id)
+
+    for idx in range(0, len(state_changed_ids), MAX_CONTEXT_IDS_PER_QUERY):
+        query = (
+            _generate_events_query(session)
+            .filter(States.event_id == Events.event_id)
+            .filter(
+                Events.event_id.in_(
+                    state_changed_ids[idx : idx + MAX_CONTEXT_IDS_PER_QUERY]
+                )
+            )
+        )
+        for row in query:
+            context_events[row.context_id] = row
+
+    return {
+        context_id: LazyEventPartialState(row)
+        for context_id, row in context_events.items()
+    }
+
+
+def _continuation_token(continuation):
+    """Return the token of a continuation, parsed by _parse_continuation."""
+    time_fired, event_id = continuation
+    return f"{process_timestamp_to_utc_isoformat(time_fired)}_{event_id}"
+
+
+def _parse_continuation(token):
+    """Parse a continuation token into time fired and event id."""
+    time_fired, _, event_id = token.rpartition("_")
+    time_fired = dt_util.parse_datetime(time_fired)
+    if time_fired is None or not event_id.isdigit():
+        return None
+    return dt_util.as_utc(time_fired), int(event_id)
+
+
+def _after_continuation_matcher(time_fired, event_id):
+    """Match events after the event a continuation token points at.
+
+    Events are ordered by time fired and event id, so events fired at the
+    same time are told apart by their id.
+    """
+    return (Events.time_fired > time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id > event_id)
+    )
 
 
 def _generate_events_query(session):
@@ -750,6 +1108,74 @@ class LazyEventPartialState:
         return self._time_fired_isoformat
 
 
+class LiveEventPartialState:
+    """An event from the event bus with the interface of LazyEventPartialState."""
+
+    __slots__ = [
+        "_time_fired",
+        "_time_fired_isoformat",
+        "attributes",
+        "data",
+        "event_type",
+        "entity_id",
+        "state",
+        "domain",
+        "context_id",
+        "context_user_id",
+        "time_fired_minute",
+    ]
+
+    def __init__(self, event):
+        """Init the event."""
+        self._time_fired = event.time_fired
+        self._time_fired_isoformat = None
+        self.event_type = event.event_type
+        self.context_id = event.context.id
+        self.context_user_id = event.context.user_id
+        self.time_fired_minute = event.time_fired.minute
+
+        new_state = None
+        if event.event_type == EVENT_STATE_CHANGED:
+            new_state = event.data.get("new_state")
+
+        if new_state is None:
+            self.data = event.data
+            self.attributes = {}
+            self.entity_id = self.state = self.domain = None
+        else:
+            # Like the database, the state holds the data of state changes
+            self.data = {}
+            self.attributes = new_state.attributes
+            self.entity_id = new_state.entity_id
+            self.state = new_state.state
+            self.domain = new_state.domain
+
+    @property
+    def attributes_icon(self):
+        """Icon of the state."""
+        return self.attributes.get(ATTR_ICON)
+
+    @property
+    def data_entity_id(self):
+        """Entity id of the event data."""
+        return self.data.get(ATTR_ENTITY_ID)
+
+    @property
+    def data_domain(self):
+        """Domain of the event data."""
+        return self.data.get(ATTR_DOMAIN)
+
+    @property
+    def time_fired_isoformat(self):
+        """Time event was fired in utc isoformat."""
+        if not self._time_fired_isoformat:
+            self._time_fired_isoformat = process_timestamp_to_utc_isoformat(
+                self._time_fired
+            )
+
+        return self._time_fired_isoformat
+
+
 class EntityAttributeCache:
     """A cache to lookup static entity_id attribute.
 
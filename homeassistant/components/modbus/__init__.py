@@ -1,8 +1,12 @@
 """Support for Modbus."""
+from collections import defaultdict
 import logging
 import threading
+import time
 
 from pymodbus.client.sync import ModbusSerialClient, ModbusTcpClient, ModbusUdpClient
+from pymodbus.exceptions import ModbusException
+from pymodbus.pdu import ExceptionResponse
 from pymodbus.transaction import ModbusRtuFramer
 import voluptuous as vol
 
@@ -34,6 +38,7 @@ from .const import (
     ATTR_UNIT,
     ATTR_VALUE,
     CALL_TYPE_COIL,
+    CALL_TYPE_DISCRETE,
     CALL_TYPE_REGISTER_HOLDING,
     CALL_TYPE_REGISTER_INPUT,
     CONF_BAUDRATE,
@@ -68,6 +73,9 @@ from .const import (
     DEFAULT_HUB,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SLAVE,
+    MAX_READ_BITS,
+    MAX_READ_GAP,
+    MAX_READ_REGISTERS,
     DEFAULT_STRUCTURE_PREFIX,
     DEFAULT_TEMP_UNIT,
     MODBUS_DOMAIN as DOMAIN,
@@ -261,6 +269,14 @@ class ModbusHub:
         # generic configuration
         self._client = None
         self._lock = threading.Lock()
+        # Planned reads and the blocks they are combined into, the blocks are
+        # replaced as a whole so reads do not need the plan lock
+        self._plan_lock = threading.Lock()
+        self._planned_reads = []
+        self._blocks = {}
+        # Number of requests, total seconds spent on them and number of reads
+        # served from the result of another read
+        self.stats = {"requests": 0, "request_time": 0.0, "reads_combined": 0}
         self._config_name = client_config[CONF_NAME]
         self._config_type = client_config[CONF_TYPE]
         self._config_port = client_config[CONF_PORT]
@@ -338,27 +354,136 @@ class ModbusHub:
 
     def read_coils(self, unit, address, count):
         """Read coils."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_coils(address, count, **kwargs)
+        return self._read(CALL_TYPE_COIL, unit, address, count)
 
     def read_discrete_inputs(self, unit, address, count):
         """Read discrete inputs."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_discrete_inputs(address, count, **kwargs)
+        return self._read(CALL_TYPE_DISCRETE, unit, address, count)
 
     def read_input_registers(self, unit, address, count):
         """Read input registers."""
-        with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_input_registers(address, count, **kwargs)
+        return self._read(CALL_TYPE_REGISTER_INPUT, unit, address, count)
 
     def read_holding_registers(self, unit, address, count):
         """Read holding registers."""
+        return self._read(CALL_TYPE_REGISTER_HOLDING, unit, address, count)
+
+    def add_read(self, call_type, unit, address, count, scan_interval):
+        """Plan a read that is repeated every scan interval.
+
+        Planned reads of the same unit, call type and scan interval that are
+        close to each other are combined into a single request. Returns a
+        function that removes the read from the plan.
+
+        Planning does not wait for the bus, so this can be called from the
+        event loop.
+        """
+        read = (call_type, unit, address, count, scan_interval)
+        with self._plan_lock:
+            self._planned_reads.append(read)
+            self._plan_blocks()
+
+        def remove_read():
+            """Remove the read from the plan."""
+            with self._plan_lock:
+                self._planned_reads.remove(read)
+                self._plan_blocks()
+
+        return remove_read
+
+    def _plan_blocks(self):
+        """Combine the planned reads into the blocks that are requested."""
+        groups = defaultdict(list)
+        for call_type, unit, address, count, scan_interval in self._planned_reads:
+            groups[(call_type, unit, scan_interval)].append((address, count))
+
+        blocks = defaultdict(list)
+        for (call_type, unit, scan_interval), reads in groups.items():
+            if call_type in (CALL_TYPE_COIL, CALL_TYPE_DISCRETE):
+                max_count = MAX_READ_BITS
+            else:
+                max_count = MAX_READ_REGISTERS
+            # Results are reused within half a scan interval
+            max_age = scan_interval.total_seconds() / 2
+            combined = []
+            for address, count in sorted(reads):
+                if combined:
+                    start, end, members = combined[-1]
+                    if (
+                        address - end <= MAX_READ_GAP
+                        and max(end, address + count) - start <= max_count
+                    ):
+                        combined[-1] = (start, max(end, address + count), members + 1)
+                        continue
+                combined.append((address, address + count, 1))
+
+            # A block of a single read has nothing to share
+            blocks[(call_type, unit)].extend(
+                _ReadBlock(start, end - start, max_age)
+                for start, end, members in combined
+                if members > 1
+            )
+
+        self._blocks = dict(blocks)
+
+    def _read(self, call_type, unit, address, count):
+        """Read from a planned block, or directly if no block covers it."""
+        blocks = self._blocks.get((call_type, unit), ())
         with self._lock:
-            kwargs = {"unit": unit} if unit else {}
-            return self._client.read_holding_registers(address, count, **kwargs)
+            block = next(
+                (
+                    block
+                    for block in blocks
+                    if block.address <= address
+                    and address + count <= block.address + block.count
+                    and not block.failed
+                ),
+                None,
+            )
+            if block is None:
+                return self._request(call_type, unit, address, count)
+
+            now = time.monotonic()
+            if block.result is None or now - block.read_at > block.max_age:
+                result = self._request(call_type, unit, block.address, block.count)
+                if isinstance(result, (ModbusException, ExceptionResponse)):
+                    if block.count == count:
+                        return result
+                    # The device may not allow reading the unused part
+                    _LOGGER.debug(
+                        "Reading %s %s-%s of unit %s failed, reading separately",
+                        call_type,
+                        block.address,
+                        block.address + block.count - 1,
+                        unit,
+                    )
+                    block.failed = True
+                    return self._request(call_type, unit, address, count)
+                block.result = result
+                block.read_at = now
+            else:
+                self.stats["reads_combined"] += 1
+
+            return _ReadResult(block.result, address - block.address, count)
+
+    def _request(self, call_type, unit, address, count):
+        """Send a read request to the device."""
+        kwargs = {"unit": unit} if unit else {}
+        if call_type == CALL_TYPE_COIL:
+            request = self._client.read_coils
+        elif call_type == CALL_TYPE_DISCRETE:
+            request = self._client.read_discrete_inputs
+        elif call_type == CALL_TYPE_REGISTER_INPUT:
+            request = self._client.read_input_registers
+        else:
+            request = self._client.read_holding_registers
+
+        start = time.monotonic()
+        try:
+            return request(address, count, **kwargs)
+        finally:
+            self.stats["requests"] += 1
+            self.stats["request_time"] += time.monotonic() - start
 
     def write_coil(self, unit, address, value):
         """Write coil."""
@@ -377,3 +502,36 @@ class ModbusHub:
         with self._lock:
             kwargs = {"unit": unit} if unit else {}
             self._client.write_registers(address, values, **kwargs)
+
+
+class _ReadBlock:
+    """Represent registers or bits that are read with one request."""
+
+    def __init__(self, address, count, max_age):
+        """Initialize the block."""
+        self.address = address
+        self.count = count
+        self.max_age = max_age
+        self.result = None
+        self.read_at = None
+        self.failed = False
+
+
+class _ReadResult:
+    """Represent the part of a block read that was asked for."""
+
+    def __init__(self, result, offset, count):
+        """Initialize the result."""
+        self._result = result
+        self._offset = offset
+        self._count = count
+
+    @property
+    def registers(self):
+        """Return the registers read."""
+        return self._result.registers[self._offset : self._offset + self._count]
+
+    @property
+    def bits(self):
+        """Return the bits read."""
+        return self._result.bits[self._offset : self._offset + self._count]
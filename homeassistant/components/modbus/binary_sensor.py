@@ -84,6 +84,18 @@ class ModbusBinarySensor(BinarySensorEntity):
         self._value = None
         self._available = True
 
+    async def async_added_to_hass(self):
+        """Plan the reads of the sensor with the hub."""
+        self.async_on_remove(
+            self._hub.add_read(
+                self._input_type,
+                self._slave,
+                self._address,
+                1,
+                self.platform.scan_interval,
+            )
+        )
+
     @property
     def name(self):
         """Return the name of the sensor."""
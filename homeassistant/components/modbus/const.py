@@ -47,6 +47,9 @@ ATTR_VALUE = "value"
 SERVICE_WRITE_COIL = "write_coil"
 SERVICE_WRITE_REGISTER = "write_register"
 DEFAULT_SCAN_INTERVAL = 15  # seconds
+MAX_READ_BITS = 2000  # Maximum coils or discrete inputs in one request
+MAX_READ_REGISTERS = 125  # Maximum registers in one request
+MAX_READ_GAP = 8  # Unused registers or bits read to save a request
 
 # binary_sensor.py
 CONF_INPUTS = "inputs"
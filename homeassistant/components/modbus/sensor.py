@@ -196,6 +196,15 @@ class ModbusRegisterSensor(RestoreEntity):
 
     async def async_added_to_hass(self):
         """Handle entity which will be added."""
+        self.async_on_remove(
+            self._hub.add_read(
+                self._register_type,
+                self._slave,
+                self._register,
+                self._count,
+                self.platform.scan_interval,
+            )
+        )
         state = await self.async_get_last_state()
         if not state:
             return
@@ -1,8 +1,10 @@
 """Support for Prometheus metrics export."""
+import gzip
 import logging
 import string
+import threading
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import prometheus_client
 import voluptuous as vol
 
@@ -79,8 +81,6 @@ CONFIG_SCHEMA = vol.Schema(
 
 def setup(hass, config):
     """Activate Prometheus component."""
-    hass.http.register_view(PrometheusView(prometheus_client))
-
     conf = config[DOMAIN]
     entity_filter = conf[CONF_FILTER]
     namespace = conf.get(CONF_PROM_NAMESPACE)
@@ -103,12 +103,18 @@ def setup(hass, config):
         default_metric,
     )
 
+    hass.http.register_view(PrometheusView(metrics))
     hass.bus.listen(EVENT_STATE_CHANGED, metrics.handle_event)
     return True
 
 
 class PrometheusMetrics:
-    """Model all of the metrics which should be exposed to Prometheus."""
+    """Model all of the metrics which should be exposed to Prometheus.
+
+    Metrics are kept in their own registry. The exposition of each metric is
+    rendered once and cached until one of its series changes, so a scrape
+    only renders the metrics that changed since the previous scrape.
+    """
 
     def __init__(
         self,
@@ -140,44 +146,89 @@ class PrometheusMetrics:
             self.metrics_prefix = ""
         self._metrics = {}
         self._climate_units = climate_units
+        self._registry = prometheus_cli.CollectorRegistry(auto_describe=True)
+        # Label values of each entity, with the friendly name they were made for
+        self._labels_cache = {}
+        # Metrics updated by the event being handled
+        self._touched = []
+        self._lock = threading.Lock()
+        self._dirty = set()
+        self._rendered = {}
+        self._domain_handlers = {
+            name[len("_handle_") :]: getattr(self, name)
+            for name in dir(self)
+            if name.startswith("_handle_") and name != "_handle_attributes"
+        }
 
+    @hacore.callback
     def handle_event(self, event):
         """Listen for new messages on the bus, and add them to Prometheus."""
         state = event.data.get("new_state")
         if state is None:
+            self._labels_cache.pop(event.data.get("entity_id"), None)
             return
 
         entity_id = state.entity_id
         _LOGGER.debug("Handling state update for %s", entity_id)
-        domain, _ = hacore.split_entity_id(entity_id)
 
         if not self._filter(state.entity_id):
             return
 
-        handler = f"_handle_{domain}"
+        try:
+            self._handle_state(state)
+        finally:
+            with self._lock:
+                self._dirty.update(self._touched)
+            self._touched.clear()
 
-        if hasattr(self, handler) and state.state != STATE_UNAVAILABLE:
-            getattr(self, handler)(state)
+    def _handle_state(self, state):
+        handler = self._domain_handlers.get(state.domain)
+
+        if handler is not None and state.state != STATE_UNAVAILABLE:
+            handler(state)
 
         labels = self._labels(state)
         state_change = self._metric(
             "state_change", self.prometheus_cli.Counter, "The number of state changes"
         )
-        state_change.labels(**labels).inc()
+        state_change.labels(*labels).inc()
 
         entity_available = self._metric(
             "entity_available",
             self.prometheus_cli.Gauge,
             "Entity is available (not in the unavailable state)",
         )
-        entity_available.labels(**labels).set(float(state.state != STATE_UNAVAILABLE))
+        entity_available.labels(*labels).set(float(state.state != STATE_UNAVAILABLE))
 
         last_updated_time_seconds = self._metric(
             "last_updated_time_seconds",
             self.prometheus_cli.Gauge,
             "The last_updated timestamp",
         )
-        last_updated_time_seconds.labels(**labels).set(state.last_updated.timestamp())
+        last_updated_time_seconds.labels(*labels).set(state.last_updated.timestamp())
+
+    def generate_latest(self):
+        """Return the exposition of all metrics, rendering changed ones only.
+
+        This method needs to run in an executor.
+        """
+        with self._lock:
+            dirty = self._dirty
+            self._dirty = set()
+            metrics = list(self._metrics.items())
+
+        for name in dirty:
+            # Metrics are collectors themselves
+            self._rendered[name] = self.prometheus_cli.generate_latest(
+                self._metrics[name]
+            )
+
+        return b"".join(
+            [
+                self.prometheus_cli.generate_latest(self.prometheus_cli.REGISTRY),
+                *(self._rendered.get(name, b"") for name, _ in metrics),
+            ]
+        )
 
     def _handle_attributes(self, state):
         for key, value in state.attributes.items():
@@ -189,23 +240,29 @@ class PrometheusMetrics:
 
             try:
                 value = float(value)
-                metric.labels(**self._labels(state)).set(value)
+                metric.labels(*self._labels(state)).set(value)
             except (ValueError, TypeError):
                 pass
 
     def _metric(self, metric, factory, documentation, extra_labels=None):
-        labels = ["entity", "friendly_name", "domain"]
-        if extra_labels is not None:
-            labels.extend(extra_labels)
+        self._touched.append(metric)
 
         try:
             return self._metrics[metric]
         except KeyError:
-            full_metric_name = self._sanitize_metric_name(
-                f"{self.metrics_prefix}{metric}"
-            )
-            self._metrics[metric] = factory(full_metric_name, documentation, labels)
-            return self._metrics[metric]
+            pass
+
+        labels = ["entity", "friendly_name", "domain"]
+        if extra_labels is not None:
+            labels.extend(extra_labels)
+
+        full_metric_name = self._sanitize_metric_name(f"{self.metrics_prefix}{metric}")
+        new_metric = factory(
+            full_metric_name, documentation, labels, registry=self._registry
+        )
+        with self._lock:
+            self._metrics[metric] = new_metric
+        return new_metric
 
     @staticmethod
     def _sanitize_metric_name(metric: str) -> str:
@@ -231,13 +288,16 @@ class PrometheusMetrics:
             value = 0
         return value
 
-    @staticmethod
-    def _labels(state):
-        return {
-            "entity": state.entity_id,
-            "domain": state.domain,
-            "friendly_name": state.attributes.get(ATTR_FRIENDLY_NAME),
-        }
+    def _labels(self, state):
+        """Return the values of the entity, friendly_name and domain labels."""
+        friendly_name = state.attributes.get(ATTR_FRIENDLY_NAME)
+        cached = self._labels_cache.get(state.entity_id)
+        if cached is None or cached[1] != friendly_name:
+            cached = self._labels_cache[state.entity_id] = (
+                (state.entity_id, friendly_name, state.domain),
+                friendly_name,
+            )
+        return cached[0]
 
     def _battery(self, state):
         if "battery_level" in state.attributes:
@@ -248,7 +308,7 @@ class PrometheusMetrics:
             )
             try:
                 value = float(state.attributes[ATTR_BATTERY_LEVEL])
-                metric.labels(**self._labels(state)).set(value)
+                metric.labels(*self._labels(state)).set(value)
             except ValueError:
                 pass
 
@@ -259,7 +319,7 @@ class PrometheusMetrics:
             "State of the binary sensor (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.labels(*self._labels(state)).set(value)
 
     def _handle_input_boolean(self, state):
         metric = self._metric(
@@ -268,7 +328,7 @@ class PrometheusMetrics:
             "State of the input boolean (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.labels(*self._labels(state)).set(value)
 
     def _handle_device_tracker(self, state):
         metric = self._metric(
@@ -277,14 +337,14 @@ class PrometheusMetrics:
             "State of the device tracker (0/1)",
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.labels(*self._labels(state)).set(value)
 
     def _handle_person(self, state):
         metric = self._metric(
             "person_state", self.prometheus_cli.Gauge, "State of the person (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.labels(*self._labels(state)).set(value)
 
     def _handle_light(self, state):
         metric = self._metric(
@@ -297,7 +357,7 @@ class PrometheusMetrics:
             else:
                 value = self.state_as_number(state)
             value = value * 100
-            metric.labels(**self._labels(state)).set(value)
+            metric.labels(*self._labels(state)).set(value)
         except ValueError:
             pass
 
@@ -306,7 +366,7 @@ class PrometheusMetrics:
             "lock_state", self.prometheus_cli.Gauge, "State of the lock (0/1)"
         )
         value = self.state_as_number(state)
-        metric.labels(**self._labels(state)).set(value)
+        metric.labels(*self._labels(state)).set(value)
 
     def _handle_climate(self, state):
         temp = state.attributes.get(ATTR_TEMPERATURE)
@@ -318,7 +378,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(temp)
+            metric.labels(*self._labels(state)).set(temp)
 
         current_temp = state.attributes.get(ATTR_CURRENT_TEMPERATURE)
         if current_temp:
@@ -329,7 +389,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Current Temperature in degrees Celsius",
             )
-            metric.labels(**self._labels(state)).set(current_temp)
+            metric.labels(*self._labels(state)).set(current_temp)
 
         current_action = state.attributes.get(ATTR_HVAC_ACTION)
         if current_action:
@@ -340,7 +400,7 @@ class PrometheusMetrics:
                 ["action"],
             )
             for action in CURRENT_HVAC_ACTIONS:
-                metric.labels(**dict(self._labels(state), action=action)).set(
+                metric.labels(*self._labels(state), action).set(
                     float(action == current_action)
                 )
 
@@ -352,7 +412,7 @@ class PrometheusMetrics:
                 self.prometheus_cli.Gauge,
                 "Target Relative Humidity",
             )
-            metric.labels(**self._labels(state)).set(humidifier_target_humidity_percent)
+            metric.labels(*self._labels(state)).set(humidifier_target_humidity_percent)
 
         metric = self._metric(
             "humidifier_state",
@@ -361,7 +421,7 @@ class PrometheusMetrics:
         )
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            metric.labels(*self._labels(state)).set(value)
         except ValueError:
             pass
 
@@ -375,7 +435,7 @@ class PrometheusMetrics:
                 ["mode"],
             )
             for mode in available_modes:
-                metric.labels(**dict(self._labels(state), mode=mode)).set(
+                metric.labels(*self._labels(state), mode).set(
                     float(mode == current_mode)
                 )
 
@@ -396,7 +456,7 @@ class PrometheusMetrics:
                 value = self.state_as_number(state)
                 if unit == TEMP_FAHRENHEIT:
                     value = fahrenheit_to_celsius(value)
-                _metric.labels(**self._labels(state)).set(value)
+                _metric.labels(*self._labels(state)).set(value)
             except ValueError:
                 pass
 
@@ -454,7 +514,7 @@ class PrometheusMetrics:
 
         try:
             value = self.state_as_number(state)
-            metric.labels(**self._labels(state)).set(value)
+            metric.labels(*self._labels(state)).set(value)
         except ValueError:
             pass
 
@@ -470,7 +530,7 @@ class PrometheusMetrics:
             "Count of times an automation has been triggered",
         )
 
-        metric.labels(**self._labels(state)).inc()
+        metric.labels(*self._labels(state)).inc()
 
 
 class PrometheusView(HomeAssistantView):
@@ -479,15 +539,28 @@ class PrometheusView(HomeAssistantView):
     url = API_ENDPOINT
     name = "api:prometheus"
 
-    def __init__(self, prometheus_cli):
+    def __init__(self, metrics):
         """Initialize Prometheus view."""
-        self.prometheus_cli = prometheus_cli
+        self.metrics = metrics
 
     async def get(self, request):
         """Handle request for Prometheus metrics."""
         _LOGGER.debug("Received Prometheus metrics request")
 
-        return web.Response(
-            body=self.prometheus_cli.generate_latest(),
+        use_gzip = "gzip" in request.headers.get(hdrs.ACCEPT_ENCODING, "")
+
+        def generate_body():
+            """Generate the (compressed) exposition."""
+            body = self.metrics.generate_latest()
+            if use_gzip:
+                body = gzip.compress(body, compresslevel=1)
+            return body
+
+        response = web.Response(
+            body=await request.app["hass"].async_add_executor_job(generate_body),
             content_type=CONTENT_TYPE_TEXT_PLAIN,
         )
+        response.headers[hdrs.VARY] = hdrs.ACCEPT_ENCODING
+        if use_gzip:
+            response.headers[hdrs.CONTENT_ENCODING] = "gzip"
+        return response
@@ -0,0 +1,196 @@
+"""Load recorded states of many entities at once."""
+import asyncio
+from datetime import timedelta
+import json
+import logging
+from typing import Dict, List, Optional, Tuple
+
+import attr
+from sqlalchemy import literal, null, select, union_all
+
+from homeassistant.core import HomeAssistant, callback
+import homeassistant.util.dt as dt_util
+
+from .models import States, process_timestamp
+from .util import session_scope
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PRELOADER = "recorder_preloader"
+# Keep compound queries well below the limit of SQLite
+MAX_REQUESTS_PER_QUERY = 100
+
+
+@attr.s(slots=True, frozen=True)
+class PreloadRequest:
+    """Describe the recorded states requested for an entity."""
+
+    entity_id: str = attr.ib()
+    # Number of most recent states to load
+    sample_size: Optional[int] = attr.ib()
+    # Only load states that are no older than max_age
+    max_age: Optional[timedelta] = attr.ib()
+    # Only load states where the state changed, not just the attributes
+    changes_only: bool = attr.ib()
+    # Load the attributes of the states
+    attributes: bool = attr.ib()
+
+
+class RecordedState:
+    """A recorded state with only the columns needed to replay history."""
+
+    __slots__ = ["state", "last_updated", "_attributes", "_attributes_json"]
+
+    def __init__(self, state, last_updated, attributes_json=None):
+        """Initialize the recorded state."""
+        self.state = state
+        self.last_updated = last_updated
+        self._attributes_json = attributes_json
+        self._attributes = None
+
+    @property
+    def attributes(self):
+        """Return the attributes, decoded on first access."""
+        if self._attributes is None:
+            try:
+                self._attributes = json.loads(self._attributes_json or "{}")
+            except ValueError:
+                _LOGGER.exception("Error decoding attributes of %s", self)
+                self._attributes = {}
+        return self._attributes
+
+    def __copy__(self):
+        """Return a copy of the state."""
+        copied = RecordedState(self.state, self.last_updated, self._attributes_json)
+        copied._attributes = self._attributes  # pylint: disable=protected-access
+        return copied
+
+    def __repr__(self):
+        """Return the representation of the state."""
+        return f"<RecordedState {self.state} @ {self.last_updated}>"
+
+
+class StatesPreloader:
+    """Collect requests for recorded states and load them together.
+
+    Sensors that replay history at startup each ask for the states of their
+    source entity. Requests made while the event loop processes the same
+    batch of work, like the entities of a platform being added or the
+    listeners of the start event, are loaded with one query.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the preloader."""
+        self.hass = hass
+        self._pending: Dict[PreloadRequest, List[asyncio.Future]] = {}
+
+    async def async_load(self, request: PreloadRequest) -> List[RecordedState]:
+        """Return the requested states, oldest first."""
+        if not self._pending:
+            self.hass.loop.call_soon(self._async_flush)
+        future = self.hass.loop.create_future()
+        self._pending.setdefault(request, []).append(future)
+        return await future
+
+    @callback
+    def _async_flush(self) -> None:
+        """Load the states of all pending requests."""
+        pending = self._pending
+        self._pending = {}
+        self.hass.async_create_task(self._async_load_pending(pending))
+
+    async def _async_load_pending(
+        self, pending: Dict[PreloadRequest, List[asyncio.Future]]
+    ) -> None:
+        """Load the states of the pending requests and resolve their futures."""
+        requests = list(pending)
+        try:
+            results = await self.hass.async_add_executor_job(
+                self._load, requests, dt_util.utcnow()
+            )
+        except Exception as err:  # pylint: disable=broad-except
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(err)
+            return
+
+        for request, futures in pending.items():
+            for future in futures:
+                if not future.done():
+                    # Every request gets its own list, they may be modified
+                    future.set_result(list(results[request]))
+
+    def _load(
+        self, requests: List[PreloadRequest], now
+    ) -> Dict[PreloadRequest, List[RecordedState]]:
+        """Load the states of requests in compound queries."""
+        results: Dict[PreloadRequest, List[RecordedState]] = {
+            request: [] for request in requests
+        }
+        with session_scope(hass=self.hass) as session:
+            for start in range(0, len(requests), MAX_REQUESTS_PER_QUERY):
+                chunk = requests[start : start + MAX_REQUESTS_PER_QUERY]
+                selects = [
+                    _select_request(index, request, now)
+                    for index, request in enumerate(chunk)
+                ]
+                query = union_all(*selects) if len(selects) > 1 else selects[0]
+                rows: List[Tuple] = session.execute(query).fetchall()
+                _LOGGER.debug("Loaded %d states for %d requests", len(rows), len(chunk))
+                for row in rows:
+                    results[chunk[row.request]].append(
+                        RecordedState(
+                            row.state,
+                            process_timestamp(row.last_updated),
+                            row.attributes,
+                        )
+                    )
+
+        for states in results.values():
+            states.sort(key=lambda state: state.last_updated)
+        return results
+
+
+def _select_request(index: int, request: PreloadRequest, now):
+    """Return a select of the states of a request."""
+    query = select(
+        [
+            literal(index).label("request"),
+            States.state,
+            States.last_updated,
+            (States.attributes if request.attributes else null()).label("attributes"),
+        ]
+    ).where(States.entity_id == request.entity_id.lower())
+
+    if request.changes_only:
+        query = query.where(States.last_changed == States.last_updated)
+    if request.max_age is not None:
+        query = query.where(States.last_updated >= now - request.max_age)
+    if request.sample_size is not None:
+        query = query.order_by(States.last_updated.desc()).limit(request.sample_size)
+
+    # Wrapped so the limit is allowed in a compound select
+    return select([query.alias()])
+
+
+async def async_load_recorded_states(
+    hass: HomeAssistant,
+    entity_id: str,
+    *,
+    sample_size: Optional[int] = None,
+    max_age: Optional[timedelta] = None,
+    changes_only: bool = False,
+    attributes: bool = False,
+) -> List[RecordedState]:
+    """Return recorded states of an entity, oldest first.
+
+    Requests of many entities made at about the same time are loaded with a
+    single query.
+    """
+    preloader = hass.data.get(DATA_PRELOADER)
+    if preloader is None:
+        preloader = hass.data[DATA_PRELOADER] = StatesPreloader(hass)
+    return await preloader.async_load(
+        PreloadRequest(entity_id, sample_size, max_age, changes_only, attributes)
+    )
@@ -1,6 +1,7 @@
 """Support for scripts."""
 import asyncio
 import logging
+import time
 from typing import List
 
 import voluptuous as vol
@@ -20,10 +21,12 @@ from homeassistant.const import (
     STATE_ON,
 )
 from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import template
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.config_validation import make_entity_service_schema
 from homeassistant.helpers.entity import ToggleEntity
 from homeassistant.helpers.entity_component import EntityComponent
+from homeassistant.helpers.reference_index import async_get_reference_index
 from homeassistant.helpers.script import (
     ATTR_CUR,
     ATTR_MAX,
@@ -91,16 +94,7 @@ def is_on(hass, entity_id):
 @callback
 def scripts_with_entity(hass: HomeAssistant, entity_id: str) -> List[str]:
     """Return all scripts that reference the entity."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if entity_id in script_entity.script.referenced_entities
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_items_with_entity(entity_id)
 
 
 @callback
@@ -122,16 +116,7 @@ def entities_in_script(hass: HomeAssistant, entity_id: str) -> List[str]:
 @callback
 def scripts_with_device(hass: HomeAssistant, device_id: str) -> List[str]:
     """Return all scripts that reference the device."""
-    if DOMAIN not in hass.data:
-        return []
-
-    component = hass.data[DOMAIN]
-
-    return [
-        script_entity.entity_id
-        for script_entity in component.entities
-        if device_id in script_entity.script.referenced_devices
-    ]
+    return async_get_reference_index(hass, DOMAIN).async_items_with_device(device_id)
 
 
 @callback
@@ -158,11 +143,13 @@ async def async_setup(hass, config):
 
     async def reload_service(service):
         """Call a service to reload scripts."""
-        conf = await component.async_prepare_reload()
+        start = time.monotonic()
+        conf = await component.async_prepare_reload(skip_reset=True)
         if conf is None:
             return
 
         await _async_process_config(hass, conf, component)
+        _LOGGER.debug("Reloaded scripts in %.3f seconds", time.monotonic() - start)
 
     async def turn_on_service(service):
         """Call a service to turn script on."""
@@ -216,10 +203,38 @@ async def _async_process_config(hass, config, component):
             variables=service.data, context=service.context
         )
 
-    script_entities = [
-        ScriptEntity(hass, object_id, cfg)
-        for object_id, cfg in config.get(DOMAIN, {}).items()
+    scripts = config.get(DOMAIN, {})
+    unchanged = set()
+    script_entities = []
+
+    for object_id, cfg in scripts.items():
+        # Templates of existing scripts have hass attached, which is part of
+        # their equality
+        template.attach(hass, cfg)
+        if CONF_VARIABLES in cfg:
+            template.attach(hass, cfg[CONF_VARIABLES].variables)
+
+        existing = component.get_entity(ENTITY_ID_FORMAT.format(object_id))
+        if existing is not None and existing.raw_config == cfg:
+            unchanged.add(object_id)
+        else:
+            script_entities.append(ScriptEntity(hass, object_id, cfg))
+
+    # Scripts that changed are removed and added again
+    removed = [
+        script_entity
+        for script_entity in component.entities
+        if script_entity.object_id not in unchanged
     ]
+    for script_entity in removed:
+        await component.async_remove_entity(script_entity.entity_id)
+
+    _LOGGER.debug(
+        "Processed scripts: %d unchanged, %d added, %d removed",
+        len(unchanged),
+        len(script_entities),
+        len(removed),
+    )
 
     await component.async_add_entities(script_entities)
 
@@ -252,6 +267,8 @@ class ScriptEntity(ToggleEntity):
     def __init__(self, hass, object_id, cfg):
         """Initialize the script."""
         self.object_id = object_id
+        # The validated configuration, to find unchanged scripts on reload
+        self.raw_config = cfg
         self.icon = cfg.get(CONF_ICON)
         self.entity_id = ENTITY_ID_FORMAT.format(object_id)
         self.script = Script(
@@ -331,8 +348,17 @@ class ScriptEntity(ToggleEntity):
         """Turn script off."""
         await self.script.async_stop()
 
+    async def async_added_to_hass(self):
+        """Index the entities and devices the script references."""
+        async_get_reference_index(self.hass, DOMAIN).async_set(
+            self.entity_id,
+            self.script.referenced_entities,
+            self.script.referenced_devices,
+        )
+
     async def async_will_remove_from_hass(self):
         """Stop script and remove service when it will be removed from Home Assistant."""
+        async_get_reference_index(self.hass, DOMAIN).async_remove(self.entity_id)
         await self.script.async_stop()
 
         # remove service
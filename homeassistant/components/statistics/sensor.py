@@ -1,18 +1,16 @@
 """Support for statistics for sensor values."""
-from collections import deque
 import logging
-import statistics
 
 import voluptuous as vol
 
-from homeassistant.components.recorder.models import States
-from homeassistant.components.recorder.util import execute, session_scope
+from homeassistant.components.recorder.preload import async_load_recorded_states
 from homeassistant.components.sensor import PLATFORM_SCHEMA
 from homeassistant.const import (
     ATTR_UNIT_OF_MEASUREMENT,
     CONF_ENTITY_ID,
     CONF_NAME,
     EVENT_HOMEASSISTANT_START,
+    STATE_ON,
     STATE_UNAVAILABLE,
     STATE_UNKNOWN,
 )
@@ -27,6 +25,7 @@ from homeassistant.helpers.reload import async_setup_reload_service
 from homeassistant.util import dt as dt_util
 
 from . import DOMAIN, PLATFORMS
+from .window import WindowStatistics
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -40,6 +39,7 @@ ATTR_MEAN = "mean"
 ATTR_MEDIAN = "median"
 ATTR_MIN_AGE = "min_age"
 ATTR_MIN_VALUE = "min_value"
+ATTR_PERCENTILE = "percentile_{:g}"
 ATTR_SAMPLING_SIZE = "sampling_size"
 ATTR_STANDARD_DEVIATION = "standard_deviation"
 ATTR_TOTAL = "total"
@@ -48,6 +48,7 @@ ATTR_VARIANCE = "variance"
 CONF_SAMPLING_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
 CONF_PRECISION = "precision"
+CONF_PERCENTILES = "percentiles"
 
 DEFAULT_NAME = "Stats"
 DEFAULT_SIZE = 20
@@ -63,6 +64,9 @@ PLATFORM_SCHEMA = PLATFORM_SCHEMA.extend(
         ),
         vol.Optional(CONF_MAX_AGE): cv.time_period,
         vol.Optional(CONF_PRECISION, default=DEFAULT_PRECISION): vol.Coerce(int),
+        vol.Optional(CONF_PERCENTILES, default=[]): vol.All(
+            cv.ensure_list, [vol.All(vol.Coerce(float), vol.Range(min=0, max=100))]
+        ),
     }
 )
 
@@ -77,9 +81,15 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
     sampling_size = config.get(CONF_SAMPLING_SIZE)
     max_age = config.get(CONF_MAX_AGE)
     precision = config.get(CONF_PRECISION)
+    percentiles = config.get(CONF_PERCENTILES)
 
     async_add_entities(
-        [StatisticsSensor(entity_id, name, sampling_size, max_age, precision)], True
+        [
+            StatisticsSensor(
+                entity_id, name, sampling_size, max_age, precision, percentiles
+            )
+        ],
+        True,
     )
 
     return True
@@ -88,7 +98,9 @@ async def async_setup_platform(hass, config, async_add_entities, discovery_info=
 class StatisticsSensor(Entity):
     """Representation of a Statistics sensor."""
 
-    def __init__(self, entity_id, name, sampling_size, max_age, precision):
+    def __init__(
+        self, entity_id, name, sampling_size, max_age, precision, percentiles=()
+    ):
         """Initialize the Statistics sensor."""
         self._entity_id = entity_id
         self.is_binary = self._entity_id.split(".")[0] == "binary_sensor"
@@ -96,12 +108,13 @@ class StatisticsSensor(Entity):
         self._sampling_size = sampling_size
         self._max_age = max_age
         self._precision = precision
+        self._percentiles = percentiles
         self._unit_of_measurement = None
-        self.states = deque(maxlen=self._sampling_size)
-        self.ages = deque(maxlen=self._sampling_size)
+        self._window = WindowStatistics(self._sampling_size)
 
         self.count = 0
         self.mean = self.median = self.stdev = self.variance = None
+        self.percentiles = {}
         self.total = self.min = self.max = None
         self.min_age = self.max_age = None
         self.change = self.average_change = self.change_rate = None
@@ -121,7 +134,7 @@ class StatisticsSensor(Entity):
                 ATTR_UNIT_OF_MEASUREMENT
             )
 
-            self._add_state_to_queue(new_state)
+            self._add_state_to_queue(new_state.state, new_state.last_updated)
 
             self.async_schedule_update_ha_state(True)
 
@@ -144,23 +157,22 @@ class StatisticsSensor(Entity):
             EVENT_HOMEASSISTANT_START, async_stats_sensor_startup
         )
 
-    def _add_state_to_queue(self, new_state):
+    def _add_state_to_queue(self, state, last_updated):
         """Add the state to the queue."""
-        if new_state.state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
+        if state in [STATE_UNKNOWN, STATE_UNAVAILABLE]:
             return
 
         try:
             if self.is_binary:
-                self.states.append(new_state.state)
+                # Only the number of binary states is used
+                self._window.append(float(state == STATE_ON), last_updated)
             else:
-                self.states.append(float(new_state.state))
-
-            self.ages.append(new_state.last_updated)
+                self._window.append(float(state), last_updated)
         except ValueError:
             _LOGGER.error(
                 "%s: parsing error, expected number and received %s",
                 self.entity_id,
-                new_state.state,
+                state,
             )
 
     @property
@@ -188,6 +200,10 @@ class StatisticsSensor(Entity):
         """Return the state attributes of the sensor."""
         if not self.is_binary:
             return {
+                **{
+                    ATTR_PERCENTILE.format(percentile): value
+                    for percentile, value in self.percentiles.items()
+                },
                 ATTR_SAMPLING_SIZE: self._sampling_size,
                 ATTR_COUNT: self.count,
                 ATTR_MEAN: self.mean,
@@ -220,23 +236,23 @@ class StatisticsSensor(Entity):
             self._max_age,
         )
 
-        while self.ages and (now - self.ages[0]) > self._max_age:
+        ages = self._window.ages
+        while ages and (now - ages[0]) > self._max_age:
             _LOGGER.debug(
                 "%s: purging record with datetime %s(%s)",
                 self.entity_id,
-                dt_util.as_local(self.ages[0]),
-                (now - self.ages[0]),
+                dt_util.as_local(ages[0]),
+                (now - ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._window.popleft()
 
     def _next_to_purge_timestamp(self):
         """Find the timestamp when the next purge would occur."""
-        if self.ages and self._max_age:
+        if self._window.ages and self._max_age:
             # Take the oldest entry from the ages list and add the configured max_age.
             # If executed after purging old states, the result is the next timestamp
             # in the future when the oldest state will expire.
-            return self.ages[0] + self._max_age
+            return self._window.ages[0] + self._max_age
         return None
 
     async def async_update(self):
@@ -245,37 +261,41 @@ class StatisticsSensor(Entity):
         if self._max_age is not None:
             self._purge_old()
 
-        self.count = len(self.states)
+        window = self._window
+        self.count = len(window)
 
         if not self.is_binary:
-            try:  # require only one data point
-                self.mean = round(statistics.mean(self.states), self._precision)
-                self.median = round(statistics.median(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if window:
+                self.mean = round(window.mean, self._precision)
+                self.median = round(window.median, self._precision)
+                self.percentiles = {
+                    percentile: round(window.percentile(percentile), self._precision)
+                    for percentile in self._percentiles
+                }
+            else:
                 self.mean = self.median = STATE_UNKNOWN
+                self.percentiles = dict.fromkeys(self._percentiles, STATE_UNKNOWN)
 
-            try:  # require at least two data points
-                self.stdev = round(statistics.stdev(self.states), self._precision)
-                self.variance = round(statistics.variance(self.states), self._precision)
-            except statistics.StatisticsError as err:
-                _LOGGER.debug("%s: %s", self.entity_id, err)
+            if len(window) > 1:
+                self.stdev = round(window.stdev, self._precision)
+                self.variance = round(window.variance, self._precision)
+            else:
                 self.stdev = self.variance = STATE_UNKNOWN
 
-            if self.states:
-                self.total = round(sum(self.states), self._precision)
-                self.min = round(min(self.states), self._precision)
-                self.max = round(max(self.states), self._precision)
+            if window:
+                self.total = round(window.total, self._precision)
+                self.min = round(window.min, self._precision)
+                self.max = round(window.max, self._precision)
 
-                self.min_age = self.ages[0]
-                self.max_age = self.ages[-1]
+                self.min_age = window.ages[0]
+                self.max_age = window.ages[-1]
 
-                self.change = self.states[-1] - self.states[0]
+                self.change = window.values[-1] - window.values[0]
                 self.average_change = self.change
                 self.change_rate = 0
 
-                if len(self.states) > 1:
-                    self.average_change /= len(self.states) - 1
+                if len(window) > 1:
+                    self.average_change /= len(window) - 1
 
                     time_diff = (self.max_age - self.min_age).total_seconds()
                     if time_diff > 0:
@@ -315,39 +335,21 @@ class StatisticsSensor(Entity):
     async def _async_initialize_from_database(self):
         """Initialize the list of states from the database.
 
-        The query will get the list of states in DESCENDING order so that we
-        can limit the result to self._sample_size. Afterwards reverse the
-        list so that we get it in the right order again.
-
-        If MaxAge is provided then query will restrict to entries younger then
-        current datetime - MaxAge.
+        The most recent self._sampling_size states are loaded, restricted to
+        entries younger than current datetime - MaxAge if MaxAge is provided.
         """
 
         _LOGGER.debug("%s: initializing values from the database", self.entity_id)
 
-        with session_scope(hass=self.hass) as session:
-            query = session.query(States).filter(
-                States.entity_id == self._entity_id.lower()
-            )
-
-            if self._max_age is not None:
-                records_older_then = dt_util.utcnow() - self._max_age
-                _LOGGER.debug(
-                    "%s: retrieve records not older then %s",
-                    self.entity_id,
-                    records_older_then,
-                )
-                query = query.filter(States.last_updated >= records_older_then)
-            else:
-                _LOGGER.debug("%s: retrieving all records", self.entity_id)
-
-            query = query.order_by(States.last_updated.desc()).limit(
-                self._sampling_size
-            )
-            states = execute(query, to_native=True, validate_entity_ids=False)
+        states = await async_load_recorded_states(
+            self.hass,
+            self._entity_id,
+            sample_size=self._sampling_size,
+            max_age=self._max_age,
+        )
 
-        for state in reversed(states):
-            self._add_state_to_queue(state)
+        for state in states:
+            self._add_state_to_queue(state.state, state.last_updated)
 
         self.async_schedule_update_ha_state(True)
 
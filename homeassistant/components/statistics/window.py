@@ -0,0 +1,166 @@
+"""Incrementally maintained statistics over a window of samples."""
+from bisect import bisect_left, insort
+from collections import deque
+import math
+from typing import Any, Deque, List, Optional, Tuple
+
+
+class WindowStatistics:
+    """Statistics of the samples in a sliding window.
+
+    Samples are added at the end and evicted from the start, either because
+    the window is full or because they are too old. Every statistic is kept
+    up to date on each change instead of being recomputed over all samples:
+
+    - the sum uses compensated (Neumaier) summation and the variance uses
+      Welford's algorithm, both in O(1),
+    - minimum and maximum use monotonic deques, in amortized O(1),
+    - the median and percentiles use a sorted copy of the samples, found with
+      a binary search and updated with a single move of memory.
+    """
+
+    def __init__(self, maxlen: Optional[int] = None) -> None:
+        """Initialize an empty window holding at most maxlen samples."""
+        self.maxlen = maxlen
+        self.values: Deque[float] = deque()
+        self.ages: Deque[Any] = deque()
+        self._sorted: List[float] = []
+        # Monotonic deques of (sequence number, value)
+        self._min: Deque[Tuple[int, float]] = deque()
+        self._max: Deque[Tuple[int, float]] = deque()
+        # Sequence number of the first and the next sample
+        self._first = 0
+        self._next = 0
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._mean = 0.0
+        self._sq_deviations = 0.0
+        # Removing samples from the running variance accumulates rounding
+        # errors, so it is recomputed once as many samples were removed as the
+        # window holds.
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples."""
+        return len(self.values)
+
+    def append(self, value: float, age: Any) -> None:
+        """Add a sample, evicting the oldest sample if the window is full."""
+        if self.maxlen is not None and len(self.values) >= self.maxlen:
+            self.popleft()
+
+        self.values.append(value)
+        self.ages.append(age)
+        insort(self._sorted, value)
+
+        sequence = self._next
+        self._next += 1
+        while self._min and self._min[-1][1] >= value:
+            self._min.pop()
+        self._min.append((sequence, value))
+        while self._max and self._max[-1][1] <= value:
+            self._max.pop()
+        self._max.append((sequence, value))
+
+        self._add_to_sum(value)
+        delta = value - self._mean
+        self._mean += delta / len(self.values)
+        self._sq_deviations += delta * (value - self._mean)
+
+    def popleft(self) -> Tuple[float, Any]:
+        """Evict the oldest sample and return it with its age."""
+        value = self.values.popleft()
+        age = self.ages.popleft()
+        del self._sorted[bisect_left(self._sorted, value)]
+
+        sequence = self._first
+        self._first += 1
+        if self._min[0][0] == sequence:
+            self._min.popleft()
+        if self._max[0][0] == sequence:
+            self._max.popleft()
+
+        self._add_to_sum(-value)
+        count = len(self.values)
+        self._removed += 1
+        if not count:
+            self._reset_moments()
+        elif self._removed >= count:
+            self._recompute_moments()
+        else:
+            delta = value - self._mean
+            self._mean -= delta / count
+            self._sq_deviations -= delta * (value - self._mean)
+
+        return value, age
+
+    def _add_to_sum(self, value: float) -> None:
+        """Add to the compensated sum."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def _reset_moments(self) -> None:
+        """Reset the running sums of an empty window."""
+        self._sum = self._compensation = 0.0
+        self._mean = self._sq_deviations = 0.0
+        self._removed = 0
+
+    def _recompute_moments(self) -> None:
+        """Recompute the running sums from the samples."""
+        self._sum = math.fsum(self.values)
+        self._compensation = 0.0
+        self._mean = self._sum / len(self.values)
+        self._sq_deviations = math.fsum(
+            (value - self._mean) ** 2 for value in self.values
+        )
+        self._removed = 0
+
+    @property
+    def total(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum + self._compensation
+
+    @property
+    def mean(self) -> float:
+        """Return the mean, requires one sample."""
+        return self.total / len(self.values)
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires two samples."""
+        return max(self._sq_deviations, 0.0) / (len(self.values) - 1)
+
+    @property
+    def stdev(self) -> float:
+        """Return the sample standard deviation, requires two samples."""
+        return math.sqrt(self.variance)
+
+    @property
+    def min(self) -> float:
+        """Return the smallest sample, requires one sample."""
+        return self._min[0][1]
+
+    @property
+    def max(self) -> float:
+        """Return the largest sample, requires one sample."""
+        return self._max[0][1]
+
+    @property
+    def median(self) -> float:
+        """Return the median, requires one sample."""
+        return self.percentile(50)
+
+    def percentile(self, percentile: float) -> float:
+        """Return a percentile interpolated between the closest samples."""
+        position = (len(self._sorted) - 1) * percentile / 100
+        lower = math.floor(position)
+        upper = math.ceil(position)
+        if lower == upper:
+            return self._sorted[lower]
+        return self._sorted[lower] + (self._sorted[upper] - self._sorted[lower]) * (
+            position - lower
+        )
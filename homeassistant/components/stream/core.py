@@ -29,10 +29,14 @@ class StreamBuffer:
 
 @attr.s
 class Segment:
-    """Represent a segment."""
+    """Represent a segment.
+
+    The data of a segment is immutable, so it is shared by all outputs and
+    served to every client without copies.
+    """
 
     sequence: int = attr.ib()
-    segment: io.BytesIO = attr.ib()
+    segment: bytes = attr.ib()
     duration: float = attr.ib()
 
 
@@ -99,6 +103,17 @@ class StreamOutput:
         if not sequence:
             return self._segments
 
+        if not self._segments:
+            return None
+
+        # Sequence numbers are consecutive, so the position follows from
+        # the first segment
+        index = sequence - self._segments[0].sequence
+        if 0 <= index < len(self._segments):
+            segment = self._segments[index]
+            if segment.sequence == sequence:
+                return segment
+
         for segment in self._segments:
             if segment.sequence == sequence:
                 return segment
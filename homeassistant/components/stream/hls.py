@@ -1,5 +1,4 @@
 """Provide functionality to stream HLS."""
-import io
 from typing import Callable
 
 from aiohttp import web
@@ -35,9 +34,7 @@ class HlsMasterPlaylistView(StreamView):
         # Calculate file size / duration and use a small multiplier to account for variation
         # hls spec already allows for 25% variation
         segment = track.get_segment(track.segments[-1])
-        bandwidth = round(
-            segment.segment.seek(0, io.SEEK_END) * 8 / segment.duration * 1.2
-        )
+        bandwidth = round(len(segment.segment) * 8 / segment.duration * 1.2)
         codecs = get_codec_string(segment.segment)
         lines = [
             "#EXTM3U",
@@ -1,4 +1,5 @@
 """Provide functionality to record stream."""
+import io
 import os
 import threading
 from typing import List
@@ -28,7 +29,7 @@ def recorder_save_worker(file_out: str, segments: List[Segment], container_forma
     # Get first_pts values from first segment
     if len(segments) > 0:
         segment = segments[0]
-        source = av.open(segment.segment, "r", format=container_format)
+        source = av.open(io.BytesIO(segment.segment), "r", format=container_format)
         source_v = source.streams.video[0]
         first_pts["video"] = source_v.start_time
         if len(source.streams.audio) > 0:
@@ -39,8 +40,8 @@ def recorder_save_worker(file_out: str, segments: List[Segment], container_forma
         source.close()
 
     for segment in segments:
-        # Open segment
-        source = av.open(segment.segment, "r", format=container_format)
+        # Open segment, a BytesIO of bytes shares their memory
+        source = av.open(io.BytesIO(segment.segment), "r", format=container_format)
         source_v = source.streams.video[0]
         # Add output streams
         if not output_v:
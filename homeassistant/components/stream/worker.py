@@ -279,7 +279,7 @@ def _stream_worker_internal(hass, stream, quit_event):
                             stream.outputs[fmt].put,
                             Segment(
                                 sequence,
-                                buffer.segment,
+                                buffer.segment.getvalue(),
                                 segment_duration,
                             ),
                         )
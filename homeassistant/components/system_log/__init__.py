@@ -1,6 +1,7 @@
 """Support for system log."""
 import asyncio
 from collections import OrderedDict, deque
+from functools import lru_cache
 import logging
 import queue
 import re
@@ -13,6 +14,7 @@ from homeassistant.components.http import HomeAssistantView
 from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, EVENT_HOMEASSISTANT_STOP
 from homeassistant.core import callback
 import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.event import async_call_later
 
 CONF_MAX_ENTRIES = "max_entries"
 CONF_FIRE_EVENT = "fire_event"
@@ -27,6 +29,11 @@ DOMAIN = "system_log"
 
 EVENT_SYSTEM_LOG = "system_log_event"
 
+# Records are counted and fired as events in intervals of this many seconds
+LOG_INTERVAL = 1
+# Records of a source beyond this many per interval only update its entry
+MAX_RECORDS_PER_INTERVAL = 10
+
 SERVICE_CLEAR = "clear"
 SERVICE_WRITE = "write"
 
@@ -56,8 +63,14 @@ SERVICE_WRITE_SCHEMA = vol.Schema(
 )
 
 
+@lru_cache(maxsize=8)
+def _get_paths_re(paths):
+    """Return a compiled pattern matching files within the given paths."""
+    return re.compile(r"(?:{})/(.*)".format("|".join([re.escape(x) for x in paths])))
+
+
 def _figure_out_source(record, call_stack, hass):
-    paths = [HOMEASSISTANT_PATH[0], hass.config.config_dir]
+    paths_re = _get_paths_re((HOMEASSISTANT_PATH[0], hass.config.config_dir))
 
     # If a stack trace exists, extract file names from the entire call stack.
     # The other case is when a regular "log" is made (without an attached
@@ -78,11 +91,10 @@ def _figure_out_source(record, call_stack, hass):
 
     # Iterate through the stack call (in reverse) and find the last call from
     # a file in Home Assistant. Try to figure out where error happened.
-    paths_re = r"(?:{})/(.*)".format("|".join([re.escape(x) for x in paths]))
     for pathname in reversed(stack):
 
         # Try to match with a file within Home Assistant
-        match = re.match(paths_re, pathname[0])
+        match = paths_re.match(pathname[0])
         if match:
             return [match.group(1), pathname[1]]
     # Ok, we don't know what this is
@@ -153,6 +165,25 @@ class DedupStore(OrderedDict):
             # Removes the first record which should also be the oldest
             self.popitem(last=False)
 
+    def add_occurrence(self, key, record):
+        """Count a record as another occurrence of a stored entry.
+
+        Return False if there is no entry with this key.
+        """
+        existing = self.get(key)
+        if existing is None:
+            return False
+
+        existing.count += 1
+        existing.timestamp = record.created
+
+        message = record.getMessage()
+        if message not in existing.message:
+            existing.message.append(message)
+
+        self.move_to_end(key)
+        return True
+
     def to_list(self):
         """Return reversed list of log entries - LIFO."""
         return [value.to_dict() for value in reversed(self.values())]
@@ -180,6 +211,16 @@ class LogErrorHandler(logging.Handler):
         self.hass = hass
         self.records = DedupStore(maxlen=maxlen)
         self.fire_event = fire_event
+        # (logger, pathname, lineno) of records logged without exception
+        # -> their source
+        self._sources = {}
+        # (logger, pathname, lineno) -> key of the last entry it was stored as
+        self._entry_keys = {}
+        # (logger, pathname, lineno) -> records in the current interval
+        self._interval = None
+        self._interval_counts = {}
+        # Data of the events to fire at the end of the interval
+        self._events = []
 
     def emit(self, record):
         """Save error and warning logs.
@@ -188,14 +229,53 @@ class LogErrorHandler(logging.Handler):
         default upper limit is set to 50 (older entries are discarded) but can
         be changed if needed.
         """
+        source_key = (record.name, record.pathname, record.lineno)
+
+        interval = int(record.created // LOG_INTERVAL)
+        if interval != self._interval:
+            self._interval = interval
+            self._interval_counts.clear()
+        count = self._interval_counts.get(source_key, 0) + 1
+        self._interval_counts[source_key] = count
+
+        # Records of a source that logs a lot are only counted
+        if count > MAX_RECORDS_PER_INTERVAL and self.records.add_occurrence(
+            self._entry_keys.get(source_key), record
+        ):
+            return
+
         stack = []
-        if not record.exc_info:
-            stack = [(f[0], f[1]) for f in traceback.extract_stack()]
+        if record.exc_info:
+            source = _figure_out_source(record, stack, self.hass)
+        else:
+            source = self._sources.get(source_key)
+            if source is None:
+                stack = [(f[0], f[1]) for f in traceback.extract_stack()]
+                source = _figure_out_source(record, stack, self.hass)
+                self._sources[source_key] = source
 
-        entry = LogEntry(record, stack, _figure_out_source(record, stack, self.hass))
+        entry = LogEntry(record, stack, source)
         self.records.add_entry(entry)
-        if self.fire_event:
-            self.hass.bus.fire(EVENT_SYSTEM_LOG, entry.to_dict())
+        self._entry_keys[source_key] = entry.hash
+
+        if self.fire_event and count <= MAX_RECORDS_PER_INTERVAL:
+            self._events.append(entry.to_dict())
+            if len(self._events) == 1:
+                self.hass.loop.call_soon_threadsafe(
+                    async_call_later, self.hass, LOG_INTERVAL, self._async_fire_events
+                )
+
+    @callback
+    def _async_fire_events(self, _now):
+        """Fire the events of the records logged during the interval."""
+        self.acquire()
+        try:
+            events, self._events = self._events, []
+        finally:
+            self.release()
+
+        for event_data in events:
+            self.hass.bus.async_fire(EVENT_SYSTEM_LOG, event_data)
 
 
 async def async_setup(hass, config):
@@ -1,5 +1,6 @@
 """Provide functionality for TTS."""
 import asyncio
+from collections import OrderedDict
 import functools as ft
 import hashlib
 import io
@@ -9,7 +10,7 @@ import os
 import re
 from typing import Dict, Optional
 
-from aiohttp import web
+from aiohttp import hdrs, web
 import mutagen
 from mutagen.id3 import ID3, TextFrame as ID3Text
 import voluptuous as vol
@@ -28,6 +29,8 @@ from homeassistant.const import (
     HTTP_BAD_REQUEST,
     HTTP_NOT_FOUND,
     HTTP_OK,
+    HTTP_PARTIAL_CONTENT,
+    HTTP_REQUESTED_RANGE_NOT_SATISFIABLE,
 )
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
@@ -62,7 +65,14 @@ DEFAULT_TIME_MEMORY = 300
 DOMAIN = "tts"
 
 MEM_CACHE_FILENAME = "filename"
+MEM_CACHE_USED = "used"
 MEM_CACHE_VOICE = "voice"
+# Maximum total size of the voices kept in memory
+MEM_CACHE_MAX_SIZE = 16 * 1024 * 1024
+
+STORAGE_KEY = "tts_cache"
+STORAGE_VERSION = 1
+STORAGE_SAVE_DELAY = 10
 
 SERVICE_CLEAR_CACHE = "clear_cache"
 SERVICE_SAY = "say"
@@ -242,7 +252,14 @@ class SpeechManager:
         self.time_memory = DEFAULT_TIME_MEMORY
         self.base_url = None
         self.file_cache = {}
-        self.mem_cache = {}
+        # Least recently used voices first
+        self.mem_cache = OrderedDict()
+        self._mem_cache_size = 0
+        self._mem_cleanup = None
+        # Speech being received from a provider, by key
+        self._pending = {}
+        self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        self._cache_dir_version = None
 
     async def async_init_cache(self, use_cache, cache_dir, time_memory, base_url):
         """Init config folder and load file cache."""
@@ -257,19 +274,49 @@ class SpeechManager:
         except OSError as err:
             raise HomeAssistantError(f"Can't init cache dir {err}") from err
 
-        try:
-            cache_files = await self.hass.async_add_executor_job(
-                _get_cache_files, self.cache_dir
-            )
-        except OSError as err:
-            raise HomeAssistantError(f"Can't read cache dir {err}") from err
+        # The stored index of the file cache is used as long as nothing
+        # was added to or removed from the cache dir since it was saved
+        data = await self._store.async_load()
+        self._cache_dir_version = await self.hass.async_add_executor_job(
+            _get_cache_dir_version, self.cache_dir
+        )
+        if (
+            data is not None
+            and self._cache_dir_version is not None
+            and data["cache_dir"] == self.cache_dir
+            and data.get("cache_dir_version") == self._cache_dir_version
+        ):
+            cache_files = data["files"]
+        else:
+            try:
+                cache_files = await self.hass.async_add_executor_job(
+                    _get_cache_files, self.cache_dir
+                )
+            except OSError as err:
+                raise HomeAssistantError(f"Can't read cache dir {err}") from err
+            self._async_schedule_save()
 
         if cache_files:
             self.file_cache.update(cache_files)
 
+    @callback
+    def _async_schedule_save(self):
+        """Schedule saving the index of the file cache."""
+        self._store.async_delay_save(self._data_to_save, STORAGE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self):
+        """Return the index of the file cache to store."""
+        return {
+            "cache_dir": self.cache_dir,
+            "cache_dir_version": self._cache_dir_version,
+            "files": self.file_cache,
+        }
+
     async def async_clear_cache(self):
         """Read file cache and delete files."""
-        self.mem_cache = {}
+        self.mem_cache = OrderedDict()
+        self._mem_cache_size = 0
 
         def remove_files():
             """Remove files from filesystem."""
@@ -278,9 +325,11 @@ class SpeechManager:
                     os.remove(os.path.join(self.cache_dir, filename))
                 except OSError as err:
                     _LOGGER.warning("Can't remove cache file '%s': %s", filename, err)
+            return _get_cache_dir_version(self.cache_dir)
 
-        await self.hass.async_add_executor_job(remove_files)
+        self._cache_dir_version = await self.hass.async_add_executor_job(remove_files)
         self.file_cache = {}
+        self._async_schedule_save()
 
     @callback
     def async_register_engine(self, engine, provider, config):
@@ -331,16 +380,21 @@ class SpeechManager:
 
         # Is speech already in memory
         if key in self.mem_cache:
-            filename = self.mem_cache[key][MEM_CACHE_FILENAME]
+            filename = self._async_use_memcache(key)[MEM_CACHE_FILENAME]
         # Is file store in file cache
         elif use_cache and key in self.file_cache:
             filename = self.file_cache[key]
-            self.hass.async_create_task(self.async_file_to_mem(key))
-        # Load speech from provider into memory
+        # Load speech from provider into memory, once for identical requests
         else:
-            filename = await self.async_get_tts_audio(
-                engine, key, message, use_cache, language, options
-            )
+            task = self._pending.get(key)
+            if task is None:
+                task = self._pending[key] = self.hass.async_create_task(
+                    self.async_get_tts_audio(
+                        engine, key, message, use_cache, language, options
+                    )
+                )
+                task.add_done_callback(lambda _: self._pending.pop(key, None))
+            filename = await asyncio.shield(task)
 
         return f"{self.base_url}/api/tts_proxy/{filename}"
 
@@ -384,10 +438,14 @@ class SpeechManager:
             """Store speech to filesystem."""
             with open(voice_file, "wb") as speech:
                 speech.write(data)
+            return _get_cache_dir_version(self.cache_dir)
 
         try:
-            await self.hass.async_add_executor_job(save_speech)
+            self._cache_dir_version = await self.hass.async_add_executor_job(
+                save_speech
+            )
             self.file_cache[key] = filename
+            self._async_schedule_save()
         except OSError as err:
             _LOGGER.error("Can't write %s: %s", filename, err)
 
@@ -410,43 +468,109 @@ class SpeechManager:
         try:
             data = await self.hass.async_add_executor_job(load_speech)
         except OSError as err:
-            del self.file_cache[key]
+            self.file_cache.pop(key, None)
+            self._async_schedule_save()
             raise HomeAssistantError(f"Can't read {voice_file}") from err
 
         self._async_store_to_memcache(key, filename, data)
 
     @callback
     def _async_store_to_memcache(self, key, filename, data):
-        """Store data to memcache and set timer to remove it."""
-        self.mem_cache[key] = {MEM_CACHE_FILENAME: filename, MEM_CACHE_VOICE: data}
+        """Store data to memcache.
 
-        @callback
-        def async_remove_from_mem():
-            """Cleanup memcache."""
-            self.mem_cache.pop(key, None)
+        Voices are removed when they were not used for time_memory seconds or
+        to keep the memcache within MEM_CACHE_MAX_SIZE.
+        """
+        previous = self.mem_cache.pop(key, None)
+        if previous is not None:
+            self._mem_cache_size -= len(previous[MEM_CACHE_VOICE])
 
-        self.hass.loop.call_later(self.time_memory, async_remove_from_mem)
+        self.mem_cache[key] = {
+            MEM_CACHE_FILENAME: filename,
+            MEM_CACHE_VOICE: data,
+            MEM_CACHE_USED: self.hass.loop.time(),
+        }
+        self._mem_cache_size += len(data)
 
-    async def async_read_tts(self, filename):
-        """Read a voice file and return binary.
+        while self._mem_cache_size > MEM_CACHE_MAX_SIZE and len(self.mem_cache) > 1:
+            _, removed = self.mem_cache.popitem(last=False)
+            self._mem_cache_size -= len(removed[MEM_CACHE_VOICE])
 
-        This method is a coroutine.
+        if self._mem_cleanup is None:
+            self._async_schedule_mem_cleanup()
+
+    @callback
+    def _async_use_memcache(self, key):
+        """Mark a voice in memcache as used and return it."""
+        voice = self.mem_cache[key]
+        voice[MEM_CACHE_USED] = self.hass.loop.time()
+        self.mem_cache.move_to_end(key)
+        return voice
+
+    @callback
+    def _async_schedule_mem_cleanup(self):
+        """Remove the voices that were not used for a while from memcache.
+
+        A single timer runs for the least recently used voice.
         """
+        self._mem_cleanup = None
+        expired = self.hass.loop.time() - self.time_memory
+
+        while self.mem_cache:
+            key, voice = next(iter(self.mem_cache.items()))
+            if voice[MEM_CACHE_USED] > expired:
+                self._mem_cleanup = self.hass.loop.call_at(
+                    voice[MEM_CACHE_USED] + self.time_memory,
+                    self._async_schedule_mem_cleanup,
+                )
+                break
+            del self.mem_cache[key]
+            self._mem_cache_size -= len(voice[MEM_CACHE_VOICE])
+
+    @callback
+    def _async_key_from_filename(self, filename):
+        """Return the cache key of a voice file."""
         record = _RE_VOICE_FILE.match(filename.lower())
         if not record:
             raise HomeAssistantError("Wrong tts file format!")
 
-        key = KEY_PATTERN.format(
+        return KEY_PATTERN.format(
             record.group(1), record.group(2), record.group(3), record.group(4)
         )
 
+    async def async_read_tts(self, filename):
+        """Read a voice file and return binary.
+
+        This method is a coroutine.
+        """
+        key = self._async_key_from_filename(filename)
+
         if key not in self.mem_cache:
             if key not in self.file_cache:
                 raise HomeAssistantError(f"{key} not in cache!")
             await self.async_file_to_mem(key)
 
         content, _ = mimetypes.guess_type(filename)
-        return content, self.mem_cache[key][MEM_CACHE_VOICE]
+        return content, self._async_use_memcache(key)[MEM_CACHE_VOICE]
+
+    async def async_get_tts_file(self, filename):
+        """Return the path of a voice file that is not in memory.
+
+        Returns None when the voice is in memory or not cached at all.
+
+        This method is a coroutine.
+        """
+        key = self._async_key_from_filename(filename)
+        if key in self.mem_cache or key not in self.file_cache:
+            return None
+
+        voice_file = os.path.join(self.cache_dir, self.file_cache[key])
+        if not await self.hass.async_add_executor_job(os.path.isfile, voice_file):
+            self.file_cache.pop(key, None)
+            self._async_schedule_save()
+            raise HomeAssistantError(f"{voice_file} does not exist!")
+
+        return voice_file
 
     @staticmethod
     def write_tags(filename, data, provider, message, language, options):
@@ -535,6 +659,15 @@ def _init_tts_cache_dir(hass, cache_dir):
     return cache_dir
 
 
+def _get_cache_dir_version(cache_dir):
+    """Return a version of the cache dir that changes when files are added or removed."""
+    try:
+        cache_dir_stat = os.stat(cache_dir)
+    except OSError:
+        return None
+    return f"{cache_dir_stat.st_ino}-{cache_dir_stat.st_mtime_ns}"
+
+
 def _get_cache_files(cache_dir):
     """Return a dict of given engine files."""
     cache = {}
@@ -601,15 +734,41 @@ class TextToSpeechView(HomeAssistantView):
         """Initialize a tts view."""
         self.tts = tts
 
-    async def get(self, request: web.Request, filename: str) -> web.Response:
+    async def get(self, request: web.Request, filename: str) -> web.StreamResponse:
         """Start a get request."""
         try:
+            voice_file = await self.tts.async_get_tts_file(filename)
+            if voice_file is not None:
+                # Streamed from disk, with support for range requests
+                return web.FileResponse(voice_file)
+
             content, data = await self.tts.async_read_tts(filename)
         except HomeAssistantError as err:
             _LOGGER.error("Error on load tts: %s", err)
             return web.Response(status=HTTP_NOT_FOUND)
 
-        return web.Response(body=data, content_type=content)
+        try:
+            start, stop, _ = request.http_range.indices(len(data))
+        except ValueError:
+            return web.Response(status=HTTP_REQUESTED_RANGE_NOT_SATISFIABLE)
+
+        headers = {hdrs.ACCEPT_RANGES: "bytes"}
+        if (start, stop) == (0, len(data)):
+            return web.Response(body=data, content_type=content, headers=headers)
+
+        if start >= stop:
+            headers[hdrs.CONTENT_RANGE] = f"bytes */{len(data)}"
+            return web.Response(
+                status=HTTP_REQUESTED_RANGE_NOT_SATISFIABLE, headers=headers
+            )
+
+        headers[hdrs.CONTENT_RANGE] = f"bytes {start}-{stop - 1}/{len(data)}"
+        return web.Response(
+            body=data[start:stop],
+            status=HTTP_PARTIAL_CONTENT,
+            content_type=content,
+            headers=headers,
+        )
 
 
 def get_base_url(hass):
@@ -30,6 +30,7 @@ from .messages import (  # noqa
     error_message,
     event_message,
     result_message,
+    result_message_json,
 )
 
 # mypy: allow-untyped-calls, allow-untyped-defs
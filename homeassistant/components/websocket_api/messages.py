@@ -37,6 +37,25 @@ def result_message(iden: int, result: Any = None) -> Dict:
     return {"id": iden, "type": const.TYPE_RESULT, "success": True, "result": result}
 
 
+# Envelope of a success result message around an already serialized result
+RESULT_JSON_PREFIX = '{"id": '
+RESULT_JSON_INFIX = f', "type": "{const.TYPE_RESULT}", "success": true, "result": '
+RESULT_JSON_SUFFIX = "}"
+
+
+def result_message_json(iden: int, result_json: str) -> str:
+    """Return a success result message with an already serialized result."""
+    return "".join(
+        (
+            RESULT_JSON_PREFIX,
+            str(iden),
+            RESULT_JSON_INFIX,
+            result_json,
+            RESULT_JSON_SUFFIX,
+        )
+    )
+
+
 def error_message(iden: int, code: str, message: str) -> Dict:
     """Return an error result message."""
     return {
@@ -9,7 +9,7 @@ import logging
 import os
 import time
 import traceback
-from typing import List, Optional
+from typing import Callable, List, Optional, Tuple
 
 from serial import SerialException
 from zigpy.config import CONF_DEVICE
@@ -85,11 +85,15 @@ from .device import (
 )
 from .group import GroupMember, ZHAGroup
 from .registries import GROUP_ENTITY_DOMAINS
+from .scheduler import DeviceInitScheduler
 from .store import async_get_registry
 from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Sorts devices of unknown depth after all others
+MAX_DEPTH = 0xFF
+
 EntityReference = collections.namedtuple(
     "EntityReference",
     "reference_id zha_device cluster_channels device_info remove_future",
@@ -129,6 +133,8 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self._config_entry = config_entry
         self._unsubs = []
+        self._init_scheduler = DeviceInitScheduler(self._async_device_initialized)
+        self._refresh_task = None
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -215,30 +221,59 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
-
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
-
-        _LOGGER.debug("Loading battery powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
-            ]
-        )
+        """Initialize devices and load entities.
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
-            ]
+        Devices are first initialized from the attribute cache, which needs no
+        radio traffic. Mains powered devices that were never initialized with
+        live reads are then read live before their entities are loaded, while
+        the live refresh of the other mains powered devices is deferred. Live
+        reads start with routers closest to the coordinator.
+        """
+        storage = self.zha_storage.devices
+        mains_powered = sorted(
+            (dev for dev in self.devices.values() if dev.is_mains_powered),
+            key=self._async_live_init_priority(),
         )
+        needs_live_init = [
+            dev
+            for dev in mains_powered
+            if str(dev.ieee) not in storage
+            or storage[str(dev.ieee)].last_initialized is None
+        ]
+        cached = set(self.devices.values()).difference(needs_live_init)
+
+        _LOGGER.debug("Loading devices from cache")
+        await asyncio.gather(*[dev.async_initialize(from_cache=True) for dev in cached])
+
+        _LOGGER.debug("Loading mains powered devices without cached state")
+        await self._init_scheduler.async_initialize(needs_live_init)
+
+        deferred = [dev for dev in mains_powered if dev in cached]
+        if deferred:
+            _LOGGER.debug("Refreshing %d mains powered devices", len(deferred))
+            self._refresh_task = self._hass.async_create_task(
+                self._init_scheduler.async_initialize(deferred)
+            )
+
+    @callback
+    def _async_live_init_priority(self) -> Callable[[zha_typing.ZhaDeviceType], Tuple]:
+        """Return a sort key putting routers and devices close to the coordinator first."""
+        depths = {}
+        for device in self.devices.values():
+            for neighbor in device.device.neighbors:
+                ieee = neighbor.neighbor.ieee
+                depth = neighbor.neighbor.depth
+                depths[ieee] = min(depths.get(ieee, depth), depth)
+
+        def priority(device: zha_typing.ZhaDeviceType) -> Tuple:
+            return (not device.is_router, depths.get(device.ieee, MAX_DEPTH))
+
+        return priority
+
+    @callback
+    def _async_device_initialized(self, device: zha_typing.ZhaDeviceType) -> None:
+        """Remember a device was initialized with live reads."""
+        self.zha_storage.async_set_initialized(device)
 
     def device_joined(self, device):
         """Handle device joined.
@@ -667,6 +702,8 @@ class ZHAGateway:
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
         for unsubscribe in self._unsubs:
             unsubscribe()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
         await self.application_controller.pre_shutdown()
 
     def handle_message(
@@ -0,0 +1,81 @@
+"""Scheduler for the live initialization of ZHA devices."""
+import asyncio
+import logging
+import time
+from typing import Callable, Iterable, Optional, Set
+
+from .typing import ZhaDeviceType
+
+_LOGGER = logging.getLogger(__name__)
+
+INITIAL_CONCURRENCY = 2
+MIN_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+# Initializing a device within this many seconds means the radio keeps up
+TARGET_LATENCY = 5
+
+
+class DeviceInitScheduler:
+    """Initialize devices with live reads with an adaptive concurrency.
+
+    Devices are initialized in the given order. The number of devices
+    initialized at once grows by one while devices are initialized within
+    the target latency, and is halved when the radio falls behind or a device
+    fails to initialize.
+    """
+
+    def __init__(
+        self, initialized_cb: Optional[Callable[[ZhaDeviceType], None]] = None
+    ) -> None:
+        """Initialize the scheduler."""
+        self.concurrency = INITIAL_CONCURRENCY
+        self._initialized_cb = initialized_cb
+
+    async def async_initialize(self, devices: Iterable[ZhaDeviceType]) -> None:
+        """Initialize devices with live reads."""
+        pending = list(devices)
+        pending.reverse()
+        running: Set[asyncio.Future] = set()
+        error: Optional[BaseException] = None
+
+        while pending or running:
+            while pending and len(running) < self.concurrency:
+                running.add(
+                    asyncio.ensure_future(self._async_initialize(pending.pop()))
+                )
+            done, running = await asyncio.wait(
+                running, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                if error is None and task.exception() is not None:
+                    error = task.exception()
+
+        if error is not None:
+            raise error
+
+    async def _async_initialize(self, device: ZhaDeviceType) -> None:
+        """Initialize a device and adapt the concurrency to its latency."""
+        start = time.monotonic()
+        try:
+            await device.async_initialize(from_cache=False)
+        except Exception:
+            self._decrease()
+            raise
+        latency = time.monotonic() - start
+
+        if latency <= TARGET_LATENCY:
+            self.concurrency = min(self.concurrency + 1, MAX_CONCURRENCY)
+        else:
+            self._decrease()
+        _LOGGER.debug(
+            "Initialized %s in %.1f seconds, concurrency is now %d",
+            device.ieee,
+            latency,
+            self.concurrency,
+        )
+        if self._initialized_cb is not None:
+            self._initialized_cb(device)
+
+    def _decrease(self) -> None:
+        """Halve the number of devices initialized at once."""
+        self.concurrency = max(self.concurrency // 2, MIN_CONCURRENCY)
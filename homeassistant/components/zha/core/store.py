@@ -28,6 +28,8 @@ class ZhaDeviceEntry:
     name: Optional[str] = attr.ib(default=None)
     ieee: Optional[str] = attr.ib(default=None)
     last_seen: Optional[float] = attr.ib(default=None)
+    # Time of the last initialization with live reads
+    last_initialized: Optional[float] = attr.ib(default=None)
 
 
 class ZhaStorage:
@@ -72,6 +74,14 @@ class ZhaStorage:
             del self.devices[ieee_str]
             self.async_schedule_save()
 
+    @callback
+    def async_set_initialized(self, device: ZhaDeviceType) -> ZhaDeviceEntry:
+        """Record that a device was initialized with live reads."""
+        old = self.async_get_or_create_device(device)
+        new = self.devices[old.ieee] = attr.evolve(old, last_initialized=time.time())
+        self.async_schedule_save()
+        return new
+
     @callback
     def async_update_device(self, device: ZhaDeviceType) -> ZhaDeviceEntry:
         """Update name of ZhaDeviceEntry."""
@@ -100,6 +110,7 @@ class ZhaStorage:
                     name=device["name"],
                     ieee=device["ieee"],
                     last_seen=device.get("last_seen"),
+                    last_initialized=device.get("last_initialized"),
                 )
 
         self.devices = devices
@@ -119,7 +130,12 @@ class ZhaStorage:
         data = {}
 
         data["devices"] = [
-            {"name": entry.name, "ieee": entry.ieee, "last_seen": entry.last_seen}
+            {
+                "name": entry.name,
+                "ieee": entry.ieee,
+                "last_seen": entry.last_seen,
+                "last_initialized": entry.last_initialized,
+            }
             for entry in self.devices.values()
             if entry.last_seen and (time.time() - entry.last_seen) < TOMBSTONE_LIFETIME
         ]
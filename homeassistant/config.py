@@ -58,7 +58,13 @@ from homeassistant.requirements import (
 )
 from homeassistant.util.package import is_docker_env
 from homeassistant.util.unit_system import IMPERIAL_SYSTEM, METRIC_SYSTEM
-from homeassistant.util.yaml import SECRET_YAML, load_yaml
+from homeassistant.util.yaml import (
+    SECRET_YAML,
+    is_node_cached,
+    load_node_cache,
+    load_yaml,
+    save_node_cache,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,6 +72,7 @@ DATA_PERSISTENT_ERRORS = "bootstrap_persistent_errors"
 RE_YAML_ERROR = re.compile(r"homeassistant\.util\.yaml")
 RE_ASCII = re.compile(r"\033\[[^m]*m")
 YAML_CONFIG_FILE = "configuration.yaml"
+YAML_CACHE_FILE = os.path.join(".storage", "core.yaml_cache")
 VERSION_FILE = ".HA_VERSION"
 CONFIG_DIR_NAME = ".homeassistant"
 DATA_CUSTOMIZE = "hass_customize"
@@ -312,13 +319,27 @@ async def async_hass_config_yaml(hass: HomeAssistant) -> Dict:
     """
     # Not using async_add_executor_job because this is an internal method.
     config = await hass.loop.run_in_executor(
-        None, load_yaml_config_file, hass.config.path(YAML_CONFIG_FILE)
+        None, _load_cached_yaml_config_file, hass.config.config_dir
     )
     core_config = config.get(CONF_CORE, {})
     await merge_packages_config(hass, config, core_config.get(CONF_PACKAGES, {}))
     return config
 
 
+def _load_cached_yaml_config_file(config_dir: str) -> Dict[Any, Any]:
+    """Parse the YAML configuration file, reusing unchanged parsed files.
+
+    This method needs to run in an executor.
+    """
+    config_path = os.path.join(config_dir, YAML_CONFIG_FILE)
+    cache_path = os.path.join(config_dir, YAML_CACHE_FILE)
+    load_node_cache(cache_path, config_dir)
+    config = load_yaml_config_file(config_path)
+    if is_node_cached(config_path):
+        save_node_cache(cache_path)
+    return config
+
+
 def load_yaml_config_file(config_path: str) -> Dict[Any, Any]:
     """Parse a YAML configuration file.
 
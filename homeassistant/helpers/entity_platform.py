@@ -3,8 +3,21 @@ import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
 from logging import Logger
+import time
 from types import ModuleType
-from typing import TYPE_CHECKING, Callable, Coroutine, Dict, Iterable, List, Optional
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Coroutine,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+import zlib
+
+import attr
 
 from homeassistant import config_entries
 from homeassistant.const import ATTR_RESTORED, DEVICE_DEFAULT_NAME
@@ -17,7 +30,7 @@ from homeassistant.core import (
 )
 from homeassistant.exceptions import HomeAssistantError, PlatformNotReady
 from homeassistant.helpers import config_validation as cv, service
-from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.helpers.typing import ConfigType, HomeAssistantType
 from homeassistant.util.async_ import run_callback_threadsafe
 
 from .entity_registry import DISABLED_INTEGRATION
@@ -36,6 +49,31 @@ SLOW_ADD_MIN_TIMEOUT = 500
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
+# Platforms start polling up to this fraction of the scan interval early, so
+# platforms set up at the same time don't all poll in the same second.
+POLL_SPREAD = 0.1
+
+
+@attr.s(slots=True)
+class PollStatistics:
+    """Statistics of the entity updates done by polling a platform."""
+
+    updates: int = attr.ib(default=0)
+    # Updates skipped because the previous update was still running
+    overruns: int = attr.ib(default=0)
+    total_duration: float = attr.ib(default=0.0)
+    max_duration: float = attr.ib(default=0.0)
+
+    @property
+    def mean_duration(self) -> float:
+        """Return the mean duration of an update."""
+        return self.total_duration / self.updates if self.updates else 0.0
+
+    def add(self, duration: float) -> None:
+        """Add the duration of an update."""
+        self.updates += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
 
 
 class EntityPlatform:
@@ -62,6 +100,8 @@ class EntityPlatform:
         self.entity_namespace = entity_namespace
         self.config_entry: Optional[config_entries.ConfigEntry] = None
         self.entities: Dict[str, Entity] = {}  # pylint: disable=used-before-assignment
+        # Configurations the platform was set up with
+        self.platform_configs: List[ConfigType] = []
         self._tasks: List[asyncio.Future] = []
         # Stop tracking tasks after setup is completed
         self._setup_complete = False
@@ -69,7 +109,10 @@ class EntityPlatform:
         self._async_unsub_polling: Optional[CALLBACK_TYPE] = None
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: Optional[CALLBACK_TYPE] = None
-        self._process_updates: Optional[asyncio.Lock] = None
+        # Entities that are being updated by polling, and their last duration
+        self._polling: Set[str] = set()
+        self._poll_durations: Dict[str, float] = {}
+        self.poll_stats = PollStatistics()
 
         self.parallel_updates: Optional[asyncio.Semaphore] = None
 
@@ -120,6 +163,7 @@ class EntityPlatform:
         """Set up the platform from a config file."""
         platform = self.platform
         hass = self.hass
+        self.platform_configs.append(platform_config)
 
         if not hasattr(platform, "async_setup_platform") and not hasattr(
             platform, "setup_platform"
@@ -334,10 +378,22 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
+        @callback
+        def async_start_polling(now: datetime) -> None:
+            """Start polling at the scan interval."""
+            self._async_unsub_polling = async_track_time_interval(
+                self.hass,
+                self._update_entity_states,
+                self.scan_interval,
+            )
+            self._update_entity_states(now)
+
+        # A stable offset per platform, so restarts don't change the pattern
+        spread = zlib.crc32(f"{self.domain}.{self.platform_name}".encode()) / 2 ** 32
+        self._async_unsub_polling = async_call_later(
             self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+            self.scan_interval.total_seconds() * (1 - POLL_SPREAD * spread),
+            async_start_polling,
         )
 
     async def _async_add_entity(
@@ -515,6 +571,8 @@ class EntityPlatform:
             self._async_cancel_retry_setup()
             self._async_cancel_retry_setup = None
 
+        self.platform_configs = []
+
         if not self.entities:
             return
 
@@ -525,6 +583,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None:
             self._async_unsub_polling()
             self._async_unsub_polling = None
+        self._poll_durations.clear()
         self._setup_complete = False
 
     async def async_destroy(self) -> None:
@@ -538,6 +597,7 @@ class EntityPlatform:
     async def async_remove_entity(self, entity_id: str) -> None:
         """Remove entity id from platform."""
         await self.entities[entity_id].async_remove()
+        self._poll_durations.pop(entity_id, None)
 
         # Clean up polling job if no longer needed
         if self._async_unsub_polling is not None and not any(
@@ -589,34 +649,46 @@ class EntityPlatform:
             self.platform_name, name, handle_service, schema
         )
 
-    async def _update_entity_states(self, now: datetime) -> None:
+    @callback
+    def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        Every entity is updated in its own task, so a slow entity doesn't hold
+        up the others. Entities that updated fastest last time are started
+        first, so slow entities queue last for the parallel updates semaphore.
+        An entity whose previous update is still running is skipped.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
-            self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
-                self.platform_name,
-                self.domain,
-                self.scan_interval,
-            )
-            return
+        entities = [entity for entity in self.entities.values() if entity.should_poll]
+        entities.sort(key=lambda ent: self._poll_durations.get(ent.entity_id, 0))
+
+        for entity in entities:
+            if entity.entity_id in self._polling:
+                self.poll_stats.overruns += 1
+                self.logger.warning(
+                    "Updating %s %s took longer than the scheduled update interval %s",
+                    self.platform_name,
+                    entity.entity_id,
+                    self.scan_interval,
+                )
+                continue
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+            self._polling.add(entity.entity_id)
+            self.hass.async_create_task(self._async_poll_entity(entity))
 
-            if tasks:
-                await asyncio.gather(*tasks)
+    async def _async_poll_entity(self, entity: "Entity") -> None:
+        """Update the state of a polling entity and record its duration."""
+        entity_id = entity.entity_id
+        start = time.monotonic()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            duration = time.monotonic() - start
+            self._polling.discard(entity_id)
+            if entity_id in self.entities:
+                self._poll_durations[entity_id] = duration
+            self.poll_stats.add(duration)
 
 
 current_platform: ContextVar[Optional[EntityPlatform]] = ContextVar(
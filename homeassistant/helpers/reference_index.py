@@ -0,0 +1,85 @@
+"""Reverse index of the entities and devices referenced by items of a domain."""
+from typing import Dict, Iterable, List, Tuple
+
+from homeassistant.core import callback
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.loader import bind_hass
+
+DATA_REFERENCE_INDEX = "reference_index"
+
+
+class ReferenceIndex:
+    """Reverse index of the entities and devices referenced by items.
+
+    Items, like automations or scenes, are identified by their entity id.
+    Integrations set the references of an item when it is added or changed
+    and remove them when the item is removed, so finding the items that
+    reference an entity or device does not have to inspect every item.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty index."""
+        # Referenced entity or device id -> item ids, in the order they were set
+        self._by_entity: Dict[str, Dict[str, None]] = {}
+        self._by_device: Dict[str, Dict[str, None]] = {}
+        # Item id -> referenced entity ids and device ids
+        self._references: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {}
+
+    @callback
+    def async_set(
+        self,
+        item_id: str,
+        entity_ids: Iterable[str] = (),
+        device_ids: Iterable[str] = (),
+    ) -> None:
+        """Set the entities and devices referenced by an item."""
+        self.async_remove(item_id)
+
+        entity_ids = tuple(entity_ids)
+        device_ids = tuple(device_ids)
+        self._references[item_id] = (entity_ids, device_ids)
+        for entity_id in entity_ids:
+            self._by_entity.setdefault(entity_id, {})[item_id] = None
+        for device_id in device_ids:
+            self._by_device.setdefault(device_id, {})[item_id] = None
+
+    @callback
+    def async_remove(self, item_id: str) -> None:
+        """Remove the references of an item."""
+        references = self._references.pop(item_id, None)
+        if references is None:
+            return
+
+        entity_ids, device_ids = references
+        for index, referenced in (
+            (self._by_entity, entity_ids),
+            (self._by_device, device_ids),
+        ):
+            for reference in referenced:
+                items = index.get(reference)
+                if items is None:
+                    continue
+                items.pop(item_id, None)
+                if not items:
+                    del index[reference]
+
+    @callback
+    def async_items_with_entity(self, entity_id: str) -> List[str]:
+        """Return the items that reference an entity."""
+        return list(self._by_entity.get(entity_id, ()))
+
+    @callback
+    def async_items_with_device(self, device_id: str) -> List[str]:
+        """Return the items that reference a device."""
+        return list(self._by_device.get(device_id, ()))
+
+
+@callback
+@bind_hass
+def async_get_reference_index(hass: HomeAssistantType, domain: str) -> ReferenceIndex:
+    """Return the reference index of a domain."""
+    indexes: Dict[str, ReferenceIndex] = hass.data.setdefault(DATA_REFERENCE_INDEX, {})
+    index = indexes.get(domain)
+    if index is None:
+        index = indexes[domain] = ReferenceIndex()
+    return index
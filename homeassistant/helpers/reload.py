@@ -2,13 +2,14 @@
 
 import asyncio
 import logging
+import time
 from typing import Any, Dict, Iterable, List, Optional
 
 from homeassistant import config as conf_util
 from homeassistant.const import SERVICE_RELOAD
 from homeassistant.core import Event, callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import config_per_platform
+from homeassistant.helpers import config_per_platform, template
 from homeassistant.helpers.entity_platform import EntityPlatform, async_get_platforms
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import async_get_integration
@@ -29,6 +30,7 @@ async def async_reload_integration_platforms(
 
     Examples are template, stats, derivative, utility meter.
     """
+    start = time.monotonic()
     try:
         unprocessed_conf = await conf_util.async_hass_config_yaml(hass)
     except HomeAssistantError as err:
@@ -43,6 +45,11 @@ async def async_reload_integration_platforms(
     ]
 
     await asyncio.gather(*tasks)
+    _LOGGER.debug(
+        "Reloaded %s platforms in %.3f seconds",
+        integration_name,
+        time.monotonic() - start,
+    )
 
 
 async def _resetup_platform(
@@ -121,7 +128,21 @@ async def _async_setup_platform(
 async def _async_reconfig_platform(
     platform: EntityPlatform, platform_configs: List[Dict]
 ) -> None:
-    """Reconfigure an already loaded platform."""
+    """Reconfigure an already loaded platform.
+
+    The platform is left alone if it was set up with the same configuration.
+    """
+    # Templates of the platform in use have hass attached, which is part of
+    # their equality
+    template.attach(platform.hass, platform_configs)
+    if platform.platform_configs == platform_configs:
+        _LOGGER.debug(
+            "Configuration of %s.%s unchanged, not reloading",
+            platform.platform_name,
+            platform.domain,
+        )
+        return
+
     await platform.async_reset()
     tasks = [platform.async_setup(p_config) for p_config in platform_configs]  # type: ignore
     await asyncio.gather(*tasks)
@@ -59,6 +59,10 @@ class ScriptVariables:
 
         return rendered_variables
 
+    def __eq__(self, other: Any) -> bool:
+        """Compare the variables with those of another instance."""
+        return isinstance(other, ScriptVariables) and self.variables == other.variables
+
     def as_dict(self) -> dict:
         """Return dict version of this class."""
         return self.variables
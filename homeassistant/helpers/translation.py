@@ -1,9 +1,13 @@
 """Translation string lookup helpers."""
 import asyncio
 from collections import ChainMap
+import json
 import logging
-from typing import Any, Dict, List, Optional, Set
+import os
+import re
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 
+from homeassistant.const import __version__
 from homeassistant.core import callback
 from homeassistant.loader import (
     MAX_LOAD_CONCURRENTLY,
@@ -15,6 +19,7 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .storage import Store
 from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
@@ -23,6 +28,13 @@ TRANSLATION_LOAD_LOCK = "translation_load_lock"
 TRANSLATION_FLATTEN_CACHE = "translation_flatten_cache"
 LOCALE_EN = "en"
 
+STORAGE_KEY = "core.translations"
+STORAGE_VERSION = 1
+SAVE_DELAY = 30
+
+# Only languages that are safe to use in a file name are persisted
+BUNDLE_LANGUAGE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 def recursive_flatten(prefix: Any, data: Dict) -> Dict[str, Any]:
     """Return a flattened representation of dict data."""
@@ -145,12 +157,12 @@ def _build_resources(
     }
 
 
-async def async_get_component_strings(
-    hass: HomeAssistantType, language: str, components: Set[str]
-) -> Dict[str, Any]:
-    """Load translations."""
+async def _async_get_integrations(
+    hass: HomeAssistantType, components: Set[str]
+) -> Dict[str, Integration]:
+    """Return the integrations providing the given components by domain."""
     domains = list({loaded.split(".")[-1] for loaded in components})
-    integrations = dict(
+    return dict(
         zip(
             domains,
             await gather_with_concurrency(
@@ -160,6 +172,63 @@ async def async_get_component_strings(
         )
     )
 
+
+def _integration_version(integration: Integration) -> Optional[str]:
+    """Return the version the translations of an integration belong to.
+
+    Custom integrations without a version can't be validated and return None.
+    """
+    if integration.is_built_in:
+        return __version__
+    version: Optional[str] = integration.manifest.get("version")
+    return version
+
+
+def _translation_fingerprints(
+    sources: Dict[str, Tuple[Optional[str], Optional[str]]]
+) -> Dict[str, Optional[str]]:
+    """Return fingerprints for the translation files of components.
+
+    Sources map each component to its integration version and translation
+    file. The modification time and size of the file are included, so edited
+    translations are picked up even when the version is unchanged.
+    """
+    fingerprints: Dict[str, Optional[str]] = {}
+    for component, (version, path) in sources.items():
+        if version is None or path is None:
+            fingerprints[component] = version
+            continue
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            fingerprints[component] = f"{version}:missing"
+        except OSError:
+            fingerprints[component] = None
+        else:
+            fingerprints[component] = f"{version}:{stat.st_mtime_ns}:{stat.st_size}"
+    return fingerprints
+
+
+def _valid_bundle(data: Any) -> bool:
+    """Return if persisted data is a translation bundle of this version."""
+    return (
+        isinstance(data, dict)
+        and data.get("ha_version") == __version__
+        and isinstance(data.get("fingerprints"), dict)
+        and isinstance(data.get("strings"), dict)
+    )
+
+
+async def async_get_component_strings(
+    hass: HomeAssistantType,
+    language: str,
+    components: Set[str],
+    integrations: Optional[Dict[str, Integration]] = None,
+) -> Dict[str, Any]:
+    """Load translations."""
+    if integrations is None:
+        integrations = await _async_get_integrations(hass, components)
+
     translations: Dict[str, Any] = {}
 
     # Determine paths of missing components/platforms
@@ -200,13 +269,22 @@ async def async_get_component_strings(
 
 
 class _TranslationCache:
-    """Cache for flattened translations."""
+    """Cache for flattened translations.
+
+    The translation strings read for each language are kept in a bundle that
+    is persisted to storage, so after a restart they are restored with a
+    single read per language instead of loading every translation file again.
+    Entries are only reused while the fingerprint of their file matches.
+    """
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the cache."""
         self.hass = hass
         self.loaded: Dict[str, Set[str]] = {}
         self.cache: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.bundles: Dict[str, Dict[str, Any]] = {}
+        self.stores: Dict[str, Store] = {}
+        self.json_cache: Dict[Tuple[str, str, FrozenSet[str]], str] = {}
 
     async def async_fetch(
         self,
@@ -224,6 +302,21 @@ class _TranslationCache:
 
         return [cached.get(component, {}).get(category, {}) for component in components]
 
+    async def async_fetch_json(
+        self,
+        language: str,
+        category: str,
+        components: Set,
+    ) -> str:
+        """Load resources into the cache and return them serialized as resources."""
+        cached = await self.async_fetch(language, category, components)
+        key = (language, category, frozenset(components))
+
+        if key not in self.json_cache:
+            self.json_cache[key] = json.dumps({"resources": dict(ChainMap(*cached))})
+
+        return self.json_cache[key]
+
     async def _async_load(self, language: str, components: Set) -> None:
         """Populate the cache for a given set of components."""
         _LOGGER.debug(
@@ -233,16 +326,99 @@ class _TranslationCache:
         )
         # Fetch the English resources, as a fallback for missing keys
         languages = [LOCALE_EN] if language == LOCALE_EN else [LOCALE_EN, language]
-        for translation_strings in await asyncio.gather(
+
+        integrations = await _async_get_integrations(self.hass, components)
+        loaded_strings = await asyncio.gather(
             *[
-                async_get_component_strings(self.hass, lang, components)
+                self._async_get_strings(lang, components, integrations)
                 for lang in languages
             ]
-        ):
+        )
+
+        for translation_strings in loaded_strings:
             self._build_category_cache(language, components, translation_strings)
 
         self.loaded[language].update(components)
 
+    async def _async_get_strings(
+        self, language: str, components: Set, integrations: Dict[str, Integration]
+    ) -> Dict[str, Any]:
+        """Return the translation strings of a language, from its bundle if current."""
+        bundle = await self._async_get_bundle(language)
+        sources = {}
+        for component in components:
+            integration = integrations[component.split(".")[-1]]
+            sources[component] = (
+                _integration_version(integration),
+                component_translation_path(component, language, integration),
+            )
+        fingerprints = await self.hass.async_add_executor_job(
+            _translation_fingerprints, sources
+        )
+
+        bundle_strings = bundle["strings"]
+        translation_strings = {
+            component: bundle_strings[component]
+            for component in components
+            if fingerprints[component] is not None
+            and bundle["fingerprints"].get(component) == fingerprints[component]
+            and isinstance(bundle_strings.get(component), dict)
+        }
+        components_to_read = components - set(translation_strings)
+        if not components_to_read:
+            return translation_strings
+
+        loaded = await async_get_component_strings(
+            self.hass, language, components_to_read, integrations
+        )
+        translation_strings.update(loaded)
+
+        persist = [
+            component
+            for component in components_to_read
+            if fingerprints[component] is not None and component in loaded
+        ]
+        for component in persist:
+            bundle_strings[component] = loaded[component]
+            bundle["fingerprints"][component] = fingerprints[component]
+        if persist:
+            self._async_schedule_save(language)
+
+        return translation_strings
+
+    async def _async_get_bundle(self, language: str) -> Dict[str, Any]:
+        """Return the persisted translation strings for a language."""
+        bundle = self.bundles.get(language)
+        if bundle is not None:
+            return bundle
+
+        store = self._async_get_store(language)
+        data = await store.async_load() if store is not None else None
+
+        if not _valid_bundle(data):
+            data = {"ha_version": __version__, "fingerprints": {}, "strings": {}}
+
+        self.bundles[language] = data
+        return data
+
+    @callback
+    def _async_get_store(self, language: str) -> Optional[Store]:
+        """Return the store of the translation bundle of a language."""
+        if not BUNDLE_LANGUAGE.match(language):
+            return None
+        if language not in self.stores:
+            self.stores[language] = Store(
+                self.hass, STORAGE_VERSION, f"{STORAGE_KEY}.{language}"
+            )
+        return self.stores[language]
+
+    @callback
+    def _async_schedule_save(self, language: str) -> None:
+        """Schedule saving the translation bundle of a language."""
+        store = self._async_get_store(language)
+        if store is not None:
+            store.async_delay_save(lambda: self.bundles[language], SAVE_DELAY)
+
     @callback
     def _build_category_cache(
         self,
@@ -251,6 +427,7 @@ class _TranslationCache:
         translation_strings: Dict[str, Dict[str, Any]],
     ) -> None:
         """Extract resources into the cache."""
+        self.json_cache.clear()
         cached = self.cache.setdefault(language, {})
         categories: Set[str] = set()
         for resource in translation_strings.values():
@@ -278,6 +455,23 @@ class _TranslationCache:
                     category_cache[f"component.{component}.{category}"] = resource
 
 
+async def _async_get_components(
+    hass: HomeAssistantType,
+    category: str,
+    integration: Optional[str] = None,
+    config_flow: Optional[bool] = None,
+) -> Set[str]:
+    """Return the components to load translations for."""
+    if integration is not None:
+        return {integration}
+    if config_flow:
+        return (await async_get_config_flows(hass)) - hass.config.components
+    if category == "state":
+        return set(hass.config.components)
+    # Only 'state' supports merging, so remove platforms from selection
+    return {component for component in hass.config.components if "." not in component}
+
+
 @bind_hass
 async def async_get_translations(
     hass: HomeAssistantType,
@@ -294,20 +488,33 @@ async def async_get_translations(
     """
     lock = hass.data.setdefault(TRANSLATION_LOAD_LOCK, asyncio.Lock())
 
-    if integration is not None:
-        components = {integration}
-    elif config_flow:
-        components = (await async_get_config_flows(hass)) - hass.config.components
-    elif category == "state":
-        components = set(hass.config.components)
-    else:
-        # Only 'state' supports merging, so remove platforms from selection
-        components = {
-            component for component in hass.config.components if "." not in component
-        }
+    components = await _async_get_components(hass, category, integration, config_flow)
 
     async with lock:
         cache = hass.data.setdefault(TRANSLATION_FLATTEN_CACHE, _TranslationCache(hass))
         cached = await cache.async_fetch(language, category, components)
 
     return dict(ChainMap(*cached))
+
+
+@bind_hass
+async def async_get_translations_json(
+    hass: HomeAssistantType,
+    language: str,
+    category: str,
+    integration: Optional[str] = None,
+    config_flow: Optional[bool] = None,
+) -> str:
+    """Return all backend translations serialized as a resources object.
+
+    The result is the JSON of {"resources": translations}, ready to be sent
+    as the result of a websocket message. It is cached until new translations
+    are loaded.
+    """
+    lock = hass.data.setdefault(TRANSLATION_LOAD_LOCK, asyncio.Lock())
+
+    components = await _async_get_components(hass, category, integration, config_flow)
+
+    async with lock:
+        cache = hass.data.setdefault(TRANSLATION_FLATTEN_CACHE, _TranslationCache(hass))
+        return await cache.async_fetch_json(language, category, components)
@@ -6,6 +6,8 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import os
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, Dict, TypeVar
 
@@ -323,6 +325,126 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+def _statistics_samples():
+    """Return samples for the statistics benchmarks."""
+    return [float(i % 997) for i in range(10 ** 5)]
+
+
+@benchmark
+async def statistics_window(hass):
+    """Update statistics of a 10000 sample window 100000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.statistics.window import WindowStatistics
+
+    samples = _statistics_samples()
+    window = WindowStatistics(10 ** 4)
+    for sample in samples[-(10 ** 4) :]:
+        window.append(sample, None)
+
+    start = timer()
+    for sample in samples:
+        window.append(sample, None)
+        _ = (window.mean, window.median, window.stdev, window.min, window.max)
+    return timer() - start
+
+
+@benchmark
+async def statistics_recompute(hass):
+    """Recompute statistics of a 10000 sample window 1000 times."""
+    # pylint: disable=import-outside-toplevel
+    import statistics
+
+    samples = _statistics_samples()[: 10 ** 3]
+    window = collections.deque(_statistics_samples()[-(10 ** 4) :], maxlen=10 ** 4)
+
+    start = timer()
+    for sample in samples:
+        window.append(sample)
+        _ = (
+            statistics.mean(window),
+            statistics.median(window),
+            statistics.stdev(window),
+            min(window),
+            max(window),
+        )
+    return timer() - start
+
+
+async def _setup_nested_groups(hass):
+    """Set up a group of ten groups of 300 lights each."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components import group
+
+    hass.state = core.CoreState.running
+    hass.data[group.REG_KEY] = group.GroupIntegrationRegistry()
+    for index in range(10):
+        await group.Group.async_create_group(
+            hass,
+            f"lights_{index}",
+            [f"light.light_{index}_{light}" for light in range(300)],
+        )
+    await group.Group.async_create_group(
+        hass, "all_lights", [f"group.lights_{index}" for index in range(10)]
+    )
+    await hass.async_block_till_done()
+
+
+@benchmark
+async def group_member_changes(hass):
+    """Toggle members of groups of 300 lights 10000 times."""
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await _setup_nested_groups(hass)
+
+        start = timer()
+        for index in range(10 ** 4):
+            hass.states.async_set(
+                f"light.light_{index % 10}_{index % 300}",
+                "on" if index // 300 % 2 else "off",
+            )
+            await hass.async_block_till_done()
+        return timer() - start
+
+
+@benchmark
+async def group_expand_entity_ids(hass):
+    """Expand a group of ten groups of 300 lights 1000 times."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.group import expand_entity_ids
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await _setup_nested_groups(hass)
+
+        start = timer()
+        for _ in range(10 ** 3):
+            expand_entity_ids(hass, ["group.all_lights"])
+        return timer() - start
+
+
+@benchmark
+async def system_log_records(hass):
+    """Handle 50000 error records logged from ten lines."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.system_log import LogErrorHandler
+
+    hass.config.config_dir = os.path.dirname(__file__)
+    handler = LogErrorHandler(hass, 50, True)
+    records = [
+        logging.LogRecord(
+            "benchmark", logging.ERROR, __file__, lineno, "error %s", (lineno,), None
+        )
+        for lineno in range(10)
+    ]
+
+    start = timer()
+    for _ in range(5 * 10 ** 3):
+        for record in records:
+            handler.handle(record)
+    await hass.async_block_till_done()
+    return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
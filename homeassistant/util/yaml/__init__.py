@@ -2,7 +2,16 @@
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .dumper import dump, save_yaml
 from .input import UndefinedSubstitution, extract_inputs, substitute
-from .loader import clear_secret_cache, load_yaml, parse_yaml, secret_yaml
+from .loader import (
+    clear_node_cache,
+    clear_secret_cache,
+    is_node_cached,
+    load_node_cache,
+    load_yaml,
+    parse_yaml,
+    save_node_cache,
+    secret_yaml,
+)
 from .objects import Input
 
 __all__ = [
@@ -12,6 +21,10 @@ __all__ = [
     "dump",
     "save_yaml",
     "clear_secret_cache",
+    "clear_node_cache",
+    "is_node_cached",
+    "load_node_cache",
+    "save_node_cache",
     "load_yaml",
     "secret_yaml",
     "parse_yaml",
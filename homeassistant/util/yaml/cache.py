@@ -0,0 +1,238 @@
+"""Cache of composed YAML node trees."""
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from .const import SECRET_YAML
+
+_LOGGER = logging.getLogger(__name__)
+
+CACHE_VERSION = 1
+
+# Files modified this recently may still be written to within the timestamp
+# granularity of the filesystem, so their mtime is not trusted yet.
+RACY_WINDOW_NS = 2_000_000_000
+
+MISSING = object()
+
+_SCALAR = "s"
+_SEQUENCE = "q"
+_MAPPING = "m"
+_ALIAS = "*"
+
+CacheEntry = Tuple[int, int, Optional[yaml.nodes.Node]]
+
+
+class NodeCache:
+    """Cache composed node trees of YAML files, validated by mtime and size.
+
+    Only the node tree is cached, the construction of Python objects (which
+    resolves includes, secrets and environment variables) always runs. Cached
+    trees are shared between loads and must never be modified.
+
+    Nothing is cached until a root directory is set by load, after which only
+    files below that directory are cached. Secrets files are never cached.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the cache."""
+        self._entries: Dict[str, CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._loaded_from: Optional[str] = None
+        self._root: Optional[str] = None
+        self._dirty = False
+
+    def __contains__(self, fname: str) -> bool:
+        """Return if a file has a cached node tree."""
+        with self._lock:
+            return os.path.abspath(fname) in self._entries
+
+    def get(self, fname: str, stat: os.stat_result) -> Any:
+        """Return the cached node tree of a file or MISSING."""
+        with self._lock:
+            entry = self._entries.get(os.path.abspath(fname))
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            return MISSING
+        return entry[2]
+
+    def set(
+        self, fname: str, stat: os.stat_result, node: Optional[yaml.nodes.Node]
+    ) -> None:
+        """Store the node tree of a file."""
+        if time.time_ns() - stat.st_mtime_ns < RACY_WINDOW_NS:
+            return
+        fname = os.path.abspath(fname)
+        with self._lock:
+            if not self._should_cache(fname):
+                return
+            self._entries[fname] = (stat.st_mtime_ns, stat.st_size, node)
+            self._dirty = True
+
+    def _should_cache(self, fname: str) -> bool:
+        """Return if the node tree of an absolute file name may be cached."""
+        return (
+            self._root is not None
+            and fname.startswith(self._root)
+            and os.path.basename(fname) != SECRET_YAML
+        )
+
+    def clear(self) -> None:
+        """Clear the cache and stop caching until loaded again."""
+        with self._lock:
+            self._entries.clear()
+            self._loaded_from = None
+            self._root = None
+            self._dirty = False
+
+    def load(self, path: str, root: str) -> None:
+        """Load persisted node trees from disk and cache files below root."""
+        with self._lock:
+            self._root = os.path.join(os.path.abspath(root), "")
+            if self._loaded_from == path:
+                return
+            self._loaded_from = path
+
+            try:
+                with open(path, encoding="utf-8") as cache_file:
+                    data = json.load(cache_file)
+            except FileNotFoundError:
+                return
+            except (OSError, ValueError) as err:
+                _LOGGER.warning("Unable to read YAML cache %s: %s", path, err)
+                return
+
+            if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+                return
+
+            entries = data.get("entries")
+            if not isinstance(entries, dict):
+                return
+
+            for fname, entry in entries.items():
+                if fname in self._entries or not self._should_cache(fname):
+                    continue
+                try:
+                    mtime_ns, size, encoded = entry
+                    node = _decode(encoded, fname)
+                except (IndexError, KeyError, TypeError, ValueError):
+                    _LOGGER.debug("Ignoring invalid YAML cache entry for %s", fname)
+                    continue
+                self._entries[fname] = (mtime_ns, size, node)
+
+    def save(self, path: str) -> None:
+        """Persist the cached node trees to disk.
+
+        Entries of files that can no longer be found are dropped.
+        """
+        with self._lock:
+            if not self._dirty:
+                return
+            self._dirty = False
+            for fname in list(self._entries):
+                if not os.path.isfile(fname):
+                    del self._entries[fname]
+            entries = {
+                fname: [mtime_ns, size, _encode(node)]
+                for fname, (mtime_ns, size, node) in self._entries.items()
+            }
+
+            tmp_filename = ""
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                with tempfile.NamedTemporaryFile(
+                    mode="w",
+                    encoding="utf-8",
+                    dir=os.path.dirname(path),
+                    delete=False,
+                ) as cache_file:
+                    tmp_filename = cache_file.name
+                    json.dump(
+                        {"version": CACHE_VERSION, "entries": entries},
+                        cache_file,
+                        separators=(",", ":"),
+                    )
+                os.replace(tmp_filename, path)
+            except (OSError, RecursionError, ValueError) as err:
+                _LOGGER.warning("Unable to write YAML cache %s: %s", path, err)
+                if tmp_filename and os.path.exists(tmp_filename):
+                    os.remove(tmp_filename)
+
+
+def _encode(root: Optional[yaml.nodes.Node]) -> Optional[List[Any]]:
+    """Encode a node tree into JSON serializable lists.
+
+    Nodes that appear more than once (YAML aliases) are encoded once and
+    referenced by the order in which they were first seen.
+    """
+    if root is None:
+        return None
+
+    memo: Dict[int, int] = {}
+
+    def encode(node: yaml.nodes.Node) -> List[Any]:
+        if id(node) in memo:
+            return [_ALIAS, memo[id(node)]]
+        memo[id(node)] = len(memo)
+        mark = node.start_mark
+        if isinstance(node, yaml.ScalarNode):
+            return [_SCALAR, node.tag, mark.line, mark.column, node.value, node.style]
+        if isinstance(node, yaml.SequenceNode):
+            return [
+                _SEQUENCE,
+                node.tag,
+                mark.line,
+                mark.column,
+                [encode(item) for item in node.value],
+                node.flow_style,
+            ]
+        return [
+            _MAPPING,
+            node.tag,
+            mark.line,
+            mark.column,
+            [[encode(key), encode(value)] for key, value in node.value],
+            node.flow_style,
+        ]
+
+    return encode(root)
+
+
+def _decode(encoded: Optional[List[Any]], fname: str) -> Optional[yaml.nodes.Node]:
+    """Decode a node tree encoded by _encode."""
+    if encoded is None:
+        return None
+
+    seen: List[yaml.nodes.Node] = []
+
+    def decode(item: List[Any]) -> yaml.nodes.Node:
+        kind = item[0]
+        if kind == _ALIAS:
+            return seen[item[1]]
+
+        _, tag, line, column, value, style = item
+        mark = yaml.Mark(fname, 0, line, column, None, None)
+        node: yaml.nodes.Node
+        if kind == _SCALAR:
+            node = yaml.ScalarNode(tag, value, mark, mark, style)
+            seen.append(node)
+        elif kind == _SEQUENCE:
+            node = yaml.SequenceNode(tag, [], mark, mark, style)
+            seen.append(node)
+            node.value.extend(decode(child) for child in value)
+        elif kind == _MAPPING:
+            node = yaml.MappingNode(tag, [], mark, mark, style)
+            seen.append(node)
+            node.value.extend(
+                (decode(key), decode(child_value)) for key, child_value in value
+            )
+        else:
+            raise ValueError(f"Unknown node kind {kind}")
+        return node
+
+    return decode(encoded)
@@ -4,12 +4,13 @@ import fnmatch
 import logging
 import os
 import sys
-from typing import Dict, Iterator, List, TextIO, TypeVar, Union, overload
+from typing import Any, Dict, Iterator, List, Optional, TextIO, TypeVar, Union, overload
 
 import yaml
 
 from homeassistant.exceptions import HomeAssistantError
 
+from .cache import MISSING, NodeCache
 from .const import _SECRET_NAMESPACE, SECRET_YAML
 from .objects import Input, NodeListClass, NodeStrClass
 
@@ -30,7 +31,9 @@ JSON_TYPE = Union[List, Dict, str]  # pylint: disable=invalid-name
 DICT_T = TypeVar("DICT_T", bound=Dict)  # pylint: disable=invalid-name
 
 _LOGGER = logging.getLogger(__name__)
+HAS_C_LOADER: bool = getattr(yaml, "__with_libyaml__", False)
 __SECRET_CACHE: Dict[str, JSON_TYPE] = {}
+_NODE_CACHE = NodeCache()
 
 CREDSTASH_WARN = False
 KEYRING_WARN = False
@@ -44,6 +47,40 @@ def clear_secret_cache() -> None:
     __SECRET_CACHE.clear()
 
 
+def clear_node_cache() -> None:
+    """Clear the cache of parsed YAML files.
+
+    Async friendly.
+    """
+    _NODE_CACHE.clear()
+
+
+def load_node_cache(path: str, root: str) -> None:
+    """Load the cache of parsed YAML files from disk.
+
+    Only files below root are cached from then on.
+
+    This method needs to run in an executor.
+    """
+    _NODE_CACHE.load(path, root)
+
+
+def save_node_cache(path: str) -> None:
+    """Persist the cache of parsed YAML files to disk.
+
+    This method needs to run in an executor.
+    """
+    _NODE_CACHE.save(path)
+
+
+def is_node_cached(fname: str) -> bool:
+    """Return if the parsed YAML of a file is cached.
+
+    Async friendly.
+    """
+    return fname in _NODE_CACHE
+
+
 class SafeLineLoader(yaml.SafeLoader):
     """Loader class that keeps track of line numbers."""
 
@@ -55,22 +92,87 @@ class SafeLineLoader(yaml.SafeLoader):
         return node
 
 
+class FastSafeLoader(
+    yaml.CSafeLoader if HAS_C_LOADER else SafeLineLoader  # type: ignore
+):
+    """Loader class that uses the libyaml C parser when available.
+
+    Line numbers are taken from the start marks libyaml attaches to nodes.
+    """
+
+    def __init__(self, stream: Union[str, TextIO]) -> None:
+        """Initialize the loader."""
+        super().__init__(stream)
+        if isinstance(stream, str):
+            self.name = "<unicode string>"
+        else:
+            self.name = getattr(stream, "name", "<file>")
+        self.stream = stream
+
+    def construct_mapping(
+        self, node: yaml.nodes.MappingNode, deep: bool = False
+    ) -> Dict:
+        """Construct a mapping without modifying the (cached) node."""
+        return yaml.constructor.BaseConstructor.construct_mapping(
+            self, _flatten_mapping(self, node), deep=deep
+        )
+
+
+def _compose(content: Union[str, TextIO]) -> Optional[yaml.nodes.Node]:
+    """Compose the node tree of a YAML document."""
+    loader = FastSafeLoader(content)
+    try:
+        return loader.get_single_node()
+    finally:
+        loader.dispose()
+
+
+def _construct(node: Optional[yaml.nodes.Node], name: str) -> JSON_TYPE:
+    """Construct Python objects from a node tree."""
+    if node is None:
+        # If configuration file is empty YAML returns None
+        # We convert that to an empty dict
+        return OrderedDict()
+    loader = FastSafeLoader("")
+    loader.name = name
+    try:
+        return loader.construct_document(node) or OrderedDict()
+    finally:
+        loader.dispose()
+
+
+def _compose_file(conf_file: TextIO) -> Optional[yaml.nodes.Node]:
+    """Compose the node tree of a file, using the cache when unchanged."""
+    try:
+        stat = os.fstat(conf_file.fileno())
+    except (OSError, ValueError):
+        # In-memory streams have no file descriptor
+        return _compose(conf_file)
+
+    node = _NODE_CACHE.get(conf_file.name, stat)
+    if node is MISSING:
+        node = _compose(conf_file)
+        _NODE_CACHE.set(conf_file.name, stat, node)
+    return node  # type: ignore
+
+
 def load_yaml(fname: str) -> JSON_TYPE:
     """Load a YAML file."""
     try:
         with open(fname, encoding="utf-8") as conf_file:
-            return parse_yaml(conf_file)
+            return _construct(_compose_file(conf_file), conf_file.name)
     except UnicodeDecodeError as exc:
         _LOGGER.error("Unable to read file %s: %s", fname, exc)
         raise HomeAssistantError(exc) from exc
+    except yaml.YAMLError as exc:
+        _LOGGER.error(str(exc))
+        raise HomeAssistantError(exc) from exc
 
 
 def parse_yaml(content: Union[str, TextIO]) -> JSON_TYPE:
     """Load a YAML file."""
     try:
-        # If configuration file is empty YAML returns None
-        # We convert that to an empty dict
-        return yaml.load(content, Loader=SafeLineLoader) or OrderedDict()
+        return yaml.load(content, Loader=FastSafeLoader) or OrderedDict()
     except yaml.YAMLError as exc:
         _LOGGER.error(str(exc))
         raise HomeAssistantError(exc) from exc
@@ -97,7 +199,7 @@ def _add_reference(
     ...
 
 
-def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type: ignore
+def _add_reference(obj, loader: FastSafeLoader, node: yaml.nodes.Node):  # type: ignore
     """Add file reference information to an object."""
     if isinstance(obj, list):
         obj = NodeListClass(obj)
@@ -108,7 +210,7 @@ def _add_reference(obj, loader: SafeLineLoader, node: yaml.nodes.Node):  # type:
     return obj
 
 
-def _include_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _include_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load another YAML file and embeds it using the !include tag.
 
     Example:
@@ -140,7 +242,7 @@ def _find_files(directory: str, pattern: str) -> Iterator[str]:
 
 
 def _include_dir_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -154,7 +256,7 @@ def _include_dir_named_yaml(
 
 
 def _include_dir_merge_named_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> OrderedDict:
     """Load multiple files from directory as a merged dictionary."""
     mapping: OrderedDict = OrderedDict()
@@ -169,7 +271,7 @@ def _include_dir_merge_named_yaml(
 
 
 def _include_dir_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> List[JSON_TYPE]:
     """Load multiple files from directory as a list."""
     loc = os.path.join(os.path.dirname(loader.name), node.value)
@@ -181,7 +283,7 @@ def _include_dir_list_yaml(
 
 
 def _include_dir_merge_list_yaml(
-    loader: SafeLineLoader, node: yaml.nodes.Node
+    loader: FastSafeLoader, node: yaml.nodes.Node
 ) -> JSON_TYPE:
     """Load multiple files from directory as a merged list."""
     loc: str = os.path.join(os.path.dirname(loader.name), node.value)
@@ -195,9 +297,67 @@ def _include_dir_merge_list_yaml(
     return _add_reference(merged_list, loader, node)
 
 
-def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
+def _flatten_mapping(
+    loader: FastSafeLoader, node: yaml.nodes.MappingNode
+) -> yaml.nodes.MappingNode:
+    """Return a mapping node with merge keys (<<) expanded.
+
+    Unlike SafeConstructor.flatten_mapping the node is not modified in place,
+    as it may be shared with the node cache. A new node is returned when
+    there is something to expand.
+    """
+    merge: List = []
+    value: List = []
+    changed = False
+    for key_node, value_node in node.value:
+        if key_node.tag == "tag:yaml.org,2002:merge":
+            changed = True
+            if isinstance(value_node, yaml.MappingNode):
+                merge.extend(_flatten_mapping(loader, value_node).value)
+            elif isinstance(value_node, yaml.SequenceNode):
+                submerge = []
+                for subnode in value_node.value:
+                    if not isinstance(subnode, yaml.MappingNode):
+                        raise yaml.constructor.ConstructorError(
+                            "while constructing a mapping",
+                            node.start_mark,
+                            f"expected a mapping for merging, but found {subnode.id}",
+                            subnode.start_mark,
+                        )
+                    submerge.append(_flatten_mapping(loader, subnode).value)
+                for subvalue in reversed(submerge):
+                    merge.extend(subvalue)
+            else:
+                raise yaml.constructor.ConstructorError(
+                    "while constructing a mapping",
+                    node.start_mark,
+                    "expected a mapping or list of mappings for merging, "
+                    f"but found {value_node.id}",
+                    value_node.start_mark,
+                )
+        elif key_node.tag == "tag:yaml.org,2002:value":
+            changed = True
+            key_node = yaml.ScalarNode(
+                "tag:yaml.org,2002:str",
+                key_node.value,
+                key_node.start_mark,
+                key_node.end_mark,
+                key_node.style,
+            )
+            value.append((key_node, value_node))
+        else:
+            value.append((key_node, value_node))
+
+    if not changed:
+        return node
+    return yaml.MappingNode(
+        node.tag, merge + value, node.start_mark, node.end_mark, node.flow_style
+    )
+
+
+def _ordered_dict(loader: FastSafeLoader, node: yaml.nodes.MappingNode) -> OrderedDict:
     """Load YAML mappings into an ordered dictionary to preserve key order."""
-    loader.flatten_mapping(node)
+    node = _flatten_mapping(loader, node)
     nodes = loader.construct_pairs(node)
 
     seen: Dict = {}
@@ -207,14 +367,14 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
         try:
             hash(key)
         except TypeError as exc:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             raise yaml.MarkedYAMLError(
                 context=f'invalid key: "{key}"',
                 context_mark=yaml.Mark(fname, 0, line, -1, None, None),
             ) from exc
 
         if key in seen:
-            fname = getattr(loader.stream, "name", "")
+            fname = loader.name
             _LOGGER.warning(
                 'YAML file %s contains duplicate key "%s". Check lines %d and %d',
                 fname,
@@ -227,13 +387,13 @@ def _ordered_dict(loader: SafeLineLoader, node: yaml.nodes.MappingNode) -> Order
     return _add_reference(OrderedDict(nodes), loader, node)
 
 
-def _construct_seq(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def _construct_seq(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Add line number and file name to Load YAML sequence."""
     (obj,) = loader.construct_yaml_seq(node)
     return _add_reference(obj, loader, node)
 
 
-def _env_var_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> str:
+def _env_var_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> str:
     """Load environment variables and embed it into the configuration YAML."""
     args = node.value.split()
 
@@ -273,7 +433,7 @@ def _load_secret_yaml(secret_path: str) -> JSON_TYPE:
     return secrets
 
 
-def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
+def secret_yaml(loader: FastSafeLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     """Load secrets and embed it into the configuration YAML."""
     secret_path = os.path.dirname(loader.name)
     while True:
@@ -334,19 +494,28 @@ def secret_yaml(loader: SafeLineLoader, node: yaml.nodes.Node) -> JSON_TYPE:
     raise HomeAssistantError(f"Secret {node.value} not defined")
 
 
-yaml.SafeLoader.add_constructor("!include", _include_yaml)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
-)
-yaml.SafeLoader.add_constructor(
-    yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
-)
-yaml.SafeLoader.add_constructor("!env_var", _env_var_yaml)
-yaml.SafeLoader.add_constructor("!secret", secret_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_list", _include_dir_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_merge_list", _include_dir_merge_list_yaml)
-yaml.SafeLoader.add_constructor("!include_dir_named", _include_dir_named_yaml)
-yaml.SafeLoader.add_constructor(
-    "!include_dir_merge_named", _include_dir_merge_named_yaml
-)
-yaml.SafeLoader.add_constructor("!input", Input.from_node)
+def _add_constructors(loader_class: Any) -> None:
+    """Add the Home Assistant constructors to a loader class."""
+    loader_class.add_constructor("!include", _include_yaml)
+    loader_class.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_MAPPING_TAG, _ordered_dict
+    )
+    loader_class.add_constructor(
+        yaml.resolver.BaseResolver.DEFAULT_SEQUENCE_TAG, _construct_seq
+    )
+    loader_class.add_constructor("!env_var", _env_var_yaml)
+    loader_class.add_constructor("!secret", secret_yaml)
+    loader_class.add_constructor("!include_dir_list", _include_dir_list_yaml)
+    loader_class.add_constructor(
+        "!include_dir_merge_list", _include_dir_merge_list_yaml
+    )
+    loader_class.add_constructor("!include_dir_named", _include_dir_named_yaml)
+    loader_class.add_constructor(
+        "!include_dir_merge_named", _include_dir_merge_named_yaml
+    )
+    loader_class.add_constructor("!input", Input.from_node)
+
+
+# yaml.SafeLoader keeps the constructors so yaml.safe_load understands our tags
+_add_constructors(yaml.SafeLoader)
+_add_constructors(FastSafeLoader)
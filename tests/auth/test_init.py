@@ -474,6 +474,60 @@ async def test_remove_refresh_token(mock_hass):
     assert await manager.async_validate_access_token(access_token) is None
 
 
+async def test_validate_access_token_cache(mock_hass):
+    """Test verified access tokens are cached until they are invalidated."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_token = manager.async_create_access_token(refresh_token)
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+
+    with patch("homeassistant.auth.jwt.decode") as mock_decode:
+        assert await manager.async_validate_access_token(access_token) is refresh_token
+    assert not mock_decode.called
+
+    # Cached tokens expire with the access token
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow()
+        + auth_const.ACCESS_TOKEN_EXPIRATION
+        + timedelta(seconds=11),
+    ), patch("homeassistant.auth.jwt.decode", side_effect=jwt.ExpiredSignatureError):
+        assert await manager.async_validate_access_token(access_token) is None
+
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_deactivate_user(user)
+    assert await manager.async_validate_access_token(access_token) is None
+
+    await manager.async_activate_user(user)
+    assert await manager.async_validate_access_token(access_token) is refresh_token
+    await manager.async_remove_refresh_token(refresh_token)
+    assert await manager.async_validate_access_token(access_token) is None
+
+
+async def test_validate_access_token_cache_size(mock_hass):
+    """Test the least recently used access tokens are dropped from the cache."""
+    manager = await auth.auth_manager_from_config(mock_hass, [], [])
+    user = MockUser().add_to_auth_manager(manager)
+    refresh_token = await manager.async_create_refresh_token(user, CLIENT_ID)
+    access_tokens = []
+    for index in range(3):
+        with patch(
+            "homeassistant.util.dt.utcnow",
+            return_value=dt_util.utcnow() + timedelta(seconds=index),
+        ):
+            access_tokens.append(manager.async_create_access_token(refresh_token))
+
+    with patch.object(auth, "ACCESS_TOKEN_CACHE_SIZE", 2):
+        for access_token in access_tokens:
+            assert (
+                await manager.async_validate_access_token(access_token) is refresh_token
+            )
+
+    assert list(manager._access_token_cache) == access_tokens[1:]
+
+
 async def test_create_access_token(mock_hass):
     """Test normal refresh_token's jwt_key keep same after used."""
     manager = await auth.auth_manager_from_config(mock_hass, [], [])
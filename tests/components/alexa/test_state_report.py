@@ -38,6 +38,42 @@ async def test_report_state(hass, aioclient_mock):
     assert call_json["event"]["endpoint"]["endpointId"] == "binary_sensor#test_contact"
 
 
+async def test_report_state_deduplicated(hass, aioclient_mock):
+    """Test proactive state reports are queued per entity and deduplicated."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attributes = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    hass.states.async_set("binary_sensor.test_window", "on", attributes)
+
+    await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attributes)
+    hass.states.async_set("binary_sensor.test_contact", "on", attributes)
+    hass.states.async_set("binary_sensor.test_window", "off", attributes)
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+    reports = {
+        call[2]["event"]["endpoint"]["endpointId"]: call[2]["event"]["payload"][
+            "change"
+        ]["properties"][0]["value"]
+        for call in aioclient_mock.mock_calls
+    }
+    assert reports == {
+        "binary_sensor#test_contact": "DETECTED",
+        "binary_sensor#test_window": "NOT_DETECTED",
+    }
+
+    # Changes that do not change the reported properties are not reported
+    hass.states.async_set(
+        "binary_sensor.test_window", "off", {**attributes, "irrelevant": True}
+    )
+    await hass.async_block_till_done()
+
+    assert len(aioclient_mock.mock_calls) == 2
+
+
 async def test_report_state_instance(hass, aioclient_mock):
     """Test proactive state reports with instance."""
     aioclient_mock.post(TEST_URL, text="", status=202)
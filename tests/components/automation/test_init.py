@@ -542,6 +542,55 @@ async def test_reload_config_service(hass, calls, hass_admin_user, hass_read_onl
     assert calls[1].data.get("event") == "test_event2"
 
 
+async def test_reload_only_changed_automations(hass, calls):
+    """Test reloading keeps the automations of which the config is unchanged."""
+    unchanged = {
+        "alias": "unchanged",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {
+            "service": "test.automation",
+            "data_template": {"event": "{{ trigger.event.event_type }}"},
+        },
+    }
+    changed = {
+        "alias": "changed",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    removed = {
+        "alias": "removed",
+        "trigger": {"platform": "event", "event_type": "test_event"},
+        "action": {"service": "test.automation"},
+    }
+    assert await async_setup_component(
+        hass, automation.DOMAIN, {automation.DOMAIN: [unchanged, changed, removed]}
+    )
+    entities = {entity.name: entity for entity in hass.data[DOMAIN].entities}
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={
+            automation.DOMAIN: [
+                unchanged,
+                {**changed, "trigger": {"platform": "event", "event_type": "new"}},
+            ]
+        },
+    ):
+        await hass.services.async_call(automation.DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    reloaded = {entity.name: entity for entity in hass.data[DOMAIN].entities}
+    assert reloaded.keys() == {"unchanged", "changed"}
+    assert reloaded["unchanged"] is entities["unchanged"]
+    assert reloaded["changed"] is not entities["changed"]
+    assert hass.states.get("automation.removed") is None
+
+    hass.bus.async_fire("test_event")
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert calls[0].data.get("event") == "test_event"
+
+
 async def test_reload_config_when_invalid_config(hass, calls):
     """Test the reload config service handling invalid config."""
     with assert_setup_component(1, automation.DOMAIN):
@@ -618,7 +667,9 @@ async def test_reload_config_handles_load_fails(hass, calls):
     assert len(calls) == 2
 
 
-@pytest.mark.parametrize("service", ["turn_off_stop", "turn_off_no_stop", "reload"])
+@pytest.mark.parametrize(
+    "service", ["turn_off_stop", "turn_off_no_stop", "reload", "reload_unchanged"]
+)
 async def test_automation_stops(hass, calls, service):
     """Test that turning off / reloading stops any running actions as appropriate."""
     entity_id = "automation.hello"
@@ -664,6 +715,13 @@ async def test_automation_stops(hass, calls, service):
             blocking=True,
         )
     else:
+        if service == "reload":
+            config = {
+                automation.DOMAIN: {
+                    **config[automation.DOMAIN],
+                    "trigger": {"platform": "event", "event_type": "new_test_event"},
+                }
+            }
         with patch(
             "homeassistant.config.load_yaml_config_file",
             autospec=True,
@@ -676,7 +734,9 @@ async def test_automation_stops(hass, calls, service):
     hass.states.async_set(test_entity, "goodbye")
     await hass.async_block_till_done()
 
-    assert len(calls) == (1 if service == "turn_off_no_stop" else 0)
+    assert len(calls) == (
+        1 if service in ("turn_off_no_stop", "reload_unchanged") else 0
+    )
 
 
 async def test_automation_restore_state(hass):
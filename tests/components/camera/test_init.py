@@ -7,6 +7,7 @@ import pytest
 
 from homeassistant.components import camera
 from homeassistant.components.camera.const import DOMAIN, PREF_PRELOAD_STREAM
+from homeassistant.components.camera.frame_broker import FrameBroker
 from homeassistant.components.camera.prefs import CameraEntityPreferences
 from homeassistant.components.websocket_api.const import TYPE_RESULT
 from homeassistant.config import async_process_ha_core_config
@@ -110,6 +111,57 @@ async def test_get_image_fails(hass, image_mock_url):
         await camera.async_get_image(hass, "camera.demo_camera")
 
 
+async def test_frame_broker_shares_fetch(hass):
+    """Test viewers asking for a frame while it is fetched share the fetch."""
+    fetched = asyncio.Event()
+    images = [b"one", b"one", b"two"]
+
+    async def image_cb():
+        await fetched.wait()
+        return images.pop(0)
+
+    broker = FrameBroker(image_cb)
+    first = hass.async_create_task(broker.async_get_frame(0))
+    second = hass.async_create_task(broker.async_get_frame(0))
+    await asyncio.sleep(0)
+    fetched.set()
+
+    assert await first is await second
+    assert len(images) == 2
+    frame = await first
+    assert frame.content == b"one"
+
+    # A recent frame is not fetched again
+    assert await broker.async_get_frame(60) is frame
+
+    # Frames with unchanged content keep their sequence
+    unchanged = await broker.async_get_frame(0)
+    assert unchanged.sequence == frame.sequence
+    changed = await broker.async_get_frame(0)
+    assert changed.content == b"two"
+    assert changed.sequence == frame.sequence + 1
+
+
+async def test_camera_image_view_frame_max_age(hass, hass_client, mock_camera):
+    """Test the image view serves a recent frame without fetching it again."""
+    client = await hass_client()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_image, patch(
+        "homeassistant.components.camera.Camera.frame_max_age",
+        new_callable=PropertyMock,
+        return_value=60,
+    ):
+        for _ in range(2):
+            resp = await client.get("/api/camera_proxy/camera.demo_camera")
+            assert resp.status == 200
+            assert await resp.read() == b"Test"
+
+    assert mock_image.call_count == 1
+
+
 async def test_snapshot_service(hass, mock_camera):
     """Test snapshot service."""
     mopen = mock_open()
@@ -102,38 +102,32 @@ async def test_chain_history(hass, values, missing=False):
     t_3 = dt_util.utcnow() - timedelta(minutes=4)
 
     if missing:
-        fake_states = {}
+        fake_states = []
     else:
-        fake_states = {
-            "sensor.test_monitored": [
-                ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-                ha.State("sensor.test_monitored", "unknown", last_changed=t_1),
-                ha.State("sensor.test_monitored", 19.0, last_changed=t_2),
-                ha.State("sensor.test_monitored", 18.2, last_changed=t_3),
-            ]
-        }
+        fake_states = [
+            ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
+            ha.State("sensor.test_monitored", "unknown", last_changed=t_1),
+            ha.State("sensor.test_monitored", 19.0, last_changed=t_2),
+            ha.State("sensor.test_monitored", 18.2, last_changed=t_3),
+        ]
 
     with patch(
-        "homeassistant.components.history.state_changes_during_period",
+        "homeassistant.components.filter.sensor.async_load_recorded_states",
         return_value=fake_states,
     ):
-        with patch(
-            "homeassistant.components.history.get_last_state_changes",
-            return_value=fake_states,
-        ):
-            with assert_setup_component(1, "sensor"):
-                assert await async_setup_component(hass, "sensor", config)
-                await hass.async_block_till_done()
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
+            await hass.async_block_till_done()
 
-            for value in values:
-                hass.states.async_set(config["sensor"]["entity_id"], value.state)
-                await hass.async_block_till_done()
+        for value in values:
+            hass.states.async_set(config["sensor"]["entity_id"], value.state)
+            await hass.async_block_till_done()
 
-            state = hass.states.get("sensor.test")
-            if missing:
-                assert "18.05" == state.state
-            else:
-                assert "17.05" == state.state
+        state = hass.states.get("sensor.test")
+        if missing:
+            assert "18.05" == state.state
+        else:
+            assert "17.05" == state.state
 
 
 async def test_chain_history_missing(hass, values):
@@ -159,28 +153,22 @@ async def test_history_time(hass):
     t_1 = dt_util.utcnow() - timedelta(minutes=2)
     t_2 = dt_util.utcnow() - timedelta(minutes=3)
 
-    fake_states = {
-        "sensor.test_monitored": [
-            ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
-            ha.State("sensor.test_monitored", 19.0, last_changed=t_1),
-            ha.State("sensor.test_monitored", 18.2, last_changed=t_2),
-        ]
-    }
+    fake_states = [
+        ha.State("sensor.test_monitored", 18.0, last_changed=t_0),
+        ha.State("sensor.test_monitored", 19.0, last_changed=t_1),
+        ha.State("sensor.test_monitored", 18.2, last_changed=t_2),
+    ]
     with patch(
-        "homeassistant.components.history.state_changes_during_period",
+        "homeassistant.components.filter.sensor.async_load_recorded_states",
         return_value=fake_states,
     ):
-        with patch(
-            "homeassistant.components.history.get_last_state_changes",
-            return_value=fake_states,
-        ):
-            with assert_setup_component(1, "sensor"):
-                assert await async_setup_component(hass, "sensor", config)
-                await hass.async_block_till_done()
-
+        with assert_setup_component(1, "sensor"):
+            assert await async_setup_component(hass, "sensor", config)
             await hass.async_block_till_done()
-            state = hass.states.get("sensor.test")
-            assert "18.0" == state.state
+
+        await hass.async_block_till_done()
+        state = hass.states.get("sensor.test")
+        assert "18.0" == state.state
 
 
 async def test_setup(hass):
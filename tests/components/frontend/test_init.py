@@ -401,10 +401,10 @@ async def test_get_translations(hass, hass_ws_client):
     client = await hass_ws_client(hass)
 
     with patch(
-        "homeassistant.components.frontend.async_get_translations",
-        side_effect=lambda hass, lang, category, integration, config_flow: {
-            "lang": lang
-        },
+        "homeassistant.components.frontend.async_get_translations_json",
+        side_effect=lambda hass, lang, category, integration, config_flow: (
+            f'{{"resources": {{"lang": "{lang}"}}}}'
+        ),
     ):
         await client.send_json(
             {
@@ -1,8 +1,10 @@
 """Test Google report state."""
+from datetime import timedelta
+
 from homeassistant.components.google_assistant import error, report_state
 from homeassistant.util.dt import utcnow
 
-from . import BASIC_CONFIG
+from . import BASIC_CONFIG, MockConfig
 
 from tests.async_mock import AsyncMock, patch
 from tests.common import async_fire_time_changed
@@ -37,6 +39,9 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
         await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -51,7 +56,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         hass.states.async_set(
             "light.kitchen", "on", {"irrelevant": "should_be_ignored"}
         )
-        await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -63,7 +68,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
-        await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -74,6 +79,56 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes are collected and reported together."""
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("light.kitchen", "off")
+    config = MockConfig(hass=hass)
+
+    with patch.object(
+        config, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, config)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+    assert config.report_state_sent == 1
+
+    with patch.object(config, "async_report_state_all", AsyncMock()) as mock_report:
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.ceiling", "off")
+        hass.states.async_set("light.ceiling", "on")
+        hass.states.async_set("light.kitchen", "on")
+        # Changed back to the reported state before the report was sent
+        hass.states.async_set("light.kitchen", "off")
+        hass.states.async_set("switch.ac", "on")
+        await hass.async_block_till_done()
+        await _async_report_window_passed(hass)
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.ceiling": {"on": True, "online": True},
+                "switch.ac": {"on": True, "online": True},
+            }
+        }
+    }
+    assert config.report_state_sent == 2
+    assert config.report_state_suppressed == 2
+
+    unsub()
+
+
+async def _async_report_window_passed(hass):
+    """Fire a time change after the report state window and wait for it."""
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
@@ -343,6 +343,83 @@ async def test_expand_entity_ids_expands_nested_groups(hass):
     ] == sorted(group.expand_entity_ids(hass, ["group.group_of_groups"]))
 
 
+async def test_expand_entity_ids_follows_membership_changes(hass):
+    """Test cached expansions are updated when nested groups change."""
+    assert await async_setup_component(hass, "group", {})
+
+    light_group = await group.Group.async_create_group(
+        hass, "light", ["light.test_1", "light.test_2"]
+    )
+    await group.Group.async_create_group(
+        hass, "group_of_groups", ["group.light", "switch.test_1"]
+    )
+
+    assert group.expand_entity_ids(hass, ["group.group_of_groups"]) == [
+        "light.test_1",
+        "light.test_2",
+        "switch.test_1",
+    ]
+
+    # Members turning on or off do not change the expansion
+    hass.states.async_set("light.test_1", STATE_ON)
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.group_of_groups"]) == [
+        "light.test_1",
+        "light.test_2",
+        "switch.test_1",
+    ]
+
+    await light_group.async_update_tracked_entity_ids(["light.test_3"])
+    await hass.async_block_till_done()
+    assert group.expand_entity_ids(hass, ["group.group_of_groups"]) == [
+        "light.test_3",
+        "switch.test_1",
+    ]
+
+
+async def test_expand_entity_ids_groups_containing_each_other(hass):
+    """Test expanding groups that contain each other through other groups."""
+    hass.states.async_set("group.first", STATE_ON, {"entity_id": ["group.second"]})
+    hass.states.async_set(
+        "group.second", STATE_ON, {"entity_id": ["group.first", "light.test_1"]}
+    )
+    hass.states.async_set(
+        "group.third", STATE_ON, {"entity_id": ["group.second", "light.test_2"]}
+    )
+
+    assert group.expand_entity_ids(hass, ["group.first"]) == ["light.test_1"]
+    assert group.expand_entity_ids(hass, ["group.third"]) == [
+        "light.test_1",
+        "light.test_2",
+    ]
+    assert group.expand_entity_ids(hass, ["group.second"]) == ["light.test_1"]
+
+
+async def test_groups_with_entity(hass):
+    """Test finding the groups that contain an entity."""
+    assert await async_setup_component(hass, "group", {})
+
+    light_group = await group.Group.async_create_group(
+        hass, "light", ["light.test_1", "light.test_2"]
+    )
+    await group.Group.async_create_group(
+        hass, "group_of_groups", ["group.light", "light.test_1"]
+    )
+
+    assert group.groups_with_entity(hass, "light.test_1") == [
+        "group.light",
+        "group.group_of_groups",
+    ]
+    assert group.groups_with_entity(hass, "group.light") == ["group.group_of_groups"]
+
+    await light_group.async_update_tracked_entity_ids(["light.test_2"])
+    assert group.groups_with_entity(hass, "light.test_1") == ["group.group_of_groups"]
+    assert group.groups_with_entity(hass, "light.test_2") == ["group.light"]
+
+    await light_group.async_remove()
+    assert group.groups_with_entity(hass, "light.test_2") == []
+
+
 async def test_set_assumed_state_based_on_tracked(hass):
     """Test assumed state."""
     hass.states.async_set("light.Bowl", STATE_ON)
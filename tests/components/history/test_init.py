@@ -5,6 +5,8 @@ from datetime import timedelta
 import json
 import unittest
 
+import pytest
+
 from homeassistant.components import history, recorder
 from homeassistant.components.recorder.models import process_timestamp
 import homeassistant.core as ha
@@ -154,6 +156,67 @@ class TestComponentHistory(unittest.TestCase):
 
         assert states == hist[entity_id]
 
+    def test_state_changes_during_period_fields(self):
+        """Test state changes with only some fields loaded."""
+        self.test_setup()
+        entity_id = "media_player.test"
+
+        start = dt_util.utcnow()
+        point = start + timedelta(seconds=1)
+        with patch(
+            "homeassistant.components.recorder.dt_util.utcnow", return_value=point
+        ):
+            self.hass.states.set(entity_id, "idle", {"large": "attribute"})
+            wait_recording_done(self.hass)
+            self.hass.states.set(entity_id, "Netflix", {"large": "attribute"})
+            wait_recording_done(self.hass)
+
+        with patch("homeassistant.components.history.LazyState") as mock_lazy_state:
+            hist = history.state_changes_during_period(
+                self.hass, start, entity_id=entity_id, fields=("state", "last_changed")
+            )
+        assert not mock_lazy_state.called
+
+        states = hist[entity_id]
+        assert [state.state for state in states] == ["idle", "Netflix"]
+        assert all(state.last_changed == point for state in states)
+        assert all(state.last_updated is None for state in states)
+        assert states[0].attributes == {}
+
+        state = history.get_state(
+            self.hass, point + timedelta(seconds=1), entity_id, fields=("attributes",)
+        )
+        assert isinstance(state, history.ProjectedState)
+        assert state.state is None
+        assert state.attributes == {"large": "attribute"}
+
+    def test_get_significant_states_fields(self):
+        """Test significant states with only some fields loaded."""
+        zero, four, states = self.record_states()
+        hist = history.get_significant_states(
+            self.hass,
+            zero,
+            four,
+            filters=history.Filters(),
+            fields=["state", "last_changed"],
+        )
+        assert hist.keys() == states.keys()
+        for entity_id, entity_states in states.items():
+            assert [(state.state, state.last_changed) for state in hist[entity_id]] == [
+                (state.state, state.last_changed) for state in entity_states
+            ]
+            assert all(
+                isinstance(state, history.ProjectedState) for state in hist[entity_id]
+            )
+
+    def test_unknown_fields(self):
+        """Test requesting an unknown field."""
+        self.test_setup()
+        with pytest.raises(ValueError):
+            history.state_changes_during_period(
+                self.hass, dt_util.utcnow(), fields=("context_id",)
+            )
+
     def test_get_last_state_changes(self):
         """Test number of state changes."""
         self.test_setup()
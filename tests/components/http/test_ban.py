@@ -1,5 +1,6 @@
 """The tests for the Home Assistant HTTP component."""
 # pylint: disable=protected-access
+from datetime import timedelta
 from ipaddress import ip_address
 import os
 
@@ -11,15 +12,18 @@ import pytest
 import homeassistant.components.http as http
 from homeassistant.components.http import KEY_AUTHENTICATED
 from homeassistant.components.http.ban import (
+    FAILED_LOGIN_WINDOW,
     IP_BANS_FILE,
     KEY_BANNED_IPS,
     KEY_FAILED_LOGIN_ATTEMPTS,
+    KEY_UNSAVED_BANS,
     IpBan,
     setup_bans,
 )
 from homeassistant.components.http.view import request_handler_factory
 from homeassistant.const import HTTP_FORBIDDEN
 from homeassistant.setup import async_setup_component
+from homeassistant.util import dt as dt_util
 
 from . import mock_real_ip
 
@@ -108,6 +112,7 @@ async def test_access_from_supervisor_ip(
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == bans
+        await hass.async_block_till_done()
         assert m_open.call_count == bans
 
         # second request should be forbidden if banned
@@ -166,6 +171,7 @@ async def test_ip_bans_file_creation(hass, aiohttp_client):
         resp = await client.get("/")
         assert resp.status == 401
         assert len(app[KEY_BANNED_IPS]) == len(BANNED_IPS) + 1
+        await hass.async_block_till_done()
         m_open.assert_called_once_with(hass.config.path(IP_BANS_FILE), "a")
 
         resp = await client.get("/")
@@ -232,3 +238,89 @@ async def test_failed_login_attempts_counter(hass, aiohttp_client):
     resp = await client.get("/auth_true")
     assert resp.status == 200
     assert app[KEY_FAILED_LOGIN_ATTEMPTS][remote_ip] == 2
+
+
+async def test_failed_login_attempts_expire(hass, aiohttp_client):
+    """Testing failed login attempts are forgotten after a while."""
+    app = web.Application()
+    app["hass"] = hass
+
+    async def unauth_handler(request):
+        """Return a mock web response."""
+        raise HTTPUnauthorized
+
+    app.router.add_get("/", unauth_handler)
+    setup_bans(hass, app, 2)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[],
+    ):
+        client = await aiohttp_client(app)
+
+    set_real_ip("200.201.202.204")
+    resp = await client.get("/")
+    assert resp.status == 401
+    assert app[KEY_FAILED_LOGIN_ATTEMPTS][ip_address("200.201.202.204")] == 1
+
+    with patch(
+        "homeassistant.util.dt.utcnow",
+        return_value=dt_util.utcnow() + FAILED_LOGIN_WINDOW + timedelta(seconds=1),
+    ):
+        set_real_ip("200.201.202.205")
+        resp = await client.get("/")
+        assert resp.status == 401
+
+        set_real_ip("200.201.202.204")
+        resp = await client.get("/")
+        assert resp.status == 401
+
+    assert app[KEY_FAILED_LOGIN_ATTEMPTS] == {
+        ip_address("200.201.202.205"): 1,
+        ip_address("200.201.202.204"): 1,
+    }
+    assert len(app[KEY_BANNED_IPS]) == 0
+
+
+async def test_ip_bans_saved_in_batches(hass, aiohttp_client):
+    """Testing bans made while saving are saved together."""
+    app = web.Application()
+    app["hass"] = hass
+
+    async def unauth_handler(request):
+        """Return a mock web response."""
+        raise HTTPUnauthorized
+
+    app.router.add_get("/", unauth_handler)
+    setup_bans(hass, app, 1)
+    set_real_ip = mock_real_ip(app)
+
+    with patch(
+        "homeassistant.components.http.ban.async_load_ip_bans_config",
+        return_value=[],
+    ):
+        client = await aiohttp_client(app)
+
+    with patch(
+        "homeassistant.components.http.ban.update_ip_bans_config"
+    ) as mock_update:
+        for remote_addr in BANNED_IPS:
+            set_real_ip(remote_addr)
+            resp = await client.get("/")
+            assert resp.status == 401
+
+        await hass.async_block_till_done()
+
+    saved = [
+        str(ip_ban.ip_address)
+        for call in mock_update.mock_calls
+        for ip_ban in call[1][1]
+    ]
+    assert saved == BANNED_IPS
+    assert not app[KEY_UNSAVED_BANS]
+
+    for remote_addr in BANNED_IPS:
+        set_real_ip(remote_addr)
+        resp = await client.get("/")
+        assert resp.status == HTTP_FORBIDDEN
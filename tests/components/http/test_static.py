@@ -0,0 +1,134 @@
+"""Test static file handling for the HTTP component."""
+import os
+
+from aiohttp import hdrs, web
+import pytest
+
+from homeassistant.components.http import static
+from homeassistant.components.http.const import KEY_HASS
+from homeassistant.components.http.static import CachingStaticResource
+
+from tests.async_mock import patch
+
+SCRIPT = b"console.log('Hello');\n" * 10
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Return a directory with static files."""
+    (tmp_path / "script.js").write_bytes(SCRIPT)
+    (tmp_path / "script.js.gz").write_bytes(b"gzipped")
+    (tmp_path / "script.js.br").write_bytes(b"brotli")
+    (tmp_path / "style.css").write_bytes(b"body {}")
+    (tmp_path / "folder").mkdir()
+    return tmp_path
+
+
+@pytest.fixture
+def client(hass, aiohttp_client, static_dir):
+    """Return a client of an app serving the static files."""
+    app = web.Application()
+    app[KEY_HASS] = hass
+    app.router.register_resource(CachingStaticResource("/static", str(static_dir)))
+    return hass.loop.run_until_complete(aiohttp_client(app, auto_decompress=False))
+
+
+async def test_serve_file(client):
+    """Test serving a file from memory."""
+    resp = await client.get("/static/style.css", skip_auto_headers=["Accept-Encoding"])
+    assert resp.status == 200
+    assert await resp.read() == b"body {}"
+    assert resp.headers[hdrs.CONTENT_TYPE] == "text/css"
+    assert resp.headers[hdrs.CACHE_CONTROL] == static.CACHE_HEADERS[hdrs.CACHE_CONTROL]
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    etag = resp.headers[hdrs.ETAG]
+
+    with patch("pathlib.Path.read_bytes") as mock_read:
+        resp = await client.get(
+            "/static/style.css", skip_auto_headers=["Accept-Encoding"]
+        )
+        assert resp.status == 200
+        assert await resp.read() == b"body {}"
+    assert not mock_read.called
+
+    resp = await client.get("/static/style.css", headers={"If-None-Match": etag})
+    assert resp.status == 304
+    assert resp.headers[hdrs.ETAG] == etag
+
+    resp = await client.head("/static/style.css")
+    assert resp.status == 200
+    assert await resp.read() == b""
+
+
+async def test_serve_changed_file(client, static_dir):
+    """Test a file is read again when it changes."""
+    resp = await client.get("/static/style.css")
+    assert await resp.read() == b"body {}"
+    etag = resp.headers[hdrs.ETAG]
+
+    (static_dir / "style.css").write_bytes(b"body { color: red; }")
+    os.utime(static_dir / "style.css", ns=(0, 0))
+
+    resp = await client.get("/static/style.css", headers={"If-None-Match": etag})
+    assert resp.status == 200
+    assert await resp.read() == b"body { color: red; }"
+    assert resp.headers[hdrs.ETAG] != etag
+
+
+async def test_serve_compressed_variant(client):
+    """Test serving the pre-compressed variants clients accept."""
+    resp = await client.get(
+        "/static/script.js", headers={"Accept-Encoding": "gzip, deflate, br"}
+    )
+    assert resp.status == 200
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "br"
+    assert resp.headers[hdrs.CONTENT_TYPE] == "application/javascript"
+    assert resp.headers[hdrs.VARY] == hdrs.ACCEPT_ENCODING
+    assert await resp.content.read() == b"brotli"
+
+    resp = await client.get("/static/script.js", headers={"Accept-Encoding": "gzip"})
+    assert resp.headers[hdrs.CONTENT_ENCODING] == "gzip"
+    assert await resp.content.read() == b"gzipped"
+
+    resp = await client.get("/static/script.js", skip_auto_headers=["Accept-Encoding"])
+    assert hdrs.CONTENT_ENCODING not in resp.headers
+    assert await resp.read() == SCRIPT
+
+
+async def test_serve_large_file(client):
+    """Test large files are streamed from disk."""
+    with patch.object(static, "MAX_CACHED_FILE_SIZE", 10):
+        resp = await client.get(
+            "/static/script.js", skip_auto_headers=["Accept-Encoding"]
+        )
+    assert resp.status == 200
+    assert hdrs.ETAG not in resp.headers
+    assert await resp.read() == SCRIPT
+
+
+async def test_cache_size(client):
+    """Test the least recently used files are dropped from memory."""
+    resource = next(iter(client.app.router.resources()))
+    with patch.object(static, "MAX_CACHE_SIZE", len(SCRIPT)):
+        await client.get("/static/style.css")
+        await client.get("/static/script.js", skip_auto_headers=["Accept-Encoding"])
+
+    assert [os.path.basename(key) for key in resource._contents] == ["script.js"]
+    assert resource._contents_size == len(SCRIPT)
+
+
+async def test_not_found(client, static_dir):
+    """Test files that can't be served."""
+    resp = await client.get("/static/missing.js")
+    assert resp.status == 404
+
+    resp = await client.get("/static/..%2Ftest_static.py")
+    assert resp.status in (403, 404)
+
+    resp = await client.get("/static/folder")
+    assert resp.status == 403
+
+    await client.get("/static/style.css")
+    (static_dir / "style.css").unlink()
+    resp = await client.get("/static/style.css")
+    assert resp.status == 404
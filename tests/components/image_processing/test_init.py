@@ -1,10 +1,10 @@
 """The tests for the image_processing component."""
 import homeassistant.components.http as http
 import homeassistant.components.image_processing as ip
-from homeassistant.const import ATTR_ENTITY_PICTURE
+from homeassistant.const import ATTR_ENTITY_ID, ATTR_ENTITY_PICTURE, ENTITY_MATCH_ALL
 from homeassistant.core import callback
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.setup import setup_component
+from homeassistant.setup import async_setup_component, setup_component
 
 from tests.async_mock import PropertyMock, patch
 from tests.common import (
@@ -287,3 +287,31 @@ class TestImageProcessingFace:
         assert event_data[0]["confidence"] == 98.34
         assert event_data[0]["gender"] == "male"
         assert event_data[0]["entity_id"] == "image_processing.demo_face"
+
+
+async def test_processors_share_camera_image(hass):
+    """Test processors of one camera share the fetched image."""
+    config = {ip.DOMAIN: {"platform": "demo"}, "camera": {"platform": "demo"}}
+    await async_setup_component(hass, ip.DOMAIN, config)
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.components.demo.camera.DemoCamera.async_camera_image",
+        return_value=b"Test",
+    ) as mock_image, patch(
+        "homeassistant.components.demo.image_processing."
+        "DemoImageProcessingAlpr.process_image"
+    ) as mock_alpr, patch(
+        "homeassistant.components.demo.image_processing."
+        "DemoImageProcessingFace.process_image"
+    ) as mock_face:
+        await hass.services.async_call(
+            ip.DOMAIN,
+            ip.SERVICE_SCAN,
+            {ATTR_ENTITY_ID: ENTITY_MATCH_ALL},
+            blocking=True,
+        )
+
+    assert mock_image.call_count == 1
+    assert mock_alpr.call_args[0][0] == b"Test"
+    assert mock_face.call_args[0][0] == b"Test"
@@ -37,13 +37,27 @@ class FilterTest:
 
 
 @pytest.fixture(autouse=True)
-def mock_batch_timeout(hass, monkeypatch):
-    """Mock the event bus listener and the batch timeout for tests."""
+def mock_batch_timeout(hass, monkeypatch, tmp_path):
+    """Mock the event bus listener, the batch timeout and backlog dir for tests."""
     hass.bus.listen = MagicMock()
     monkeypatch.setattr(
         f"{INFLUX_PATH}.InfluxThread.batch_timeout",
         Mock(return_value=0),
     )
+    monkeypatch.setattr(f"{INFLUX_PATH}.STORAGE_DIR", str(tmp_path))
+
+
+def _to_lines(body, precision=None):
+    """Encode points the way event_to_json creates them, with float values."""
+    encoder = influxdb.LineProtocolEncoder(precision)
+    lines = []
+    for point in body:
+        fields = {
+            key: float(value) if isinstance(value, int) else value
+            for key, value in point["fields"].items()
+        }
+        lines.append(encoder.encode({**point, "fields": fields}))
+    return lines
 
 
 @pytest.fixture(name="mock_client")
@@ -63,7 +77,7 @@ def get_mock_call_fixture(request):
     """Get version specific lambda to make write API call mock."""
 
     def v2_call(body, precision):
-        data = {"bucket": DEFAULT_BUCKET, "record": body}
+        data = {"bucket": DEFAULT_BUCKET, "record": _to_lines(body, precision)}
 
         if precision is not None:
             data["write_precision"] = precision
@@ -72,8 +86,9 @@ def get_mock_call_fixture(request):
 
     if request.param == influxdb.API_VERSION_2:
         return lambda body, precision=None: v2_call(body, precision)
-    # pylint: disable=unnecessary-lambda
-    return lambda body, precision=None: call(body, time_precision=precision)
+    return lambda body, precision=None: call(
+        _to_lines(body, precision), time_precision=precision, protocol="line"
+    )
 
 
 def _get_write_api_mock_v1(mock_influx_client):
@@ -1332,13 +1347,15 @@ async def test_event_listener_scheduled_write(
         assert mock_sleep.called
     assert write_api.call_count == 2
 
-    # Write works again
+    # Write works again, the failed write is written from the backlog
     write_api.side_effect = None
     with patch.object(influxdb.time, "sleep") as mock_sleep:
         handler_method(event)
         hass.data[influxdb.DOMAIN].block_till_done()
         assert not mock_sleep.called
-    assert write_api.call_count == 3
+    assert write_api.call_count == 4
+    assert write_api.call_args_list[2] == write_api.call_args_list[3]
+    assert hass.data[influxdb.DOMAIN].stats["backlog_bytes"] == 0
 
 
 @pytest.mark.parametrize(
@@ -1657,3 +1674,23 @@ async def test_precision(
     assert write_api.call_count == 1
     assert write_api.call_args == get_mock_call(body, precision)
     write_api.reset_mock()
+
+
+def test_line_protocol_encoder():
+    """Test points are escaped and converted to the configured precision."""
+    point = {
+        "measurement": "power usage",
+        "tags": {"entity_id": "a,b", "domain": "sensor", "empty": ""},
+        "time": datetime.datetime(2020, 1, 1, tzinfo=datetime.timezone.utc),
+        "fields": {"value": 1.5, "state_str": 'say "hi"', "count": 2, "on": True},
+    }
+
+    assert influxdb.LineProtocolEncoder("s").encode(point) == (
+        "power\\ usage,domain=sensor,entity_id=a\\,b "
+        'count=2i,on=True,state_str="say \\"hi\\"",value=1.5 1577836800'
+    )
+    assert (
+        influxdb.LineProtocolEncoder(None)
+        .encode(point)
+        .endswith(" 1577836800000000000")
+    )
@@ -1618,6 +1618,212 @@ async def test_empty_config(hass, hass_client):
     _assert_entry(entries[1], name="blu", entity_id=entity_id)
 
 
+async def _async_setup_paged_logbook(hass):
+    """Record entries spread over three logbook groups with shared contexts."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    service_context = ha.Context(id="ac5bd62de45711eaaeb351041eec8dd9")
+    motion_context = ha.Context(id="bc5bd62de45711eaaeb351041eec8dd9")
+    start = dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
+    times = [start - timedelta(minutes=minutes) for minutes in (60, 40, 20)]
+
+    with patch("homeassistant.util.dt.utcnow", return_value=times[0]):
+        for entity_id in ("switch.a", "light.b", "light.c", "binary_sensor.motion"):
+            hass.states.async_set(entity_id, STATE_OFF)
+        hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {ATTR_DOMAIN: "switch", ATTR_SERVICE: "turn_on"},
+            context=service_context,
+        )
+        hass.states.async_set("switch.a", STATE_ON, context=service_context)
+        hass.states.async_set("binary_sensor.motion", STATE_ON, context=motion_context)
+    with patch("homeassistant.util.dt.utcnow", return_value=times[1]):
+        hass.states.async_set("light.b", STATE_ON, context=service_context)
+    with patch("homeassistant.util.dt.utcnow", return_value=times[2]):
+        hass.states.async_set("light.c", STATE_ON, context=motion_context)
+
+    await _async_commit_and_wait(hass)
+
+
+async def test_logbook_view_pagination(hass, hass_client):
+    """Test fetching the logbook page by page."""
+    await _async_setup_paged_logbook(hass)
+    client = await hass_client()
+    entries = await _async_fetch_logbook(client)
+    assert [entry["entity_id"] for entry in entries] == [
+        "switch.a",
+        "binary_sensor.motion",
+        "light.b",
+        "light.c",
+    ]
+
+    start = dt_util.utcnow().date()
+    start_date = datetime(start.year, start.month, start.day) - timedelta(hours=24)
+    end_time = start + timedelta(hours=48)
+    url = f"/api/logbook/{start_date.isoformat()}?end_time={end_time}&limit=1"
+    pages = []
+    while url is not None:
+        response = await client.get(url)
+        assert response.status == 200
+        pages.append(await response.json())
+        url = response.links.get("next", {}).get("url")
+        if url is not None:
+            url = url.path_qs
+
+    assert [[entry["entity_id"] for entry in page] for page in pages] == [
+        ["switch.a", "binary_sensor.motion"],
+        ["light.b"],
+        ["light.c"],
+    ]
+    # Contexts that started on an earlier page are still attributed
+    assert [entry for page in pages for entry in page] == entries
+    assert pages[1][0]["context_domain"] == "switch"
+    assert pages[1][0]["context_service"] == "turn_on"
+    assert pages[2][0]["context_entity_id"] == "binary_sensor.motion"
+
+
+async def test_logbook_view_streams_long_periods(hass, hass_client):
+    """Test a period spanning multiple pages is streamed as one array."""
+    await _async_setup_paged_logbook(hass)
+    client = await hass_client()
+    entries = await _async_fetch_logbook(client)
+
+    with patch.object(logbook, "STREAM_PAGE_SIZE", 1):
+        start = dt_util.utcnow().date()
+        start_date = datetime(start.year, start.month, start.day) - timedelta(hours=24)
+        end_time = start + timedelta(hours=48)
+        response = await client.get(
+            f"/api/logbook/{start_date.isoformat()}?end_time={end_time}"
+        )
+        assert response.status == 200
+        assert response.headers["Transfer-Encoding"] == "chunked"
+        assert json.loads(await response.text()) == entries
+
+
+@pytest.mark.parametrize(
+    "query, message",
+    [
+        ("limit=0", "Invalid limit"),
+        ("limit=abc", "Invalid limit"),
+        ("continuation=abc", "Invalid continuation"),
+        ("continuation=2020-01-01T00:00:00+00:00_x", "Invalid continuation"),
+    ],
+)
+async def test_logbook_view_invalid_paging(hass, hass_client, query, message):
+    """Test invalid paging parameters are rejected."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    response = await client.get(f"/api/logbook?{query}")
+    assert response.status == 400
+    assert (await response.json())["message"] == message
+
+
+async def test_logbook_event_stream(hass, hass_ws_client):
+    """Test the logbook event stream sends history and then live entries."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("sensor.power", 10, {"unit_of_measurement": "W"})
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    start = dt_util.utcnow() - timedelta(hours=1)
+    await client.send_json(
+        {"id": 7, "type": "logbook/event_stream", "start_time": start.isoformat()}
+    )
+    msg = await client.receive_json()
+    assert msg["id"] == 7
+    assert msg["success"]
+
+    msg = await client.receive_json()
+    assert msg["type"] == "event"
+    assert [entry["entity_id"] for entry in msg["event"]] == ["light.kitchen"]
+
+    context = ha.Context(id="cc5bd62de45711eaaeb351041eec8dd9")
+    with patch.object(logbook, "session_scope", side_effect=AssertionError):
+        hass.bus.async_fire(
+            EVENT_CALL_SERVICE,
+            {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_off"},
+            context=context,
+        )
+        # Attribute changes and continuous sensors are not logged
+        hass.states.async_set("light.kitchen", STATE_ON, {"brightness": 10})
+        hass.states.async_set("sensor.power", 20, {"unit_of_measurement": "W"})
+        hass.states.async_set("light.kitchen", STATE_OFF, context=context)
+        logbook.async_log_entry(hass, "Alarm", "is armed", "alarm_control_panel")
+        await hass.async_block_till_done()
+
+        msg = await client.receive_json()
+        assert msg["type"] == "event"
+        entry = msg["event"][0]
+        assert entry["entity_id"] == "light.kitchen"
+        assert entry["state"] == STATE_OFF
+        assert entry["context_domain"] == "light"
+        assert entry["context_service"] == "turn_off"
+
+        msg = await client.receive_json()
+        entry = msg["event"][0]
+        assert entry["name"] == "Alarm"
+        assert entry["message"] == "is armed"
+
+    await client.send_json({"id": 8, "type": "unsubscribe_events", "subscription": 7})
+    msg = await client.receive_json()
+    assert msg["id"] == 8
+    assert msg["success"]
+
+
+async def test_logbook_event_stream_entity_ids(hass, hass_ws_client):
+    """Test the logbook event stream of selected entities."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    hass.states.async_set("light.kitchen", STATE_OFF)
+    hass.states.async_set("light.hall", STATE_OFF)
+    await _async_commit_and_wait(hass)
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {
+            "id": 7,
+            "type": "logbook/event_stream",
+            "start_time": dt_util.utcnow().isoformat(),
+            "entity_ids": ["light.hall"],
+        }
+    )
+    assert (await client.receive_json())["success"]
+    assert (await client.receive_json())["event"] == []
+
+    hass.states.async_set("light.kitchen", STATE_ON)
+    hass.states.async_set("light.hall", STATE_ON)
+    await hass.async_block_till_done()
+
+    msg = await client.receive_json()
+    assert [entry["entity_id"] for entry in msg["event"]] == ["light.hall"]
+
+
+async def test_logbook_event_stream_invalid_start_time(hass, hass_ws_client):
+    """Test the logbook event stream with an invalid start time."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "logbook", {})
+
+    client = await hass_ws_client()
+    await client.send_json(
+        {"id": 7, "type": "logbook/event_stream", "start_time": "invalid"}
+    )
+    msg = await client.receive_json()
+    assert not msg["success"]
+    assert msg["error"]["code"] == "invalid_start_time"
+
+
 async def _async_fetch_logbook(client):
 
     # Today time 00:00:00
@@ -0,0 +1,100 @@
+"""The tests for the Modbus hub."""
+from datetime import timedelta
+from unittest import mock
+
+from pymodbus.pdu import ExceptionResponse
+
+from homeassistant.components.modbus import ModbusHub
+from homeassistant.components.modbus.const import (
+    CALL_TYPE_COIL,
+    CALL_TYPE_REGISTER_HOLDING,
+)
+from homeassistant.const import (
+    CONF_DELAY,
+    CONF_HOST,
+    CONF_NAME,
+    CONF_PORT,
+    CONF_TIMEOUT,
+    CONF_TYPE,
+)
+
+from .conftest import ReadResult
+
+SCAN_INTERVAL = timedelta(seconds=10)
+
+
+def _mock_hub():
+    """Return a hub with a mocked client."""
+    hub = ModbusHub(
+        {
+            CONF_NAME: "hub",
+            CONF_TYPE: "tcp",
+            CONF_HOST: "modbus.local",
+            CONF_PORT: 502,
+            CONF_TIMEOUT: 3,
+            CONF_DELAY: 0,
+        }
+    )
+    hub._client = mock.MagicMock()
+    return hub
+
+
+def test_planned_reads_are_combined():
+    """Test nearby planned reads are served from a single request."""
+    hub = _mock_hub()
+    client = hub._client
+    client.read_holding_registers.return_value = ReadResult(list(range(100, 112)))
+
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 100, 2, SCAN_INTERVAL)
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 104, 1, SCAN_INTERVAL)
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 110, 2, SCAN_INTERVAL)
+    # Too far away to be combined
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 500, 1, SCAN_INTERVAL)
+
+    assert hub.read_holding_registers(1, 100, 2).registers == [100, 101]
+    assert hub.read_holding_registers(1, 104, 1).registers == [104]
+    assert hub.read_holding_registers(1, 110, 2).registers == [110, 111]
+
+    client.read_holding_registers.assert_called_once_with(100, 12, unit=1)
+    assert hub.stats["requests"] == 1
+    assert hub.stats["reads_combined"] == 2
+
+    client.read_holding_registers.return_value = ReadResult([5])
+    assert hub.read_holding_registers(1, 500, 1).registers == [5]
+    client.read_holding_registers.assert_called_with(500, 1, unit=1)
+
+
+def test_removed_reads_are_not_combined():
+    """Test a removed read is no longer part of a combined request."""
+    hub = _mock_hub()
+    client = hub._client
+    client.read_coils.return_value = ReadResult([1])
+
+    hub.add_read(CALL_TYPE_COIL, 1, 0, 1, SCAN_INTERVAL)
+    remove = hub.add_read(CALL_TYPE_COIL, 1, 1, 1, SCAN_INTERVAL)
+    remove()
+
+    assert hub.read_coils(1, 0, 1).bits == [1]
+    client.read_coils.assert_called_once_with(0, 1, unit=1)
+
+
+def test_failed_combined_read_is_split():
+    """Test reads are sent separately when the combined request fails."""
+    hub = _mock_hub()
+    client = hub._client
+    client.read_holding_registers.side_effect = [
+        ExceptionResponse(3),
+        ReadResult([1]),
+        ReadResult([2]),
+    ]
+
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 0, 1, SCAN_INTERVAL)
+    hub.add_read(CALL_TYPE_REGISTER_HOLDING, 1, 5, 1, SCAN_INTERVAL)
+
+    assert hub.read_holding_registers(1, 0, 1).registers == [1]
+    assert hub.read_holding_registers(1, 5, 1).registers == [2]
+    assert client.read_holding_registers.call_args_list == [
+        mock.call(0, 6, unit=1),
+        mock.call(0, 1, unit=1),
+        mock.call(5, 1, unit=1),
+    ]
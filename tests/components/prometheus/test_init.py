@@ -202,6 +202,75 @@ async def test_view(hass, hass_client):
     )
 
 
+async def test_view_gzip(hass, hass_client):
+    """Test the metrics view compresses the exposition when accepted."""
+    client = await prometheus_client(hass, hass_client)
+    resp = await client.get(
+        prometheus.API_ENDPOINT, headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert resp.status == 200
+    assert resp.headers["Content-Encoding"] == "gzip"
+    body = await resp.text()
+    assert (
+        'entity_available{domain="sensor",'
+        'entity="sensor.radio_energy",'
+        'friendly_name="Radio Energy"} 1.0' in body.split("\n")
+    )
+
+
+async def test_view_renders_changed_metrics_only(hass, hass_client):
+    """Test metrics are only rendered again after they changed."""
+    client = await prometheus_client(hass, hass_client)
+    resp = await client.get(prometheus.API_ENDPOINT)
+    assert resp.status == 200
+
+    with mock.patch(
+        f"{PROMETHEUS_PATH}.prometheus_client.generate_latest",
+        wraps=prometheus.prometheus_client.generate_latest,
+    ) as generate_latest:
+        resp = await client.get(prometheus.API_ENDPOINT)
+        assert resp.status == 200
+        # Only the default registry with the process metrics
+        assert generate_latest.call_count == 1
+
+        hass.states.async_set(
+            "sensor.television_energy",
+            75,
+            {
+                "friendly_name": "Television Energy",
+                "unit_of_measurement": ENERGY_KILO_WATT_HOUR,
+            },
+        )
+        await hass.async_block_till_done()
+        generate_latest.reset_mock()
+
+        resp = await client.get(prometheus.API_ENDPOINT)
+        body = (await resp.text()).split("\n")
+
+    rendered = {
+        call[0][0]._name
+        for call in generate_latest.call_args_list
+        if call[0][0] is not prometheus.prometheus_client.REGISTRY
+    }
+    assert rendered == {
+        "state_change",
+        "entity_available",
+        "last_updated_time_seconds",
+        "sensor_unit_kwh",
+    }
+    assert (
+        'sensor_unit_kwh{domain="sensor",'
+        'entity="sensor.television_energy",'
+        'friendly_name="Television Energy"} 75.0' in body
+    )
+    assert (
+        'temperature_c{domain="sensor",'
+        'entity="sensor.outside_temperature",'
+        'friendly_name="Outside Temperature"} 15.6' in body
+    )
+
+
 @pytest.fixture(name="mock_client")
 def mock_client_fixture():
     """Mock the prometheus client."""
@@ -0,0 +1,101 @@
+"""Test loading recorded states of many entities at once."""
+import asyncio
+from datetime import timedelta
+import json
+
+from homeassistant.components.recorder import preload
+from homeassistant.components.recorder.models import States
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.util import dt as dt_util
+
+from tests.async_mock import patch
+
+
+def _add_states(hass, now):
+    """Add ten states of two sensors, one per minute and oldest first."""
+    with session_scope(hass=hass) as session:
+        for minutes in range(10, 0, -1):
+            timestamp = now - timedelta(minutes=minutes)
+            for entity_id in ("sensor.one", "sensor.two"):
+                session.add(
+                    States(
+                        entity_id=entity_id,
+                        domain="sensor",
+                        state=str(minutes),
+                        attributes=json.dumps({"minutes": minutes}),
+                        # Every other state only changed the attributes
+                        last_changed=timestamp - timedelta(seconds=minutes % 2),
+                        last_updated=timestamp,
+                        created=timestamp,
+                    )
+                )
+
+
+def _load_all(hass, requests):
+    """Request the states of all requests at once."""
+
+    async def async_load_all():
+        return await asyncio.gather(
+            *(
+                preload.async_load_recorded_states(hass, entity_id, **kwargs)
+                for entity_id, kwargs in requests
+            )
+        )
+
+    return asyncio.run_coroutine_threadsafe(async_load_all(), hass.loop).result()
+
+
+def test_load_recorded_states(hass_recorder):
+    """Test the states of concurrent requests are loaded with one query."""
+    hass = hass_recorder()
+    _add_states(hass, dt_util.utcnow())
+
+    with patch.object(
+        preload.StatesPreloader,
+        "_load",
+        side_effect=preload.StatesPreloader._load,
+        autospec=True,
+    ) as load_mock:
+        one, two, recent, changes, missing = _load_all(
+            hass,
+            [
+                ("sensor.one", {}),
+                ("sensor.two", {"sample_size": 3, "attributes": True}),
+                ("sensor.two", {"max_age": timedelta(minutes=4, seconds=30)}),
+                ("sensor.one", {"sample_size": 3, "changes_only": True}),
+                ("sensor.missing", {}),
+            ],
+        )
+
+    assert load_mock.call_count == 1
+    assert [state.state for state in one] == [
+        str(minutes) for minutes in range(10, 0, -1)
+    ]
+    assert [state.state for state in two] == ["3", "2", "1"]
+    assert [state.attributes for state in two] == [
+        {"minutes": 3},
+        {"minutes": 2},
+        {"minutes": 1},
+    ]
+    assert one[0].attributes == {}
+    assert [state.state for state in recent] == ["4", "3", "2", "1"]
+    assert [state.state for state in changes] == ["6", "4", "2"]
+    assert missing == []
+    assert all(
+        earlier.last_updated < later.last_updated
+        for earlier, later in zip(one, one[1:])
+    )
+
+
+def test_load_recorded_states_in_chunks(hass_recorder):
+    """Test many requests are split over several queries."""
+    hass = hass_recorder()
+    _add_states(hass, dt_util.utcnow())
+
+    with patch.object(preload, "MAX_REQUESTS_PER_QUERY", 2):
+        results = _load_all(
+            hass, [("sensor.one", {"sample_size": size}) for size in range(1, 6)]
+        )
+
+    assert [len(states) for states in results] == [1, 2, 3, 4, 5]
+    assert results[4][-1].state == "1"
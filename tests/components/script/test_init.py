@@ -251,6 +251,47 @@ async def test_reload_service(hass, running):
         assert hass.services.has_service(script.DOMAIN, "test")
 
 
+async def test_reload_keeps_unchanged_scripts(hass):
+    """Verify reloading keeps unchanged scripts running."""
+    sequence = [
+        {"event": "test_event"},
+        {"wait_template": "{{ is_state('test.script', 'on') }}"},
+    ]
+    config = {
+        "script": {
+            "test": {"sequence": [dict(step) for step in sequence]},
+            "changed": {"sequence": [{"delay": {"seconds": 5}}]},
+        }
+    }
+    event_flag = asyncio.Event()
+    hass.bus.async_listen_once("test_event", lambda event: event_flag.set())
+    hass.states.async_set("test.script", "off")
+
+    assert await async_setup_component(hass, "script", config)
+    await hass.services.async_call(DOMAIN, "test")
+    await asyncio.wait_for(event_flag.wait(), 1)
+    changed = hass.data[DOMAIN].get_entity("script.changed")
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        return_value={
+            "script": {
+                "test": {"sequence": [dict(step) for step in sequence]},
+                "changed": {"sequence": [{"delay": {"seconds": 10}}]},
+            }
+        },
+    ):
+        await hass.services.async_call(DOMAIN, SERVICE_RELOAD, blocking=True)
+
+    assert script.is_on(hass, ENTITY_ID)
+    assert hass.data[DOMAIN].get_entity("script.changed") is not changed
+    assert hass.services.has_service(script.DOMAIN, "changed")
+
+    hass.states.async_set("test.script", "on")
+    await hass.async_block_till_done()
+    assert not script.is_on(hass, ENTITY_ID)
+
+
 async def test_service_descriptions(hass):
     """Test that service descriptions are loaded and reloaded correctly."""
     # Test 1: has "description" but no "fields"
@@ -149,6 +149,40 @@ class TestStatisticsSensor(unittest.TestCase):
         assert 3.8 == state.attributes.get("min_value")
         assert 14 == state.attributes.get("max_value")
 
+    def test_percentiles(self):
+        """Test the configured percentiles."""
+        assert setup_component(
+            self.hass,
+            "sensor",
+            {
+                "sensor": {
+                    "platform": "statistics",
+                    "name": "test",
+                    "entity_id": "sensor.test_monitored",
+                    "percentiles": [10, 50, 99.5],
+                }
+            },
+        )
+
+        self.hass.block_till_done()
+        self.hass.start()
+        self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test")
+        assert STATE_UNKNOWN == state.attributes.get("percentile_50")
+
+        for value in self.values:
+            self.hass.states.set(
+                "sensor.test_monitored", value, {ATTR_UNIT_OF_MEASUREMENT: TEMP_CELSIUS}
+            )
+            self.hass.block_till_done()
+
+        state = self.hass.states.get("sensor.test")
+
+        assert 4.76 == state.attributes.get("percentile_10")
+        assert self.median == state.attributes.get("percentile_50")
+        assert 19.88 == state.attributes.get("percentile_99.5")
+
     def test_sampling_size_1(self):
         """Test validity of stats requiring only one sample."""
         assert setup_component(
@@ -0,0 +1,58 @@
+"""The tests for the statistics window."""
+import random
+import statistics
+
+import pytest
+
+from homeassistant.components.statistics.window import WindowStatistics
+
+
+def test_window_matches_statistics_module():
+    """Test the incremental statistics match a full recomputation."""
+    rnd = random.Random(42)
+    window = WindowStatistics(50)
+    samples = []
+
+    for age in range(500):
+        value = rnd.choice([rnd.uniform(-1e3, 1e3), float(rnd.randint(0, 5))])
+        window.append(value, age)
+        samples = (samples + [value])[-50:]
+        if age % 7 == 0 and len(samples) > 1:
+            # Evict by age as well
+            oldest_age = window.ages[0]
+            assert window.popleft() == (samples.pop(0), oldest_age)
+
+        assert list(window.values) == samples
+        assert window.total == pytest.approx(sum(samples))
+        assert window.mean == pytest.approx(statistics.mean(samples))
+        assert window.median == pytest.approx(statistics.median(samples))
+        assert window.min == min(samples)
+        assert window.max == max(samples)
+        if len(samples) > 1:
+            assert window.variance == pytest.approx(statistics.variance(samples))
+            assert window.stdev == pytest.approx(statistics.stdev(samples))
+
+
+def test_window_percentiles():
+    """Test percentiles are interpolated between the closest samples."""
+    window = WindowStatistics()
+    for value in (4.0, 1.0, 3.0, 2.0):
+        window.append(value, None)
+
+    assert window.percentile(0) == 1.0
+    assert window.percentile(50) == 2.5
+    assert window.percentile(90) == pytest.approx(3.7)
+    assert window.percentile(100) == 4.0
+
+
+def test_window_compensated_sum():
+    """Test the sum doesn't lose small samples next to large ones."""
+    window = WindowStatistics(4)
+    for value in (1e16, 1.0, -1e16, 1.0):
+        window.append(value, None)
+    assert window.total == 2.0
+
+    # Evicts the first sample
+    window.append(1e16, None)
+    assert window.total == 2.0
+    assert len(window) == 4
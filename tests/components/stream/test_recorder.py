@@ -76,7 +76,7 @@ async def test_recorder_save():
     output.name = "test.mp4"
 
     # Run
-    recorder_save_worker(output, [Segment(1, source, 4)], "mp4")
+    recorder_save_worker(output, [Segment(1, source.getvalue(), 4)], "mp4")
 
     # Assert
     assert output.getvalue()
@@ -113,7 +113,7 @@ async def test_record_stream_audio(hass, hass_client):
                     break
                 last_segment = segment
 
-            result = av.open(last_segment.segment, "r", format="mp4")
+            result = av.open(BytesIO(last_segment.segment), "r", format="mp4")
 
             assert len(result.streams.audio) == expected_audio_streams
             result.close()
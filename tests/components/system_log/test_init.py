@@ -1,5 +1,6 @@
 """Test system log component."""
 import asyncio
+from datetime import timedelta
 import logging
 import queue
 
@@ -8,8 +9,10 @@ import pytest
 from homeassistant.bootstrap import async_setup_component
 from homeassistant.components import system_log
 from homeassistant.core import callback
+import homeassistant.util.dt as dt_util
 
 from tests.async_mock import MagicMock, patch
+from tests.common import async_fire_time_changed
 
 _LOGGER = logging.getLogger("test_logger")
 BASIC_CONFIG = {"system_log": {"max_entries": 2}}
@@ -149,6 +152,12 @@ async def test_error_posted_as_event(hass, simple_queue):
 
     _LOGGER.error("error message")
     await _async_block_until_queue_empty(hass, simple_queue)
+    assert len(events) == 0
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=system_log.LOG_INTERVAL)
+    )
+    await hass.async_block_till_done()
 
     assert len(events) == 1
     assert_log(events[0].data, "", "error message", "ERROR")
@@ -224,6 +233,49 @@ async def test_dedupe_logs(hass, simple_queue, hass_client):
     )
 
 
+async def test_source_cached(hass, simple_queue, hass_client):
+    """Test the source of a log line is only figured out once."""
+    await async_setup_component(hass, system_log.DOMAIN, {})
+    with patch("traceback.extract_stack", return_value=[]) as mock_extract_stack:
+        log_msg()
+        log_msg("2-2")
+        await _async_block_until_queue_empty(hass, simple_queue)
+
+    assert mock_extract_stack.call_count == 1
+    log = (await get_error_log(hass, hass_client, 1))[0]
+    assert log["count"] == 2
+
+
+async def test_rate_limit(hass, simple_queue, hass_client):
+    """Test records of a busy log line are counted without firing events."""
+    await async_setup_component(
+        hass, system_log.DOMAIN, {"system_log": {"fire_event": True}}
+    )
+    events = []
+
+    @callback
+    def event_listener(event):
+        """Listen to events of type system_log_event."""
+        events.append(event)
+
+    hass.bus.async_listen(system_log.EVENT_SYSTEM_LOG, event_listener)
+
+    with patch.object(system_log, "MAX_RECORDS_PER_INTERVAL", 2), patch.object(
+        system_log, "LOG_INTERVAL", 3600
+    ):
+        for nr in range(5):
+            log_msg(nr)
+        await _async_block_until_queue_empty(hass, simple_queue)
+
+        async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=3600))
+        await hass.async_block_till_done()
+
+    assert len(events) == 2
+    log = (await get_error_log(hass, hass_client, 1))[0]
+    assert log["count"] == 5
+    assert log["message"] == [f"error message {nr}" for nr in range(5)]
+
+
 async def test_clear_logs(hass, simple_queue, hass_client):
     """Test that the log can be cleared via a service call."""
     await async_setup_component(hass, system_log.DOMAIN, BASIC_CONFIG)
@@ -1,4 +1,6 @@
 """The tests for the TTS component."""
+import asyncio
+
 import pytest
 import yarl
 
@@ -737,3 +739,159 @@ async def test_tags_with_wave(hass, demo_provider):
     )
 
     assert tagged_data != demo_data
+
+
+async def test_identical_requests_receive_speech_once(hass, demo_provider):
+    """Test identical requests share one request to the provider."""
+    manager = tts.SpeechManager(hass)
+    await manager.async_init_cache(False, "tts", 300, "http://example.local")
+    manager.async_register_engine("demo", demo_provider, {})
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+
+    with patch.object(
+        demo_provider, "get_tts_audio", return_value=("mp3", demo_data)
+    ) as mock_get_tts_audio:
+        urls = await asyncio.gather(
+            *(manager.async_get_url("demo", "Hello") for _ in range(3)),
+            manager.async_get_url("demo", "Goodbye"),
+        )
+
+    assert len(set(urls[:3])) == 1
+    assert urls[3] != urls[0]
+    assert len(mock_get_tts_audio.mock_calls) == 2
+    assert not manager._pending
+
+
+async def test_mem_cache_size_and_expiry(hass):
+    """Test voices are removed from memory by size and when not used."""
+    manager = tts.SpeechManager(hass)
+
+    with patch.object(tts, "MEM_CACHE_MAX_SIZE", 25):
+        manager._async_store_to_memcache("one", "one.mp3", b"1" * 10)
+        manager._async_store_to_memcache("two", "two.mp3", b"2" * 10)
+        manager._async_use_memcache("one")
+        manager._async_store_to_memcache("three", "three.mp3", b"3" * 10)
+
+    assert list(manager.mem_cache) == ["one", "three"]
+    assert manager._mem_cache_size == 20
+
+    now = hass.loop.time()
+    with patch.object(hass.loop, "time", return_value=now + manager.time_memory):
+        manager._async_use_memcache("three")
+
+    with patch.object(hass.loop, "time", return_value=now + manager.time_memory + 1):
+        manager._async_schedule_mem_cleanup()
+
+    assert list(manager.mem_cache) == ["three"]
+    assert manager._mem_cache_size == 10
+    assert manager._mem_cleanup is not None
+    manager._mem_cleanup.cancel()
+
+
+async def test_file_cache_index_is_stored(
+    hass, hass_storage, demo_provider, empty_cache_dir, mock_get_cache_files
+):
+    """Test the file cache is listed from the stored index."""
+    manager = tts.SpeechManager(hass)
+    await manager.async_init_cache(True, "tts", 300, "http://example.local")
+    manager.async_register_engine("demo", demo_provider, {})
+    await manager.async_get_url("demo", "There is someone at the door.")
+    await hass.async_block_till_done()
+
+    assert manager._data_to_save() == {
+        "cache_dir": str(empty_cache_dir),
+        "cache_dir_version": tts._get_cache_dir_version(str(empty_cache_dir)),
+        "files": {
+            "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo": (
+                "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+            )
+        },
+    }
+    assert len(mock_get_cache_files.mock_calls) == 1
+
+    hass_storage[tts.STORAGE_KEY] = {
+        "version": tts.STORAGE_VERSION,
+        "data": manager._data_to_save(),
+    }
+    new_manager = tts.SpeechManager(hass)
+    await new_manager.async_init_cache(True, "tts", 300, "http://example.local")
+
+    assert new_manager.file_cache == manager.file_cache
+    assert len(mock_get_cache_files.mock_calls) == 1
+
+    # The cache dir is listed again when it changed
+    (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    ).unlink()
+    new_manager = tts.SpeechManager(hass)
+    await new_manager.async_init_cache(True, "tts", 300, "http://example.local")
+
+    assert new_manager.file_cache == {}
+    assert len(mock_get_cache_files.mock_calls) == 2
+
+
+async def test_web_view_range_requests(hass, empty_cache_dir, hass_client):
+    """Test parts of voices are served from memory and from the file cache."""
+    calls = async_mock_service(hass, DOMAIN_MP, SERVICE_PLAY_MEDIA)
+    config = {tts.DOMAIN: {"platform": "demo"}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    client = await hass_client()
+    await hass.services.async_call(
+        tts.DOMAIN,
+        "demo_say",
+        {
+            "entity_id": "media_player.something",
+            tts.ATTR_MESSAGE: "There is someone at the door.",
+        },
+        blocking=True,
+    )
+    await hass.async_block_till_done()
+    url = relative_url(calls[0].data[ATTR_MEDIA_CONTENT_ID])
+
+    req = await client.get(url)
+    assert req.status == 200
+    assert req.headers["Accept-Ranges"] == "bytes"
+    data = await req.read()
+
+    req = await client.get(url, headers={"Range": "bytes=10-19"})
+    assert req.status == 206
+    assert req.headers["Content-Range"] == f"bytes 10-19/{len(data)}"
+    assert await req.read() == data[10:20]
+
+    req = await client.get(url, headers={"Range": f"bytes={len(data)}-"})
+    assert req.status == 416
+
+
+async def test_web_view_streams_file_cache(
+    hass, demo_provider, empty_cache_dir, hass_client
+):
+    """Test voices that are only in the file cache are streamed from disk."""
+    _, demo_data = demo_provider.get_tts_audio("bla", "en")
+    cache_file = (
+        empty_cache_dir / "42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+    )
+    cache_file.write_bytes(demo_data)
+
+    config = {tts.DOMAIN: {"platform": "demo", "cache": True}}
+
+    with assert_setup_component(1, tts.DOMAIN):
+        assert await async_setup_component(hass, tts.DOMAIN, config)
+
+    client = await hass_client()
+    url = "/api/tts_proxy/42f18378fd4393d18c8dd11d03fa9563c1e54491_en_-_demo.mp3"
+
+    with patch(
+        "homeassistant.components.tts.SpeechManager.async_file_to_mem"
+    ) as mock_file_to_mem:
+        req = await client.get(url, headers={"Range": "bytes=10-19"})
+        assert req.status == 206
+        assert await req.read() == demo_data[10:20]
+
+    assert not mock_file_to_mem.called
+
+    cache_file.unlink()
+    req = await client.get(url)
+    assert req.status == HTTP_NOT_FOUND
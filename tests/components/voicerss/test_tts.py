@@ -12,7 +12,12 @@ import homeassistant.components.tts as tts
 from homeassistant.config import async_process_ha_core_config
 from homeassistant.setup import setup_component
 
-from tests.common import assert_setup_component, get_test_home_assistant, mock_service
+from tests.common import (
+    assert_setup_component,
+    get_test_home_assistant,
+    mock_service,
+    mock_storage,
+)
 from tests.components.tts.test_init import mutagen_mock  # noqa: F401
 
 
@@ -22,6 +27,8 @@ class TestTTSVoiceRSSPlatform:
     def setup_method(self):
         """Set up things to be run when tests are started."""
         self.hass = get_test_home_assistant()
+        self.mock_storage = mock_storage()
+        self.mock_storage.__enter__()
 
         asyncio.run_coroutine_threadsafe(
             async_process_ha_core_config(
@@ -46,6 +53,7 @@ class TestTTSVoiceRSSPlatform:
             shutil.rmtree(default_tts)
 
         self.hass.stop()
+        self.mock_storage.__exit__(None, None, None)
 
     def test_setup_component(self):
         """Test setup component."""
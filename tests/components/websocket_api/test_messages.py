@@ -4,6 +4,8 @@ from homeassistant.components.websocket_api.messages import (
     _cached_event_message as lru_event_cache,
     cached_event_message,
     message_to_json,
+    result_message,
+    result_message_json,
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import callback
@@ -94,5 +96,12 @@ async def test_message_to_json(caplog):
     assert "Unable to serialize to JSON" in caplog.text
 
 
+def test_result_message_json():
+    """Test a result message with a serialized result."""
+    assert result_message_json(5, '{"a": 1}') == message_to_json(
+        result_message(5, {"a": 1})
+    )
+
+
 class _Unserializeable:
     """A class that cannot be serialized."""
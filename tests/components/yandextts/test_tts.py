@@ -12,7 +12,12 @@ from homeassistant.config import async_process_ha_core_config
 from homeassistant.const import HTTP_FORBIDDEN
 from homeassistant.setup import setup_component
 
-from tests.common import assert_setup_component, get_test_home_assistant, mock_service
+from tests.common import (
+    assert_setup_component,
+    get_test_home_assistant,
+    mock_service,
+    mock_storage,
+)
 from tests.components.tts.test_init import (  # noqa: F401, pylint: disable=unused-import
     mutagen_mock,
 )
@@ -24,6 +29,8 @@ class TestTTSYandexPlatform:
     def setup_method(self):
         """Set up things to be run when tests are started."""
         self.hass = get_test_home_assistant()
+        self.mock_storage = mock_storage()
+        self.mock_storage.__enter__()
         self._base_url = "https://tts.voicetech.yandex.net/generate?"
 
         asyncio.run_coroutine_threadsafe(
@@ -40,6 +47,7 @@ class TestTTSYandexPlatform:
             shutil.rmtree(default_tts)
 
         self.hass.stop()
+        self.mock_storage.__exit__(None, None, None)
 
     def test_setup_component(self):
         """Test setup component."""
@@ -0,0 +1,55 @@
+"""Test ZHA device initialization scheduler."""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.components.zha.core import scheduler
+
+
+def _device(ieee, events, delay=0, fail=False):
+    """Return a device that records its initialization."""
+
+    async def async_initialize(from_cache):
+        assert from_cache is False
+        events.append(ieee)
+        await asyncio.sleep(delay)
+        if fail:
+            raise asyncio.TimeoutError
+
+    device = MagicMock(ieee=ieee)
+    device.async_initialize = async_initialize
+    return device
+
+
+async def test_initialize_in_order():
+    """Test devices are initialized in order and the concurrency grows."""
+    events = []
+    initialized = []
+    init_scheduler = scheduler.DeviceInitScheduler(initialized.append)
+    devices = [_device(ieee, events) for ieee in range(5)]
+
+    await init_scheduler.async_initialize(devices)
+
+    assert events == list(range(5))
+    assert initialized == devices
+    assert init_scheduler.concurrency == scheduler.INITIAL_CONCURRENCY + 5
+
+
+async def test_concurrency_decreases():
+    """Test the concurrency is halved for slow or failing devices."""
+    events = []
+    initialized = []
+    init_scheduler = scheduler.DeviceInitScheduler(initialized.append)
+    init_scheduler.concurrency = 8
+
+    with patch.object(scheduler, "TARGET_LATENCY", 0):
+        await init_scheduler.async_initialize([_device(1, events, delay=0.01)])
+    assert init_scheduler.concurrency == 4
+
+    failing = _device(2, events, fail=True)
+    with pytest.raises(asyncio.TimeoutError):
+        await init_scheduler.async_initialize([failing, _device(3, events)])
+    assert events == [1, 2, 3]
+    assert init_scheduler.concurrency == 3
+    assert failing not in initialized
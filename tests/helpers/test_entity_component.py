@@ -117,6 +117,8 @@ async def test_set_scan_interval_via_config(mock_track, hass):
     )
 
     await hass.async_block_till_done()
+    # Polling starts within the first scan interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
 
@@ -90,6 +90,46 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_skips_entities_still_updating(hass, caplog):
+    """Test a slow entity doesn't hold up the other entities of the platform."""
+    component = EntityComponent(_LOGGER, DOMAIN, hass, timedelta(seconds=20))
+    release = asyncio.Event()
+    fast_updates = []
+
+    async def slow_update():
+        """Mock an update that waits to be released."""
+        await release.wait()
+
+    async def fast_update():
+        """Mock a fast update."""
+        fast_updates.append(None)
+
+    slow_ent = MockEntity(should_poll=True, name="slow")
+    slow_ent.async_update = slow_update
+    fast_ent = MockEntity(should_poll=True, name="fast")
+    fast_ent.async_update = fast_update
+    await component.async_add_entities([slow_ent, fast_ent])
+    fast_updates.clear()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=20))
+    for _ in range(5):
+        await asyncio.sleep(0)
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=40))
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+    assert len(fast_updates) == 2
+    assert "test_domain.slow took longer than the scheduled update" in caplog.text
+
+    release.set()
+    await hass.async_block_till_done()
+
+    stats = component._platforms[DOMAIN].poll_stats
+    assert stats.updates == 3
+    assert stats.overruns == 1
+    assert stats.max_duration >= stats.mean_duration > 0
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -153,6 +193,8 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
     component.setup({DOMAIN: {"platform": "platform"}})
 
     await hass.async_block_till_done()
+    # Polling starts within the first scan interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
 
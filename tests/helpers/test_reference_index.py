@@ -0,0 +1,39 @@
+"""Test the reverse index of references."""
+from homeassistant.helpers.reference_index import (
+    ReferenceIndex,
+    async_get_reference_index,
+)
+
+
+def test_reference_index():
+    """Test setting and removing the references of items."""
+    index = ReferenceIndex()
+
+    index.async_set("automation.one", ["light.kitchen", "light.hall"], ["device-1"])
+    index.async_set("automation.two", ["light.kitchen"])
+
+    assert index.async_items_with_entity("light.kitchen") == [
+        "automation.one",
+        "automation.two",
+    ]
+    assert index.async_items_with_entity("light.hall") == ["automation.one"]
+    assert index.async_items_with_device("device-1") == ["automation.one"]
+    assert index.async_items_with_entity("light.unknown") == []
+
+    # Setting the references again replaces them
+    index.async_set("automation.one", ["light.hall"])
+    assert index.async_items_with_entity("light.kitchen") == ["automation.two"]
+    assert index.async_items_with_device("device-1") == []
+
+    index.async_remove("automation.one")
+    index.async_remove("automation.unknown")
+    assert index.async_items_with_entity("light.hall") == []
+    assert index._by_entity == {"light.kitchen": {"automation.two": None}}
+
+
+async def test_get_reference_index(hass):
+    """Test there is one index per domain."""
+    index = async_get_reference_index(hass, "automation")
+
+    assert async_get_reference_index(hass, "automation") is index
+    assert async_get_reference_index(hass, "script") is not index
@@ -73,6 +73,41 @@ async def test_reload_platform(hass):
     assert not async_get_platform_without_config_entry(hass, PLATFORM, DOMAIN)
 
 
+async def test_reload_platform_unchanged(hass):
+    """Test a platform is not set up again if its config did not change."""
+    setup_called = []
+
+    async def setup_platform(*args):
+        setup_called.append(args)
+
+    mock_integration(hass, MockModule(DOMAIN))
+    mock_integration(hass, MockModule(PLATFORM, dependencies=[DOMAIN]))
+
+    mock_platform = MockPlatform(async_setup_platform=setup_platform)
+    mock_entity_platform(hass, f"{DOMAIN}.{PLATFORM}", mock_platform)
+
+    component = EntityComponent(_LOGGER, DOMAIN, hass)
+
+    yaml_path = path.join(
+        _get_fixtures_base_path(),
+        "fixtures",
+        "helpers/reload_configuration.yaml",
+    )
+    with patch.object(config, "YAML_CONFIG_FILE", yaml_path):
+        await component.async_setup(await async_integration_yaml_config(hass, DOMAIN))
+        await hass.async_block_till_done()
+        assert len(setup_called) == 1
+
+        await async_reload_integration_platforms(hass, PLATFORM, [DOMAIN])
+        assert len(setup_called) == 1
+
+        # A platform that was reset is set up again
+        platform = async_get_platform_without_config_entry(hass, PLATFORM, DOMAIN)
+        await platform.async_reset()
+        await async_reload_integration_platforms(hass, PLATFORM, [DOMAIN])
+        assert len(setup_called) == 2
+
+
 async def test_setup_reload_service(hass):
     """Test setting up a reload service."""
     component_setup = Mock(return_value=True)
@@ -1,16 +1,22 @@
 """Test the translation helper."""
 import asyncio
+from datetime import timedelta
+import json
 from os import path
 import pathlib
 
 import pytest
 
+from homeassistant.components import websocket_api
+from homeassistant.components.frontend import websocket_get_translations
 from homeassistant.generated import config_flows
 from homeassistant.helpers import translation
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component, setup_component
+from homeassistant.util import dt as dt_util
 
 from tests.async_mock import Mock, patch
+from tests.common import async_fire_time_changed
 
 
 @pytest.fixture
@@ -383,3 +389,152 @@ async def test_custom_component_translations(hass):
     hass.config.components.add("test_embedded")
     hass.config.components.add("test_package")
     assert await translation.async_get_translations(hass, "en", "state") == {}
+
+
+async def test_translations_restored_from_storage(hass, hass_storage):
+    """Test translations are persisted and restored without reading files."""
+    hass.config.components.add("sensor")
+    hass.config.components.add("sensor.moon")
+
+    translations = await translation.async_get_translations(hass, "nl", "state")
+    assert "component.sensor.state.moon__phase.first_quarter" in translations
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=translation.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored_en = hass_storage[f"{translation.STORAGE_KEY}.en"]["data"]
+    stored_nl = hass_storage[f"{translation.STORAGE_KEY}.nl"]["data"]
+    assert stored_nl["fingerprints"]["sensor.moon"].startswith(stored_nl["ha_version"])
+    assert "sensor" in stored_en["strings"]
+    assert "sensor.moon" in stored_nl["strings"]
+    # English strings are only stored in their own bundle
+    assert stored_nl["strings"]["sensor"] != stored_en["strings"]["sensor"]
+
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+
+    with patch(
+        "homeassistant.helpers.translation.load_translations_files"
+    ) as mock_load:
+        restored = await translation.async_get_translations(hass, "nl", "state")
+
+    assert not mock_load.called
+    assert restored == translations
+
+
+async def test_translations_not_restored_for_other_version(hass, hass_storage):
+    """Test persisted translations of another version are not used."""
+    hass_storage[f"{translation.STORAGE_KEY}.en"] = {
+        "version": translation.STORAGE_VERSION,
+        "key": f"{translation.STORAGE_KEY}.en",
+        "data": {
+            "ha_version": "0.1",
+            "fingerprints": {"sensor": "0.1"},
+            "strings": {"sensor": {"title": "Stale"}},
+        },
+    }
+    hass.config.components.add("sensor")
+
+    translations = await translation.async_get_translations(hass, "en", "title")
+
+    assert translations["component.sensor.title"] == "Sensor"
+
+
+async def test_translations_not_restored_for_changed_file(hass, hass_storage):
+    """Test persisted translations are not used when the file changed."""
+    hass.config.components.add("sensor")
+    await translation.async_get_translations(hass, "en", "title")
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=translation.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+
+    stored = hass_storage[f"{translation.STORAGE_KEY}.en"]["data"]
+    stored["strings"]["sensor"]["title"] = "Stale"
+    stored["fingerprints"]["sensor"] += "0"
+    hass.data.pop(translation.TRANSLATION_FLATTEN_CACHE)
+
+    translations = await translation.async_get_translations(hass, "en", "title")
+
+    assert translations["component.sensor.title"] == "Sensor"
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"ha_version": translation.__version__},
+        {"ha_version": translation.__version__, "fingerprints": [], "strings": {}},
+        {
+            "ha_version": translation.__version__,
+            "fingerprints": {"sensor": None},
+            "strings": {"sensor": "invalid"},
+        },
+    ],
+)
+async def test_translations_invalid_storage(hass, hass_storage, data):
+    """Test an invalid or truncated bundle is ignored."""
+    hass_storage[f"{translation.STORAGE_KEY}.en"] = {
+        "version": translation.STORAGE_VERSION,
+        "key": f"{translation.STORAGE_KEY}.en",
+        "data": data,
+    }
+    hass.config.components.add("sensor")
+
+    translations = await translation.async_get_translations(hass, "en", "title")
+
+    assert translations["component.sensor.title"] == "Sensor"
+
+
+async def test_translations_json(hass):
+    """Test the serialized translations are cached until components load."""
+    hass.config.components.add("sensor")
+
+    with patch(
+        "homeassistant.helpers.translation.json.dumps", side_effect=json.dumps
+    ) as mock_dumps:
+        translations_json = await translation.async_get_translations_json(
+            hass, "en", "title"
+        )
+        assert (
+            await translation.async_get_translations_json(hass, "en", "title")
+            is translations_json
+        )
+        assert len(mock_dumps.mock_calls) == 1
+
+    assert json.loads(translations_json) == {
+        "resources": await translation.async_get_translations(hass, "en", "title")
+    }
+
+    hass.config.components.add("light")
+    translations = json.loads(
+        await translation.async_get_translations_json(hass, "en", "title")
+    )
+    assert translations["resources"]["component.light.title"] == "Light"
+
+
+async def test_get_translations_websocket_payload(hass, hass_ws_client):
+    """Test the serialized translations sent to the frontend."""
+    hass.config.components.add("sensor")
+    client = await hass_ws_client(hass)
+    websocket_api.async_register_command(hass, websocket_get_translations)
+
+    await client.send_json(
+        {
+            "id": 5,
+            "type": "frontend/get_translations",
+            "language": "nl",
+            "category": "title",
+        }
+    )
+    msg = await client.receive_json()
+
+    assert msg == {
+        "id": 5,
+        "type": "result",
+        "success": True,
+        "result": {
+            "resources": await translation.async_get_translations(hass, "nl", "title")
+        },
+    }
+    assert msg["result"]["resources"]["component.sensor.title"] == "Sensor"
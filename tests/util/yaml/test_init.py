@@ -478,3 +478,215 @@ def test_input():
     """Test loading inputs."""
     data = {"hello": yaml.Input("test_name")}
     assert yaml.parse_yaml(yaml.dump(data)) == data
+
+
+def _write_old_file(path, content):
+    """Write a file with an mtime outside of the racy window."""
+    path.write_text(content)
+    os.utime(path, (1_600_000_000, 1_600_000_000))
+
+
+def _enable_node_cache(config_dir):
+    """Enable the node cache for files below config_dir."""
+    cache_path = str(config_dir / ".storage" / "core.yaml_cache")
+    yaml.clear_node_cache()
+    yaml.load_node_cache(cache_path, str(config_dir))
+    return cache_path
+
+
+def test_node_cache_disabled_without_root(tmp_path):
+    """Test nothing is cached before a root directory is set."""
+    yaml.clear_node_cache()
+    main = tmp_path / "configuration.yaml"
+    _write_old_file(main, "key: value\n")
+
+    assert yaml.load_yaml(str(main)) == {"key": "value"}
+    assert not yaml.is_node_cached(str(main))
+
+
+def test_node_cache_reuses_unchanged_files(tmp_path):
+    """Test unchanged files are not parsed again."""
+    _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    included = tmp_path / "included.yaml"
+    _write_old_file(main, "key: !include included.yaml\n")
+    _write_old_file(included, "- one\n- two\n")
+
+    assert yaml.load_yaml(str(main)) == {"key": ["one", "two"]}
+    assert yaml.is_node_cached(str(main))
+    assert yaml.is_node_cached(str(included))
+
+    with patch.object(yaml_loader, "_compose") as mock_compose:
+        data = yaml.load_yaml(str(main))
+    assert not mock_compose.called
+    assert data == {"key": ["one", "two"]}
+    assert data["key"].__config_file__ == str(main)
+    assert data["key"].__line__ == 0
+
+    _write_old_file(included, "- three\n")
+    os.utime(included, (1_600_000_100, 1_600_000_100))
+    assert yaml.load_yaml(str(main)) == {"key": ["three"]}
+    yaml.clear_node_cache()
+
+
+def test_node_cache_skips_recently_modified_files(tmp_path):
+    """Test files modified within the racy window are not cached."""
+    _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    main.write_text("key: value\n")
+
+    assert yaml.load_yaml(str(main)) == {"key": "value"}
+    assert not yaml.is_node_cached(str(main))
+    yaml.clear_node_cache()
+
+
+def test_node_cache_skips_files_outside_root(tmp_path):
+    """Test only files below the root directory are cached."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    _enable_node_cache(config_dir)
+    outside = tmp_path / "outside.yaml"
+    _write_old_file(outside, "key: value\n")
+
+    assert yaml.load_yaml(str(outside)) == {"key": "value"}
+    assert not yaml.is_node_cached(str(outside))
+    yaml.clear_node_cache()
+
+
+def test_node_cache_resolves_secrets_on_load(tmp_path):
+    """Test secrets are resolved again when the node tree is cached."""
+    _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    secrets = tmp_path / yaml.SECRET_YAML
+    _write_old_file(main, "password: !secret pw\n")
+    secrets.write_text("pw: first\n")
+
+    assert yaml.load_yaml(str(main)) == {"password": "first"}
+
+    yaml.clear_secret_cache()
+    secrets.write_text("pw: second\n")
+    assert yaml.load_yaml(str(main)) == {"password": "second"}
+    yaml.clear_secret_cache()
+    yaml.clear_node_cache()
+
+
+def test_node_cache_never_stores_secrets(tmp_path):
+    """Test the secrets file is neither cached nor persisted."""
+    cache_path = _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    secrets = tmp_path / yaml.SECRET_YAML
+    _write_old_file(main, "password: !secret pw\n")
+    _write_old_file(secrets, "pw: very-secret-value\n")
+
+    assert yaml.load_yaml(str(main)) == {"password": "very-secret-value"}
+    assert yaml.is_node_cached(str(main))
+    assert not yaml.is_node_cached(str(secrets))
+
+    yaml.save_node_cache(cache_path)
+    with open(cache_path, encoding="utf-8") as cache_file:
+        persisted = cache_file.read()
+    assert "very-secret-value" not in persisted
+    assert yaml.SECRET_YAML not in persisted
+    yaml.clear_secret_cache()
+    yaml.clear_node_cache()
+
+
+def test_node_cache_persistence(tmp_path):
+    """Test the node cache round trips through disk."""
+    cache_path = _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    _write_old_file(
+        main,
+        "base: &base\n  a: 1\nmerged:\n  <<: *base\n  b: 2\nempty:\nlist: [1, '2']\n",
+    )
+
+    expected = yaml.load_yaml(str(main))
+    yaml.save_node_cache(cache_path)
+
+    _enable_node_cache(tmp_path)
+    assert yaml.is_node_cached(str(main))
+    with patch.object(yaml_loader, "_compose") as mock_compose:
+        data = yaml.load_yaml(str(main))
+    assert not mock_compose.called
+    assert data == expected
+    assert data["merged"] == {"a": 1, "b": 2}
+    assert data["merged"].__line__ == expected["merged"].__line__ == 3
+    yaml.clear_node_cache()
+
+
+def test_node_cache_merge_keys_do_not_modify_cached_tree(tmp_path):
+    """Test merging a shared anchor leaves the cached node tree untouched."""
+    _enable_node_cache(tmp_path)
+    main = tmp_path / "configuration.yaml"
+    _write_old_file(
+        main,
+        "base: &base\n  a: 1\n"
+        "nested: &nested\n  <<: *base\n  b: 2\n"
+        "first:\n  <<: [*nested, *base]\n  c: 3\n"
+        "second:\n  <<: *nested\n  a: 4\n",
+    )
+    expected = {
+        "base": {"a": 1},
+        "nested": {"a": 1, "b": 2},
+        "first": {"a": 1, "b": 2, "c": 3},
+        "second": {"a": 4, "b": 2},
+    }
+
+    assert yaml.load_yaml(str(main)) == expected
+    with open(main, encoding="utf-8") as conf_file:
+        cached = yaml_loader._compose_file(conf_file)
+    nested = cached.value[1][1]
+    before = [(key.tag, key.value) for key, _ in nested.value]
+
+    assert yaml.load_yaml(str(main)) == expected
+    assert yaml.load_yaml(str(main)) == expected
+    assert [(key.tag, key.value) for key, _ in nested.value] == before
+    assert before[0] == ("tag:yaml.org,2002:merge", "<<")
+    yaml.clear_node_cache()
+
+
+def test_node_cache_drops_removed_files(tmp_path):
+    """Test entries of files that no longer exist are not persisted."""
+    cache_path = _enable_node_cache(tmp_path)
+    included = tmp_path / "included.yaml"
+    _write_old_file(included, "key: value\n")
+
+    yaml.load_yaml(str(included))
+    assert yaml.is_node_cached(str(included))
+    included.unlink()
+    yaml.save_node_cache(cache_path)
+    assert not yaml.is_node_cached(str(included))
+
+    _enable_node_cache(tmp_path)
+    assert not yaml.is_node_cached(str(included))
+    yaml.clear_node_cache()
+
+
+def test_node_cache_persistence_skips_other_files(tmp_path):
+    """Test persisted entries outside the root are not loaded."""
+    config_dir = tmp_path / "config"
+    config_dir.mkdir()
+    outside = tmp_path / "outside.yaml"
+    cache_path = _enable_node_cache(tmp_path)
+    _write_old_file(outside, "key: value\n")
+
+    yaml.load_yaml(str(outside))
+    yaml.save_node_cache(cache_path)
+    yaml.clear_node_cache()
+
+    yaml.load_node_cache(cache_path, str(config_dir))
+    assert not yaml.is_node_cached(str(outside))
+    yaml.clear_node_cache()
+
+
+def test_invalid_node_cache_is_ignored(tmp_path):
+    """Test a corrupt cache file does not break loading."""
+    yaml.clear_node_cache()
+    cache_path = tmp_path / "core.yaml_cache"
+    cache_path.write_text("not json")
+    yaml.load_node_cache(str(cache_path), str(tmp_path))
+
+    main = tmp_path / "configuration.yaml"
+    main.write_text("key: value\n")
+    assert yaml.load_yaml(str(main)) == {"key": "value"}
+    yaml.clear_node_cache()